@@ -0,0 +1,59 @@
+from interpreter.interpreter import Interpreter
+from argparse import ArgumentParser
+import json
+import time
+import sys
+
+
+def build(iterations: int) -> str:
+    return ('int main() {\n'
+            '    int i = 0;\n'
+            '    int total = 0;\n'
+            '    float scale = 1.0;\n'
+            '    bool even = True;\n'
+            f'    while (i < {iterations}) {{\n'
+            '        total = total + i;\n'
+            '        total = total - 1;\n'
+            '        scale = scale * 1.0;\n'
+            '        even = !even;\n'
+            '        i = i + 1;\n'
+            '    }\n'
+            '    return 0;\n'
+            '}\n')
+
+
+def measure(code: str, engine: str, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        interpreter = Interpreter(False, code, optimize=False, engine=engine)
+        start = time.perf_counter()
+        interpreter.run()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(args):
+    parser = ArgumentParser(prog='assignment_benchmark', description='Measure speed of assignment-heavy loop')
+    parser.add_argument('--iterations', type=int, default=20000, help='Number of loop iterations in the program')
+    parser.add_argument('--engine', choices=list(Interpreter.ENGINES), nargs='*', default=list(Interpreter.ENGINES),
+                        help='Engines to measure')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of runs, the fastest one is reported')
+    parser.add_argument('--output', help='Path of JSON file with results')
+    arguments = parser.parse_args(args)
+
+    code = build(arguments.iterations)
+    assignments = 5 * arguments.iterations
+    results = []
+    for engine in arguments.engine:
+        seconds = measure(code, engine, arguments.repeat)
+        results.append({'engine': engine, 'seconds': seconds, 'assignments_per_second': assignments / seconds})
+        print(f'{engine:>8}: {assignments} assignments in {seconds:.2f} s, {assignments / seconds:,.0f} assignments/s')
+
+    if arguments.output:
+        with open(arguments.output, 'w') as file:
+            json.dump({'iterations': arguments.iterations, 'results': results}, file, indent=4)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
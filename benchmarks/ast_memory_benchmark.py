@@ -0,0 +1,58 @@
+from benchmarks.parser_benchmark import TokenListLexer
+from benchmarks.corpus import CORPORA
+from lexer.source import StringSource
+from lexer.lexer import Lexer
+from parser.parser import Parser
+from parser.nodes import Node
+from argparse import ArgumentParser
+from collections import Counter
+import tracemalloc
+import time
+import sys
+
+
+def get_fields(node: Node) -> list:
+    if hasattr(node, '__dict__'):
+        return list(vars(node).values())
+    return [getattr(node, slot) for cls in type(node).__mro__ for slot in getattr(cls, '__slots__', ())]
+
+
+def count_nodes(program: Node) -> Counter:
+    counts = Counter()
+    stack = [program]
+    seen = set()
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            stack.extend(item)
+        elif isinstance(item, Node) and id(item) not in seen:
+            seen.add(id(item))
+            counts[type(item).__name__] += 1
+            stack.extend(field for field in get_fields(item) if isinstance(field, (Node, list)))
+    return counts
+
+
+def main(args):
+    parser = ArgumentParser(prog='ast_memory_benchmark', description='Measure memory used by the syntax tree')
+    parser.add_argument('--size', type=int, default=10 * 2 ** 20, help='Size of generated program in bytes')
+    parser.add_argument('--corpus', choices=list(CORPORA), default='functions', help='Program shape')
+    parser.add_argument('--hash-cons', action='store_true', help='Share identical subtrees while parsing')
+    arguments = parser.parse_args(args)
+
+    lexer = TokenListLexer(Lexer(StringSource(CORPORA[arguments.corpus](arguments.size))))
+    tracemalloc.start()
+    start = time.perf_counter()
+    program = Parser(lexer, hash_cons=arguments.hash_cons).parse_program()
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    counts = count_nodes(program)
+    nodes = sum(counts.values())
+    print(f'{nodes} distinct nodes, {size / 2 ** 20:.1f} MiB, {size / nodes:.1f} bytes/node, built in {elapsed:.2f} s')
+    for name, count in counts.most_common():
+        print(f'{name:>24}: {count}')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
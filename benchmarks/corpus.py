@@ -0,0 +1,70 @@
+def build(header: str, line, footer: str, size: int) -> str:
+    lines = [header]
+    written = len(header)
+    index = 0
+    while written < size:
+        text = line(index)
+        lines.append(text)
+        written += len(text)
+        index += 1
+    lines.append(footer)
+    return ''.join(lines)
+
+
+def identifiers(size: int) -> str:
+    return build('int main()\n{\n', lambda i: (
+        f'    int value_{i} = counter_{i % 31} + offset_{i % 7} * scale_{i % 5};\n'
+    ), '    return 0;\n}\n', size)
+
+
+def long_strings(size: int, length: int = 2000) -> str:
+    text = ('lorem ipsum dolor sit amet \\t consectetur \\"adipiscing\\" elit \\n ' * (length // 60 + 1))[:length]
+    text = text.rstrip('\\')
+    return build('int main()\n{\n', lambda i: (
+        f'    string s{i} = "{text}";\n'
+    ), '    return 0;\n}\n', size)
+
+
+def comments(size: int) -> str:
+    return build('int main()\n{\n', lambda i: (
+        f'    # step {i}: recompute the bounding box of every figure in the scene\n'
+        + (f'    int a{i} = {i};\n' if i % 4 == 0 else '')
+    ), '    return 0;\n}\n', size)
+
+
+def point_cloud(size: int) -> str:
+    return build('int main()\n{\n    List cloud = List();\n', lambda i: (
+        f'    cloud.add(Point({i % 1000}.{i % 97}, {(i * 7) % 1000}.{i % 89}, {(i * 13) % 1000}.{i % 83}));\n'
+    ), '    return 0;\n}\n', size)
+
+
+def nesting(size: int, depth: int = 40) -> str:
+    opening = ''.join(f'{"    " * (level + 1)}if (a < {level} and b != {level})\n{"    " * (level + 1)}{{\n'
+                      for level in range(depth))
+    closing = ''.join(f'{"    " * (level + 1)}}}\n' for level in reversed(range(depth)))
+    body = f'{"    " * (depth + 1)}a = (a + (b * (c - (d / 2))));\n'
+    return build('int main()\n{\n    int a = 0;\n    int b = 1;\n    int c = 2;\n    int d = 3;\n',
+                 lambda i: opening + body + closing, '    return 0;\n}\n', size)
+
+
+def functions(size: int) -> str:
+    return build('', lambda i: (
+        f'int f{i}(int a, float b)\n{{\n'
+        f'    int c = a * 2 + {i};\n'
+        f'    List items = List();\n'
+        f'    while (c > 0 and !(c == 7))\n    {{\n'
+        f'        if (c - 1 < b or c >= 100)\n        {{\n            items.add(Point(c, b, -c));\n        }}\n'
+        f'        else\n        {{\n            print("skip");\n        }}\n'
+        f'        c = c - 1;\n    }}\n'
+        f'    return items.length() + f{max(i - 1, 0)}(c, 1.5);\n}}\n\n'
+    ), 'int main()\n{\n    return f0(10, 2.5);\n}\n', size)
+
+
+CORPORA = {
+    'identifiers': identifiers,
+    'strings': long_strings,
+    'comments': comments,
+    'numbers': point_cloud,
+    'nesting': nesting,
+    'functions': functions,
+}
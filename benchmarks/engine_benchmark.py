@@ -0,0 +1,56 @@
+from interpreter.interpreter import Interpreter
+from argparse import ArgumentParser
+import json
+import time
+import sys
+
+
+def build(iterations: int) -> str:
+    return ('int step(int value) { return value * 3 + 1; }\n'
+            'int main() {\n'
+            '    int i = 0;\n'
+            '    int total = 0;\n'
+            f'    while (i < {iterations}) {{\n'
+            '        total = total + i * 2 - 1;\n'
+            '        if (total > 1000 and i != 7) { total = total - step(i) + step(i) - 1000; }\n'
+            '        i = i + 1;\n'
+            '    }\n'
+            '    return 0;\n'
+            '}\n')
+
+
+def measure(code: str, engine: str, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        interpreter = Interpreter(False, code, optimize=False, engine=engine)
+        start = time.perf_counter()
+        interpreter.run()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(args):
+    parser = ArgumentParser(prog='engine_benchmark', description='Compare speed of interpreter engines')
+    parser.add_argument('--iterations', type=int, default=20000, help='Number of loop iterations in the program')
+    parser.add_argument('--engine', choices=list(Interpreter.ENGINES), nargs='*', default=list(Interpreter.ENGINES),
+                        help='Engines to measure')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of runs, the fastest one is reported')
+    parser.add_argument('--output', help='Path of JSON file with results')
+    arguments = parser.parse_args(args)
+
+    code = build(arguments.iterations)
+    results = []
+    for engine in arguments.engine:
+        seconds = measure(code, engine, arguments.repeat)
+        results.append({'engine': engine, 'seconds': seconds, 'iterations_per_second': arguments.iterations / seconds})
+        print(f'{engine:>8}: {arguments.iterations} iterations in {seconds:.2f} s, '
+              f'{arguments.iterations / seconds:,.0f} iterations/s')
+
+    if arguments.output:
+        with open(arguments.output, 'w') as file:
+            json.dump({'iterations': arguments.iterations, 'results': results}, file, indent=4)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
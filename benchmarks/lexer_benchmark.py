@@ -0,0 +1,87 @@
+from benchmarks.corpus import CORPORA
+from lexer.source import FileSource, StringSource
+from lexer.lexer import Lexer
+from lexer.parallel import ParallelLexer
+from argparse import ArgumentParser
+import platform
+import tempfile
+import json
+import time
+import sys
+import os
+
+
+SOURCES = {
+    'string': lambda text, path: StringSource(text),
+    'file': lambda text, path: FileSource(path),
+}
+
+
+def measure(text: str, path: str, source_name: str, engine: str, repeat: int, workers: int = None) -> dict:
+    best = None
+    for _ in range(repeat):
+        if source_name == 'parallel':
+            lexer = ParallelLexer.from_file(path, workers=workers, engine=engine)
+        else:
+            lexer = Lexer(SOURCES[source_name](text, path), engine)
+        start = time.perf_counter()
+        tokens = lexer.get_all_tokens()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    size = len(text.encode('utf-8'))
+    return {
+        'source': source_name,
+        'engine': engine,
+        'bytes': size,
+        'tokens': len(tokens),
+        'seconds': best,
+        'tokens_per_second': len(tokens) / best,
+        'mb_per_second': size / 2 ** 20 / best,
+    }
+
+
+def main(args):
+    parser = ArgumentParser(prog='lexer_benchmark', description='Measure lexer throughput on synthetic programs')
+    parser.add_argument('--size', type=int, default=2 * 2 ** 20, help='Size of every generated program in bytes')
+    parser.add_argument('--corpus', choices=list(CORPORA), nargs='*', default=list(CORPORA),
+                        help='Program shapes to measure')
+    parser.add_argument('--source', choices=list(SOURCES), nargs='*', default=list(SOURCES),
+                        help='Source classes to measure')
+    parser.add_argument('--engine', choices=Lexer.ENGINES, nargs='*', default=['table'],
+                        help='Lexer engines to measure')
+    parser.add_argument('--workers', type=int, nargs='?', const=0,
+                        help='Also measure ParallelLexer, optionally with the given number of processes')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of runs, the fastest one is reported')
+    parser.add_argument('--output', help='Path of JSON file with results')
+    arguments = parser.parse_args(args)
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for corpus in arguments.corpus:
+            text = CORPORA[corpus](arguments.size)
+            path = os.path.join(directory, f'{corpus}.txt')
+            with open(path, 'w', newline='') as file:
+                file.write(text)
+            source_names = arguments.source + (['parallel'] if arguments.workers is not None else [])
+            for source_name in source_names:
+                for engine in arguments.engine:
+                    result = measure(text, path, source_name, engine, arguments.repeat, arguments.workers or None)
+                    result['corpus'] = corpus
+                    results.append(result)
+                    print(f'{corpus:>12} {source_name:>8} {engine:>6}: {result["tokens"]} tokens in '
+                          f'{result["seconds"]:.2f} s, {result["tokens_per_second"]:,.0f} tokens/s, '
+                          f'{result["mb_per_second"]:.2f} MB/s')
+
+    if arguments.output:
+        report = {
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'size': arguments.size,
+            'results': results,
+        }
+        with open(arguments.output, 'w') as file:
+            json.dump(report, file, indent=4)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
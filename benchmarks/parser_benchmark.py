@@ -0,0 +1,59 @@
+from benchmarks.corpus import CORPORA
+from lexer.tokens import TokenType
+from lexer.source import StringSource
+from lexer.lexer import Lexer
+from parser.parser import Parser
+from argparse import ArgumentParser
+import json
+import time
+import sys
+
+
+class TokenListLexer:
+    def __init__(self, lexer: Lexer) -> None:
+        self.symbols = lexer.symbols
+        self.token_list = [token for token in lexer.get_all_tokens() if token.type != TokenType.COMMENT]
+
+    def tokens(self):
+        yield from self.token_list
+        while True:
+            yield self.token_list[-1]
+
+
+def measure(lexer: TokenListLexer, repeat: int, hash_cons: bool = False) -> float:
+    best = None
+    for _ in range(repeat):
+        parser = Parser(lexer, hash_cons=hash_cons)
+        start = time.perf_counter()
+        parser.parse_program()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(args):
+    parser = ArgumentParser(prog='parser_benchmark', description='Measure parser speed on synthetic programs')
+    parser.add_argument('--size', type=int, default=2 * 2 ** 20, help='Size of every generated program in bytes')
+    parser.add_argument('--corpus', choices=list(CORPORA), nargs='*', default=['functions', 'numbers', 'nesting'],
+                        help='Program shapes to measure')
+    parser.add_argument('--hash-cons', action='store_true', help='Share identical subtrees while parsing')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of runs, the fastest one is reported')
+    parser.add_argument('--output', help='Path of JSON file with results')
+    arguments = parser.parse_args(args)
+
+    results = []
+    for corpus in arguments.corpus:
+        lexer = TokenListLexer(Lexer(StringSource(CORPORA[corpus](arguments.size))))
+        tokens = len(lexer.token_list)
+        seconds = measure(lexer, arguments.repeat, arguments.hash_cons)
+        results.append({'corpus': corpus, 'tokens': tokens, 'seconds': seconds,
+                        'tokens_per_second': tokens / seconds})
+        print(f'{corpus:>12}: {tokens} tokens parsed in {seconds:.2f} s, {tokens / seconds:,.0f} tokens/s')
+
+    if arguments.output:
+        with open(arguments.output, 'w') as file:
+            json.dump({'size': arguments.size, 'results': results}, file, indent=4)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,86 @@
+from lexer.source import FileSource
+from argparse import ArgumentParser
+import tempfile
+import time
+import sys
+import os
+
+
+SCENE_LINE = 'Point p{0} = Point({0}.5, {1}.25, {2}.0);\n'
+
+
+def generate_scene_file(path: str, size: int) -> int:
+    written = 0
+    index = 0
+    with open(path, 'w') as file:
+        file.write('int main()\n{\n')
+        while written < size:
+            line = SCENE_LINE.format(index, index % 97, index % 13)
+            file.write(line)
+            written += len(line)
+            index += 1
+        file.write('return 0;\n}\n')
+    return os.path.getsize(path)
+
+
+class CharacterSource:
+    EOL = ['\n', '\r']
+
+    def __init__(self, path: str) -> None:
+        self.stream = open(path, 'r')
+        self.column = 0
+        self.line = 1
+        self.current_char = self.get_next_char()
+
+    def __del__(self) -> None:
+        self.stream.close()
+
+    def get_current_char(self) -> str:
+        return self.current_char
+
+    def get_next_char(self) -> str:
+        self.current_char = self.stream.read(1)
+        if self.current_char != '':
+            self.column += 1
+        if self.current_char in self.EOL:
+            self.line += 1
+            self.column = 0
+        return self.current_char
+
+
+def read_all_chars(source) -> int:
+    count = 0
+    while source.get_current_char() != '':
+        source.get_next_char()
+        count += 1
+    return count
+
+
+def measure(path: str, source_class=FileSource, **options) -> tuple:
+    source = source_class(path, **options)
+    start = time.perf_counter()
+    count = read_all_chars(source)
+    elapsed = time.perf_counter() - start
+    return count, elapsed
+
+
+def main(args):
+    parser = ArgumentParser(prog='source_benchmark', description='Measure Source reading speed')
+    parser.add_argument('--size', type=int, default=10 * 2 ** 20, help='Size of generated file in bytes')
+    parser.add_argument('--block-size', type=int, nargs='*', default=[],
+                        help='Block sizes to compare with the default one and with reading by read(1)')
+    arguments = parser.parse_args(args)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'scene.txt')
+        size = generate_scene_file(path, arguments.size)
+        print(f'File size: {size} bytes')
+        runs = [('read(1)', {'source_class': CharacterSource}), ('block size default', {})] + \
+            [(f'block size {block_size}', {'block_size': block_size}) for block_size in arguments.block_size]
+        for name, options in runs:
+            count, elapsed = measure(path, **options)
+            print(f'{name:>18}: {count} chars in {elapsed:.2f} s, {count / elapsed:,.0f} chars/s')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,58 @@
+from lexer.tokens import Token, TokenBuffer
+from lexer.source import StringSource
+from lexer.lexer import Lexer
+from argparse import ArgumentParser
+import tracemalloc
+import sys
+
+
+class DictToken:
+    def __init__(self, type, value, pos) -> None:
+        self.type = type
+        self.value = value
+        self.pos = pos
+
+
+def generate_code(tokens: int) -> str:
+    lines = ['int main()\n{\n']
+    for index in range(tokens // 12):
+        lines.append(f'    Point p{index} = Point({index}.5, {index % 97}, 0);\n')
+    lines.append('    return 0;\n}\n')
+    return ''.join(lines)
+
+
+def measure(build) -> tuple:
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return len(result), size
+
+
+def main(args):
+    parser = ArgumentParser(prog='token_memory_benchmark', description='Compare memory used by token representations')
+    parser.add_argument('--tokens', type=int, default=10 ** 6, help='Approximate number of tokens')
+    arguments = parser.parse_args(args)
+
+    buffer = Lexer(StringSource(generate_code(arguments.tokens))).get_token_buffer()
+    fields = [(buffer.TYPES[buffer.types[i]], buffer.values[i], (buffer.columns[i], buffer.lines[i]))
+              for i in range(len(buffer))]
+
+    def copy_buffer():
+        copy = TokenBuffer()
+        for token_type, value, pos in fields:
+            copy.append(Token(token_type, value, pos))
+        return copy
+
+    runs = [
+        ('dict tokens', lambda: [DictToken(t, v, (p[0], p[1])) for t, v, p in fields]),
+        ('slotted tokens', lambda: [Token(t, v, p) for t, v, p in fields]),
+        ('TokenBuffer', copy_buffer),
+    ]
+    for name, build in runs:
+        count, size = measure(build)
+        print(f'{name:>15}: {count} tokens, {size / 2 ** 20:.1f} MiB, {size / count:.1f} bytes/token')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,54 @@
+from interpreter.watch import ProgramWatcher
+from argparse import ArgumentParser
+from statistics import median
+import tempfile
+import time
+import sys
+import os
+
+
+FUNCTION = 'int f{0}(int a)\n{{\n    int b = a * {0} + 1;\n    while (b > 10)\n    {{\n        b = b - 3;\n    }}\n    return b;\n}}\n\n'
+
+
+def generate_functions(count: int) -> str:
+    return ''.join(FUNCTION.format(index) for index in range(count)) + 'int main()\n{\n    return f0(5);\n}\n'
+
+
+def write(path: str, text: str) -> None:
+    with open(path, 'w') as file:
+        file.write(text)
+
+
+def main(args):
+    parser = ArgumentParser(prog='watch_benchmark', description='Measure reload latency of watch mode')
+    parser.add_argument('--functions', type=int, default=10000, help='Number of functions in generated file')
+    parser.add_argument('--edits', type=int, default=20, help='Number of measured single-function edits')
+    arguments = parser.parse_args(args)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'scene.txt')
+        text = generate_functions(arguments.functions)
+        write(path, text)
+        watcher = ProgramWatcher(path)
+        start = time.perf_counter()
+        watcher.load()
+        full = time.perf_counter() - start
+        print(f'{arguments.functions} functions, {len(text)} bytes, full parse in {full * 1000:.1f} ms')
+
+        latencies = []
+        for edit in range(arguments.edits):
+            index = (edit * 7919) % arguments.functions
+            old = f'int b = a * {index} + 1;'
+            text = text.replace(old, f'int b = a * {index} + {edit + 2};', 1)
+            write(path, text)
+            start = time.perf_counter()
+            watcher.load()
+            latencies.append(time.perf_counter() - start)
+            if watcher.reparsed != 1:
+                raise RuntimeError(f'Expected one reparsed function, got {watcher.reparsed}')
+        print(f'reload after editing one function: median {median(latencies) * 1000:.1f} ms, '
+              f'max {max(latencies) * 1000:.1f} ms, {full / median(latencies):.0f}x faster than full parse')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -241,3 +241,24 @@ class InvalidTypeError(Exception):
 
     def __str__(self):
         return self.message
+
+
+class TypeCheckError(Exception):
+    """Exception raised when type checker finds invalid types
+
+    Attributes:
+        column -- column where error occured
+        line -- line where error occured
+        message -- description of error
+    """
+
+    def __init__(self, column, line, message=""):
+        text = f'Error occured in line {line}, column {column}:' if line is not None else 'Error occured:'
+        text += '\nType error: ' + message
+        self.column = column
+        self.line = line
+        self.message = text
+        super().__init__(self.message)
+
+    def __str__(self):
+        return self.message
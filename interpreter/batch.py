@@ -0,0 +1,62 @@
+from interpreter.interpreter import Interpreter
+from interpreter.cache import ProgramCache
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from itertools import repeat
+import glob
+import time
+import io
+import os
+
+
+def initialize_worker() -> None:
+    from mpl_toolkits.mplot3d.art3d import Poly3DCollection  # noqa: F401
+    from matplotlib import pyplot as plt
+    from scipy.spatial import ConvexHull  # noqa: F401
+    plt.switch_backend('Agg')
+
+
+def run_script(path: str, cache: bool = True, optimize: bool = True, engine: str | None = None,
+               resolve: bool = False) -> dict:
+    output = io.StringIO()
+    error = None
+    start = time.perf_counter()
+    try:
+        with redirect_stdout(output):
+            program_cache = ProgramCache.for_file(path) if cache else None
+            return_code = Interpreter(True, path, program_cache, optimize, engine, resolve).run()
+    except Exception as exception:
+        return_code = 1
+        error = f'{type(exception).__name__}: {exception}'
+    return {
+        'script': path,
+        'return_code': return_code,
+        'stdout': output.getvalue(),
+        'error': error,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def collect_scripts(patterns: list[str]) -> list[str]:
+    scripts = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            scripts.extend(sorted(path for path in glob.glob(os.path.join(pattern, '*')) if os.path.isfile(path)))
+        elif any(char in pattern for char in '*?['):
+            scripts.extend(sorted(path for path in glob.glob(pattern) if os.path.isfile(path)))
+        else:
+            scripts.append(pattern)
+    return scripts
+
+
+def run_batch(scripts: list[str], workers: int | None = None, cache: bool = True, optimize: bool = True,
+              engine: str | None = None, resolve: bool = False) -> dict:
+    start = time.perf_counter()
+    with ProcessPoolExecutor(workers, initializer=initialize_worker) as executor:
+        results = list(executor.map(run_script, scripts, repeat(cache), repeat(optimize), repeat(engine),
+                                    repeat(resolve)))
+    return {
+        'workers': workers or os.cpu_count(),
+        'seconds': time.perf_counter() - start,
+        'scripts': results,
+    }
@@ -0,0 +1,338 @@
+from enum import IntEnum
+from array import array
+from interpreter.resolver import Resolver, Scope
+from interpreter.type_registry import get_type_descriptor
+import parser.nodes as nodes
+import sys
+
+
+class Opcode(IntEnum):
+    POP = 0
+    LOAD_CONST = 1
+    UNARY_OP = 2
+    BINARY_OP = 3
+    CHECK_CONDITION = 4
+    JUMP = 5
+    POP_JUMP_IF_FALSE = 6
+    POP_JUMP_IF_TRUE = 7
+    JUMP_IF_RETURNED = 8
+    SET_RETURN = 9
+    CHECK_VARIABLE = 10
+    STORE_VARIABLE = 11
+    DECLARE_VARIABLE = 12
+    CHECK_CALLER = 13
+    CALL_METHOD = 14
+    CHECK_FUNCTION = 15
+    CALL_FUNCTION = 16
+    EVALUATE = 17
+    RETURN = 18
+    LOAD_LOCAL = 19
+    STORE_LOCAL = 20
+    DECLARE_LOCAL = 21
+
+
+class Code:
+    def __init__(self, name: str, function_type: str | None = None, parameters: list | None = None,
+                 local_names: list[str] | None = None) -> None:
+        self.name = name
+        self.function_type = function_type
+        self.parameters = parameters if parameters is not None else []
+        self.parameter_types = [get_type_descriptor(parameter_type) for _, parameter_type, _ in self.parameters]
+        self.return_type = get_type_descriptor(function_type) if function_type is not None else None
+        self.local_names = local_names if local_names is not None else []
+        self.slots = {name: slot for slot, name in enumerate(self.local_names)}
+        self.check_return = True
+        self.instructions = array('i')
+        self.constants = []
+
+
+class Compiler:
+    UNARY_OPERATORS = ('-', '!')
+    BINARY_OPERATORS = ('+', '-', '*', '/', '<', '>', '<=', '>=', '==', '!=', 'and', 'or')
+    LITERAL_NODES = (nodes.IntValue, nodes.FloatValue, nodes.BoolValue)
+    SCALAR_TYPES = (int, float, bool, str, type(None))
+    DEFAULT_VALUES = {'int': 0, 'float': 0.0, 'string': '', 'bool': False}
+    BUILT_IN_FUNCTIONS = frozenset(['print', 'List', 'Collection', 'Polyhedron', 'Line', 'Point'])
+
+    def __init__(self, scopes: dict[nodes.Function, Scope] | None = None, proven: set | None = None) -> None:
+        self.scopes = scopes
+        self.proven = proven if proven is not None else set()
+        self.slots = None
+        self.code = None
+        self.constant_indexes = {}
+        self.unary_operators = {operator: index for index, operator in enumerate(self.UNARY_OPERATORS)}
+        self.binary_operators = {operator: index for index, operator in enumerate(self.BINARY_OPERATORS)}
+        self.expression_compilers = {
+            nodes.Identifier: self.compile_identifier,
+            nodes.BoolValue: self.compile_literal,
+            nodes.IntValue: self.compile_literal,
+            nodes.FloatValue: self.compile_literal,
+            nodes.StringValue: self.compile_literal,
+            nodes.NegationExpression: self.compile_negation_expression,
+            nodes.AdditiveExpression: self.compile_operator_expression,
+            nodes.MultiplicativeExpression: self.compile_operator_expression,
+            nodes.ComparisonExpression: self.compile_operator_expression,
+            nodes.AndExpression: self.compile_logical_expression,
+            nodes.OrExpression: self.compile_logical_expression,
+            nodes.MethodCallExpression: self.compile_method_call_expression,
+            nodes.FunctionCallStatement: self.compile_function_call,
+        }
+        self.statement_compilers = {
+            nodes.AssignmentExpression: self.compile_assignment_expression,
+            nodes.DeclarationStatement: self.compile_declaration_statement,
+            nodes.IfStatement: self.compile_if_statement,
+            nodes.WhileStatement: self.compile_while_statement,
+            nodes.Block: self.compile_block,
+        }
+
+    def compile_program(self, program: nodes.Program) -> list[Code]:
+        return [self.compile_function(function) for function in program.functions]
+
+    def compile_function(self, function: nodes.Function) -> Code:
+        parameters = [(parameter.identifier.name, parameter.type.type, parameter.identifier)
+                      for parameter in function.parameters]
+        scope = self.scopes[function] if self.scopes is not None else None
+        local_names = list(scope.slots) if scope is not None else None
+        code = Code(function.identifier.name, function.function_type.type, parameters, local_names)
+        code.check_return = function not in self.proven
+        self.slots = code.slots if scope is not None else None
+        self.compile_code(code, function.block)
+        self.slots = None
+        return code
+
+    def compile_code(self, code: Code, block: nodes.Block) -> Code:
+        self.code = code
+        self.constant_indexes = {}
+        self.compile_block(block)
+        self.emit(Opcode.RETURN)
+        self.code = None
+        return code
+
+    def emit(self, opcode: Opcode, argument: int = 0) -> int:
+        instructions = self.code.instructions
+        instructions.append(opcode)
+        instructions.append(argument)
+        return len(instructions) - 1
+
+    def patch(self, position: int) -> None:
+        self.code.instructions[position] = len(self.code.instructions)
+
+    def add_constant(self, value) -> int:
+        if not isinstance(value, self.SCALAR_TYPES):
+            self.code.constants.append(value)
+            return len(self.code.constants) - 1
+        key = (type(value), repr(value))
+        index = self.constant_indexes.get(key)
+        if index is None:
+            index = len(self.code.constants)
+            self.code.constants.append(value)
+            self.constant_indexes[key] = index
+        return index
+
+    def get_resolve_flag(self, operand) -> int:
+        return 0 if isinstance(operand, self.LITERAL_NODES) else 1
+
+    def compile_operand(self, operand) -> int:
+        if self.slots is None:
+            self.compile_expression(operand)
+            return self.get_resolve_flag(operand)
+        if isinstance(operand, nodes.Identifier) and operand.name in self.slots:
+            self.emit(Opcode.LOAD_LOCAL, self.slots[operand.name])
+        else:
+            self.compile_expression(operand)
+        return 0
+
+    def compile_evaluate(self, node) -> None:
+        self.emit(Opcode.EVALUATE, self.add_constant(node))
+
+    def compile_expression(self, expression) -> None:
+        compiler = self.expression_compilers.get(type(expression))
+        if compiler is None:
+            self.compile_evaluate(expression)
+        else:
+            compiler(expression)
+
+    def compile_statement(self, statement) -> None:
+        compiler = self.statement_compilers.get(type(statement))
+        if compiler is None:
+            self.compile_expression(statement)
+            self.emit(Opcode.POP)
+        else:
+            compiler(statement)
+
+    def compile_identifier(self, identifier: nodes.Identifier) -> None:
+        self.emit(Opcode.LOAD_CONST, self.add_constant(identifier.name))
+
+    def compile_literal(self, literal) -> None:
+        self.emit(Opcode.LOAD_CONST, self.add_constant(literal.value))
+
+    def compile_negation_expression(self, negation_expression: nodes.NegationExpression) -> None:
+        operator = self.unary_operators.get(negation_expression.operator)
+        if operator is None:
+            return self.compile_evaluate(negation_expression)
+        flag = self.compile_operand(negation_expression.expression)
+        self.emit(Opcode.UNARY_OP, operator << 1 | flag)
+
+    def compile_binary_expression(self, operator: int | None, expression) -> None:
+        if operator is None:
+            return self.compile_evaluate(expression)
+        flags = self.compile_operand(expression.left)
+        flags |= self.compile_operand(expression.right) << 1
+        self.emit(Opcode.BINARY_OP, operator << 2 | flags)
+
+    def compile_operator_expression(self, expression) -> None:
+        self.compile_binary_expression(self.binary_operators.get(expression.operator), expression)
+
+    def compile_logical_expression(self, expression) -> None:
+        operator = 'and' if isinstance(expression, nodes.AndExpression) else 'or'
+        self.compile_binary_expression(self.binary_operators[operator], expression)
+
+    def compile_method_call_expression(self, method_call_expression: nodes.MethodCallExpression) -> None:
+        if not all(isinstance(method.name, nodes.Identifier) for method in method_call_expression.methods):
+            return self.compile_evaluate(method_call_expression)
+        caller = method_call_expression.caller
+        if self.slots is not None and isinstance(caller, nodes.Identifier) and caller.name in self.slots:
+            self.emit(Opcode.LOAD_LOCAL, self.slots[caller.name])
+        else:
+            self.compile_expression(caller)
+            self.emit(Opcode.CHECK_CALLER)
+        for method in method_call_expression.methods:
+            for argument in method.arguments:
+                self.compile_operand(argument)
+            self.emit(Opcode.CALL_METHOD, self.add_constant((method.name.name, len(method.arguments))))
+
+    def compile_function_call(self, function_call_statement: nodes.FunctionCallStatement) -> None:
+        identifier = function_call_statement.identifier
+        if identifier in self.BUILT_IN_FUNCTIONS:
+            name = identifier
+        elif isinstance(identifier, nodes.Identifier):
+            name = identifier.name
+            self.emit(Opcode.CHECK_FUNCTION, self.add_constant(identifier))
+        else:
+            return self.compile_evaluate(function_call_statement)
+        for argument in function_call_statement.arguments:
+            if name in Resolver.UNRESOLVED_CALLS:
+                self.compile_expression(argument)
+            else:
+                self.compile_operand(argument)
+        check = function_call_statement not in self.proven
+        self.emit(Opcode.CALL_FUNCTION, self.add_constant((name, len(function_call_statement.arguments))) << 1 | check)
+
+    def compile_assignment_expression(self, assignment_expression: nodes.AssignmentExpression) -> None:
+        if not isinstance(assignment_expression.identifier, nodes.Identifier):
+            self.compile_evaluate(assignment_expression)
+            self.emit(Opcode.POP)
+            return
+        if self.slots is not None:
+            self.compile_expression(assignment_expression.expression)
+            check = assignment_expression not in self.proven
+            self.emit(Opcode.STORE_LOCAL, self.slots[assignment_expression.identifier.name] << 1 | check)
+            return
+        name = self.add_constant(assignment_expression.identifier.name)
+        self.emit(Opcode.CHECK_VARIABLE, name)
+        self.compile_expression(assignment_expression.expression)
+        self.emit(Opcode.STORE_VARIABLE, name)
+
+    def compile_declaration_statement(self, declaration: nodes.DeclarationStatement) -> None:
+        variable_type = declaration.variable_type.type
+        if declaration.expression:
+            self.compile_expression(declaration.expression)
+        elif variable_type in self.DEFAULT_VALUES:
+            self.emit(Opcode.LOAD_CONST, self.add_constant(self.DEFAULT_VALUES[variable_type]))
+        else:
+            self.compile_evaluate(declaration)
+            self.emit(Opcode.POP)
+            return
+        if self.slots is not None:
+            slot = self.slots[declaration.identifier.name]
+            self.emit(Opcode.DECLARE_LOCAL, self.add_constant((slot, get_type_descriptor(variable_type))))
+        else:
+            self.emit(Opcode.DECLARE_VARIABLE, self.add_constant((declaration.identifier.name, variable_type)))
+
+    def compile_if_statement(self, if_statement: nodes.IfStatement) -> None:
+        self.compile_expression(if_statement.condition)
+        if if_statement not in self.proven:
+            self.emit(Opcode.CHECK_CONDITION)
+        else_jump = self.emit(Opcode.POP_JUMP_IF_FALSE)
+        self.compile_statement(if_statement.block)
+        if if_statement.else_block:
+            end_jump = self.emit(Opcode.JUMP)
+            self.patch(else_jump)
+            self.compile_statement(if_statement.else_block)
+            self.patch(end_jump)
+        else:
+            self.patch(else_jump)
+
+    def compile_while_statement(self, while_statement: nodes.WhileStatement) -> None:
+        self.compile_expression(while_statement.condition)
+        if while_statement not in self.proven:
+            self.emit(Opcode.CHECK_CONDITION)
+        end_jump = self.emit(Opcode.POP_JUMP_IF_FALSE)
+        loop = len(self.code.instructions)
+        self.compile_statement(while_statement.block)
+        self.compile_expression(while_statement.condition)
+        self.emit(Opcode.POP_JUMP_IF_TRUE, loop)
+        self.patch(end_jump)
+
+    def compile_block(self, block: nodes.Block) -> None:
+        exit_jumps = []
+        for statement in block.statements:
+            exit_jumps.append(self.emit(Opcode.JUMP_IF_RETURNED))
+            if isinstance(statement, nodes.ReturnStatement):
+                self.compile_return_value(statement)
+                self.emit(Opcode.SET_RETURN)
+                exit_jumps.append(self.emit(Opcode.JUMP_IF_RETURNED))
+                self.compile_return_value(statement)
+                self.emit(Opcode.POP)
+            else:
+                self.compile_statement(statement)
+        for position in exit_jumps:
+            self.patch(position)
+
+    def compile_return_value(self, return_statement: nodes.ReturnStatement) -> None:
+        if return_statement.expression is None:
+            self.compile_evaluate(return_statement)
+        else:
+            self.compile_expression(return_statement.expression)
+
+
+def format_argument(code: Code, opcode: Opcode, argument: int) -> str:
+    if opcode == Opcode.UNARY_OP:
+        resolved = ' operand' if argument & 1 else ''
+        return f'{argument:<6} ({Compiler.UNARY_OPERATORS[argument >> 1]}{resolved})'
+    if opcode == Opcode.BINARY_OP:
+        resolved = ''.join(f' {side}' for flag, side in ((1, 'left'), (2, 'right')) if argument & flag)
+        return f'{argument:<6} ({Compiler.BINARY_OPERATORS[argument >> 2]}{resolved})'
+    if opcode == Opcode.LOAD_LOCAL:
+        return f'{argument:<6} ({code.local_names[argument]})'
+    if opcode == Opcode.STORE_LOCAL:
+        checked = ' checked' if argument & 1 else ''
+        return f'{argument:<6} ({code.local_names[argument >> 1]}{checked})'
+    if opcode == Opcode.CALL_FUNCTION:
+        name, count = code.constants[argument >> 1]
+        checked = ' checked' if argument & 1 else ''
+        return f'{argument:<6} ({name!r}, {count}{checked})'
+    if opcode == Opcode.DECLARE_LOCAL:
+        slot, variable_type = code.constants[argument]
+        return f'{argument:<6} ({variable_type.name} {code.local_names[slot]})'
+    if opcode in (Opcode.JUMP, Opcode.POP_JUMP_IF_FALSE, Opcode.POP_JUMP_IF_TRUE, Opcode.JUMP_IF_RETURNED):
+        return f'{argument:<6} (to {argument})'
+    if opcode in (Opcode.LOAD_CONST, Opcode.CHECK_VARIABLE, Opcode.STORE_VARIABLE, Opcode.DECLARE_VARIABLE,
+                  Opcode.CALL_METHOD, Opcode.CHECK_FUNCTION, Opcode.CALL_FUNCTION, Opcode.EVALUATE):
+        constant = code.constants[argument]
+        if isinstance(constant, nodes.Identifier):
+            constant = constant.name
+        elif isinstance(constant, nodes.Node) or constant is None and opcode == Opcode.EVALUATE:
+            constant = type(constant).__name__
+        return f'{argument:<6} ({constant!r})'
+    return ''
+
+
+def disassemble(code: Code, file=sys.stdout) -> None:
+    parameters = ', '.join(f'{parameter_type} {name}' for name, parameter_type, _ in code.parameters)
+    file.write(f'Code {code.function_type or ""} {code.name}({parameters}):\n')
+    instructions = code.instructions
+    for position in range(0, len(instructions), 2):
+        opcode = Opcode(instructions[position])
+        argument = format_argument(code, opcode, instructions[position + 1])
+        file.write(f'{position:>6} {opcode.name:<18} {argument}'.rstrip() + '\n')
@@ -0,0 +1,66 @@
+from parser.nodes import Program
+import hashlib
+import pickle
+import shutil
+import sys
+import os
+
+
+class ProgramCache:
+    DIRECTORY = '__tkcache__'
+    SUFFIX = '.pickle'
+    CHUNK_SIZE = 2 ** 16
+    VERSION_MODULES = ['lexer/lexer.py', 'lexer/tokens.py', 'parser/parser.py', 'parser/nodes.py']
+    version = None
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+    @classmethod
+    def for_file(cls, path: str) -> 'ProgramCache':
+        return cls(os.path.join(os.path.dirname(os.path.abspath(path)), cls.DIRECTORY))
+
+    @classmethod
+    def get_version(cls) -> bytes:
+        if cls.version is None:
+            root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            digest = hashlib.sha256(sys.implementation.cache_tag.encode())
+            for module in cls.VERSION_MODULES:
+                with open(os.path.join(root, module), 'rb') as file:
+                    digest.update(file.read())
+            cls.version = digest.digest()
+        return cls.version
+
+    def get_key(self, file) -> str:
+        digest = hashlib.sha256(self.get_version())
+        for chunk in iter(lambda: file.read(self.CHUNK_SIZE), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    def get_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def load(self, key: str) -> Program | None:
+        try:
+            with open(self.get_path(key), 'rb') as file:
+                program = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        return program if isinstance(program, Program) else None
+
+    def store(self, key: str, program: Program) -> None:
+        path = self.get_path(key)
+        temporary_path = f'{path}.{os.getpid()}'
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temporary_path, 'wb') as file:
+                pickle.dump(program, file, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, path)
+        except (OSError, RecursionError, pickle.PicklingError):
+            pass
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,351 @@
+from interpreter.context import ContextManager
+from interpreter.resolver import Resolver
+import parser.nodes as nodes
+import errors.errors as e
+import operator
+
+
+class TypeChecker:
+    SAMPLES = {'int': 1, 'float': 1.0, 'bool': True, 'string': 'a', 'void': None}
+    TYPE_NAMES = {int: 'int', float: 'float', bool: 'bool', str: 'string', type(None): 'void'}
+    UNARY_OPERATIONS = {'-': operator.neg, '!': operator.not_}
+    BINARY_OPERATIONS = {
+        '+': operator.add,
+        '-': operator.sub,
+        '*': operator.mul,
+        '/': operator.truediv,
+        '<': operator.lt,
+        '>': operator.gt,
+        '<=': operator.le,
+        '>=': operator.ge,
+        '==': operator.eq,
+        '!=': operator.ne,
+    }
+    DEFAULT_TYPES = frozenset(['int', 'float', 'string', 'bool'])
+    CONSTRUCTORS = {
+        'Point': (['number'] * 3, 'Point'),
+        'Line': (['Point'] * 2, 'Line'),
+        'Polyhedron': (None, 'Line'),
+        'Collection': (None, 'Polyhedron'),
+    }
+    METHODS = {
+        'List': {'add': ([None], 'void'), 'remove': (None, None), 'get': (['int'], None), 'length': ([], 'int')},
+        'Point': {'get_x': ([], None), 'get_y': ([], None), 'get_z': ([], None), 'set_x': (['number'], 'void'),
+                  'set_y': (['number'], 'void'), 'set_z': (['number'], 'void')},
+        'Line': {'get_start': ([], 'Point'), 'get_end': ([], 'Point'), 'set_start': (['Point'], 'void'),
+                 'set_end': (['Point'], 'void'), 'length': ([], 'float')},
+        'Polyhedron': {'points': ([], 'List'), 'lines': ([], 'List')},
+        'Collection': {'add': (['Polyhedron'], 'void'), 'remove': (['Polyhedron'], 'void'),
+                       'display': ([], 'void'), 'empty': ([], 'void')},
+    }
+
+    def __init__(self, positions: dict | None = None) -> None:
+        self.positions = positions if positions is not None else {}
+        self.position = None
+        self.errors = []
+        self.proven = set()
+        self.functions = {}
+        self.function = None
+        self.types = {}
+        self.trusted = set()
+        self.declared = set()
+        self.untrusted_reads = 0
+        self.statement_checkers = {
+            nodes.DeclarationStatement: self.check_declaration_statement,
+            nodes.AssignmentExpression: self.check_assignment_expression,
+            nodes.IfStatement: self.check_if_statement,
+            nodes.WhileStatement: self.check_while_statement,
+            nodes.ReturnStatement: self.check_return_statement,
+            nodes.Block: self.check_block,
+        }
+        self.expression_checkers = {
+            nodes.Identifier: lambda identifier: 'string',
+            nodes.BoolValue: lambda literal: 'bool',
+            nodes.IntValue: lambda literal: 'int',
+            nodes.FloatValue: lambda literal: 'float',
+            nodes.StringValue: lambda literal: 'string',
+            nodes.NegationExpression: self.check_negation_expression,
+            nodes.AdditiveExpression: self.check_operator_expression,
+            nodes.MultiplicativeExpression: self.check_operator_expression,
+            nodes.ComparisonExpression: self.check_operator_expression,
+            nodes.AndExpression: self.check_logical_expression,
+            nodes.OrExpression: self.check_logical_expression,
+            nodes.MethodCallExpression: self.check_method_call_expression,
+            nodes.FunctionCallStatement: self.check_function_call,
+        }
+
+    def check(self, program: nodes.Program) -> list[e.TypeCheckError]:
+        main_function = None
+        for function in program.functions:
+            self.position = self.positions.get(id(function))
+            name = function.identifier.name
+            if name == 'main' and function.function_type.type == 'int' and not function.parameters:
+                if main_function is not None:
+                    self.report(f'Function \'{name}\' is already defined')
+                main_function = function
+            elif name == 'print' or name in self.functions:
+                self.report(f'Function \'{name}\' is already defined')
+            self.functions.setdefault(name, function)
+        if main_function is None:
+            self.position = None
+            self.report('Function \'int main()\' is not defined')
+        for function in program.functions:
+            self.check_function(function)
+        return self.errors
+
+    def report(self, message: str) -> None:
+        column, line = self.position if self.position is not None else (None, None)
+        self.errors.append(e.TypeCheckError(column, line, message))
+
+    def check_function(self, function: nodes.Function) -> None:
+        self.function = function
+        self.position = self.positions.get(id(function))
+        self.types = {}
+        self.trusted = set()
+        self.declared = set()
+        for parameter in function.parameters:
+            name = parameter.identifier.name
+            self.types[name] = parameter.type.type
+            self.trusted.add(name)
+            self.declared.add(name)
+        proven = self.check_block(function.block)
+        self.position = self.positions.get(id(function))
+        function_type = function.function_type.type
+        if function_type != 'void' and not self.is_returning(function.block):
+            self.report(f'Function \'{function.identifier.name}\' does not return \'{function_type}\' on every path')
+        elif proven:
+            self.proven.add(function)
+
+    def is_returning(self, statement) -> bool:
+        if isinstance(statement, nodes.ReturnStatement):
+            return True
+        if isinstance(statement, nodes.Block):
+            return any(self.is_returning(child) for child in statement.statements)
+        if isinstance(statement, nodes.IfStatement) and statement.else_block:
+            return self.is_returning(statement.block) and self.is_returning(statement.else_block)
+        return False
+
+    def check_statement(self, statement) -> bool:
+        position = self.positions.get(id(statement))
+        if position is not None:
+            self.position = position
+        checker = self.statement_checkers.get(type(statement))
+        if checker is not None:
+            return checker(statement)
+        self.check_expression(statement)
+        return True
+
+    def check_block(self, block: nodes.Block) -> bool:
+        proven = True
+        for statement in block.statements:
+            proven = self.check_statement(statement) and proven
+        return proven
+
+    def check_branch(self, block: nodes.Block) -> bool:
+        declared = set(self.declared)
+        proven = self.check_statement(block)
+        self.declared = declared
+        return proven
+
+    def check_expression(self, expression) -> str | None:
+        checker = self.expression_checkers.get(type(expression))
+        if checker is None:
+            return None
+        return checker(expression)
+
+    def check_operand(self, operand) -> str | None:
+        if not isinstance(operand, nodes.Identifier):
+            return self.check_expression(operand)
+        name = operand.name
+        if name not in self.types:
+            self.report(f'Variable \'{name}\' is not declared')
+            return None
+        if name not in self.trusted:
+            self.untrusted_reads += 1
+        return self.types[name]
+
+    def check_proven(self, expression, operand: bool = False) -> tuple[str | None, bool]:
+        untrusted_reads = self.untrusted_reads
+        errors = len(self.errors)
+        value_type = self.check_operand(expression) if operand else self.check_expression(expression)
+        proven = value_type is not None and untrusted_reads == self.untrusted_reads and errors == len(self.errors)
+        return value_type, proven
+
+    def get_result_type(self, operation, *operand_types) -> str | None:
+        if None in operand_types:
+            return 'bool' if operation in (operator.eq, operator.ne, operator.not_) else None
+        if any(operand_type not in self.SAMPLES for operand_type in operand_types):
+            if operation in (operator.eq, operator.ne, operator.not_):
+                return 'bool'
+            self.report(f'Operation is not supported for types {", ".join(map(repr, operand_types))}')
+            return None
+        try:
+            result = operation(*(self.SAMPLES[operand_type] for operand_type in operand_types))
+        except TypeError:
+            self.report(f'Operation is not supported for types {", ".join(map(repr, operand_types))}')
+            return None
+        return self.TYPE_NAMES[type(result)]
+
+    def check_negation_expression(self, negation_expression: nodes.NegationExpression) -> str | None:
+        operand_type = self.check_operand(negation_expression.expression)
+        operation = self.UNARY_OPERATIONS.get(negation_expression.operator)
+        if operation is None:
+            return None
+        return self.get_result_type(operation, operand_type)
+
+    def check_operator_expression(self, expression) -> str | None:
+        left = self.check_operand(expression.left)
+        right = self.check_operand(expression.right)
+        operation = self.BINARY_OPERATIONS.get(expression.operator)
+        if operation is None:
+            return None
+        return self.get_result_type(operation, left, right)
+
+    def check_logical_expression(self, expression) -> str | None:
+        left = self.check_operand(expression.left)
+        right = self.check_operand(expression.right)
+        return left if left == right else None
+
+    def is_matching(self, expected: str | None, actual: str | None) -> bool:
+        if expected is None or actual is None:
+            return True
+        if expected == 'number':
+            return actual in ('int', 'float')
+        return expected == actual
+
+    def check_arguments(self, name: str, parameters: list | None, arguments: list, operand: bool = True) -> bool:
+        proven = True
+        argument_types = []
+        for argument in arguments:
+            argument_type, argument_proven = self.check_proven(argument, operand)
+            argument_types.append(argument_type)
+            proven = proven and argument_proven
+        if parameters is None:
+            return proven
+        if len(parameters) != len(arguments):
+            self.report(f'\'{name}\' expects {len(parameters)} arguments, got {len(arguments)}')
+            return False
+        for index, (parameter_type, argument_type) in enumerate(zip(parameters, argument_types)):
+            if not self.is_matching(parameter_type, argument_type):
+                self.report(f'Argument {index + 1} of \'{name}\' must be \'{parameter_type}\', got \'{argument_type}\'')
+                proven = False
+        return proven
+
+    def check_method_call_expression(self, method_call_expression: nodes.MethodCallExpression) -> str | None:
+        caller = method_call_expression.caller
+        if not isinstance(caller, nodes.Identifier):
+            self.check_expression(caller)
+            self.report('Methods can only be called on variables')
+            return None
+        caller_type = self.check_operand(caller)
+        for method in method_call_expression.methods:
+            method_name = method.name.name
+            if caller_type is None:
+                self.check_arguments(method_name, None, method.arguments)
+                continue
+            if method_name not in ContextManager.BUILT_IN.get(caller_type, []):
+                self.report(f'Type \'{caller_type}\' has no method \'{method_name}\'')
+                self.check_arguments(method_name, None, method.arguments)
+                caller_type = None
+                continue
+            parameters, caller_type = self.METHODS[caller_type][method_name]
+            self.check_arguments(method_name, parameters, method.arguments)
+        return caller_type
+
+    def check_function_call(self, function_call_statement: nodes.FunctionCallStatement) -> str | None:
+        identifier = function_call_statement.identifier
+        arguments = function_call_statement.arguments
+        if isinstance(identifier, nodes.Identifier) and identifier.name == 'print':
+            identifier = identifier.name
+        if identifier == 'print':
+            self.check_arguments(identifier, [None], arguments)
+            return 'void'
+        if identifier in Resolver.UNRESOLVED_CALLS:
+            self.check_arguments(identifier, None, arguments, False)
+            return identifier
+        if identifier in self.CONSTRUCTORS:
+            parameters, element_type = self.CONSTRUCTORS[identifier]
+            if parameters is None:
+                parameters = [element_type] * len(arguments)
+                if identifier == 'Polyhedron' and not arguments:
+                    self.report('\'Polyhedron\' expects at least 1 argument, got 0')
+            self.check_arguments(identifier, parameters, arguments)
+            return identifier
+        if not isinstance(identifier, nodes.Identifier):
+            return None
+        function = self.functions.get(identifier.name)
+        if function is None:
+            self.report(f'Function \'{identifier.name}\' is not defined')
+            self.check_arguments(identifier.name, None, arguments)
+            return None
+        parameters = [parameter.type.type for parameter in function.parameters]
+        if self.check_arguments(identifier.name, parameters, arguments):
+            self.proven.add(function_call_statement)
+        return function.function_type.type
+
+    def check_declaration_statement(self, declaration: nodes.DeclarationStatement) -> bool:
+        name = declaration.identifier.name
+        variable_type = declaration.variable_type.type
+        if declaration.expression:
+            value_type, proven = self.check_proven(declaration.expression)
+            if not self.is_matching(variable_type, value_type):
+                self.report(f'Variable \'{name}\' of type \'{variable_type}\' cannot be initialized with '
+                            f'\'{value_type}\'')
+        elif variable_type in self.DEFAULT_TYPES:
+            proven = True
+        else:
+            self.report(f'Variable \'{name}\' of type \'{variable_type}\' must be initialized')
+            proven = False
+        if name in self.declared:
+            self.report(f'Variable \'{name}\' is already declared')
+        if name in self.types and self.types[name] != variable_type:
+            variable_type = None
+        if proven and variable_type is not None and (name not in self.types or name in self.trusted):
+            self.trusted.add(name)
+        else:
+            self.trusted.discard(name)
+        self.types[name] = variable_type
+        self.declared.add(name)
+        return True
+
+    def check_assignment_expression(self, assignment_expression: nodes.AssignmentExpression) -> bool:
+        name = assignment_expression.identifier.name
+        value_type, proven = self.check_proven(assignment_expression.expression)
+        variable_type = self.types.get(name)
+        if name not in self.types:
+            self.report(f'Variable \'{name}\' is not declared')
+        elif not self.is_matching(variable_type, value_type):
+            self.report(f'Variable \'{name}\' of type \'{variable_type}\' cannot be assigned \'{value_type}\'')
+        elif proven and variable_type == value_type:
+            self.proven.add(assignment_expression)
+        return True
+
+    def check_condition(self, statement) -> None:
+        condition_type, proven = self.check_proven(statement.condition)
+        if condition_type is not None and condition_type != 'bool':
+            self.report(f'Condition must be \'bool\', got \'{condition_type}\'')
+        elif proven:
+            self.proven.add(statement)
+
+    def check_if_statement(self, if_statement: nodes.IfStatement) -> bool:
+        self.check_condition(if_statement)
+        proven = self.check_branch(if_statement.block)
+        if if_statement.else_block:
+            proven = self.check_branch(if_statement.else_block) and proven
+        return proven
+
+    def check_while_statement(self, while_statement: nodes.WhileStatement) -> bool:
+        self.check_condition(while_statement)
+        return self.check_branch(while_statement.block)
+
+    def check_return_statement(self, return_statement: nodes.ReturnStatement) -> bool:
+        function_type = self.function.function_type.type
+        if self.function.identifier.name == 'main':
+            value_type, proven = self.check_proven(return_statement.expression, True)
+        else:
+            value_type, proven = self.check_proven(return_statement.expression)
+        if not self.is_matching(function_type, value_type):
+            self.report(f'Function \'{self.function.identifier.name}\' must return \'{function_type}\', '
+                        f'got \'{value_type}\'')
+            return False
+        return proven and value_type == function_type
@@ -1,8 +1,4 @@
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
-from matplotlib import pyplot as plt
 import errors.errors as e
-import numpy as np
-from scipy.spatial import ConvexHull
 from math import sqrt
 import random
 
@@ -139,6 +135,10 @@ class Collection:
         self.polyhedrons = []
 
     def display(self):
+        from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+        from matplotlib import pyplot as plt
+        from scipy.spatial import ConvexHull
+        import numpy as np
         fig = plt.figure("Collection")
         ax = fig.add_subplot(111, projection='3d')
         for polyhedron in self.polyhedrons:
@@ -0,0 +1,316 @@
+from interpreter.visitor import Visitor
+from interpreter.type_registry import get_type_descriptor
+import parser.nodes as nodes
+import errors.errors as e
+import operator
+
+
+class ClosureEngine(Visitor):
+    LITERAL_NODES = (nodes.IntValue, nodes.FloatValue, nodes.BoolValue)
+    NAME_NODES = (nodes.Identifier, nodes.StringValue)
+    SPECIAL_FUNCTIONS = frozenset(['print', 'List', 'Collection', 'Polyhedron', 'Line', 'Point', 'main'])
+    DEFAULT_VALUES = {'int': 0, 'float': 0.0, 'string': '', 'bool': False}
+    OPERATIONS = {
+        '+': operator.add,
+        '-': operator.sub,
+        '*': operator.mul,
+        '/': operator.truediv,
+        '<': operator.lt,
+        '>': operator.gt,
+        '<=': operator.le,
+        '>=': operator.ge,
+        '==': operator.eq,
+        '!=': operator.ne,
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.blocks = {}
+        self.functions = {}
+        self.compilers = {
+            nodes.Identifier: self.compile_identifier,
+            nodes.BoolValue: self.compile_literal,
+            nodes.IntValue: self.compile_literal,
+            nodes.FloatValue: self.compile_literal,
+            nodes.StringValue: self.compile_literal,
+            nodes.NegationExpression: self.compile_negation_expression,
+            nodes.AdditiveExpression: self.compile_operator_expression,
+            nodes.MultiplicativeExpression: self.compile_operator_expression,
+            nodes.ComparisonExpression: self.compile_operator_expression,
+            nodes.AndExpression: self.compile_and_expression,
+            nodes.OrExpression: self.compile_or_expression,
+            nodes.MethodCallExpression: self.compile_method_call_expression,
+            nodes.FunctionCallStatement: self.compile_function_call,
+            nodes.AssignmentExpression: self.compile_assignment_expression,
+            nodes.DeclarationStatement: self.compile_declaration_statement,
+            nodes.ReturnStatement: self.compile_return_statement,
+            nodes.IfStatement: self.compile_if_statement,
+            nodes.WhileStatement: self.compile_while_statement,
+            nodes.Block: self.compile_block,
+        }
+
+    def execute_body(self, function: nodes.Function):
+        code = self.blocks.get(function.block)
+        if code is None:
+            code = self.compile_block(function.block)
+            self.blocks[function.block] = code
+        return code()
+
+    def execute_function(self, function_name: str, arguments: list):
+        if function_name in self.SPECIAL_FUNCTIONS:
+            return super().execute_function(function_name, arguments)
+        code = self.functions.get(function_name)
+        if code is None:
+            try:
+                function = self.context_manager.get_function(function_name)
+            except e.UndeclaredVariableError:
+                return super().execute_function(function_name, arguments)
+            code = self.compile_function(function)
+            self.functions[function_name] = code
+        return code(arguments)
+
+    def compile(self, node):
+        compiler = self.compilers.get(type(node))
+        if compiler is None:
+            return lambda: node.accept(self)
+        return compiler(node)
+
+    def compile_operand(self, node):
+        if isinstance(node, self.LITERAL_NODES):
+            return self.compile_literal(node)
+        context_manager = self.context_manager
+        if isinstance(node, self.NAME_NODES):
+            name = node.name if isinstance(node, nodes.Identifier) else node.value
+
+            def variable():
+                context = context_manager.current_context
+                while context:
+                    variable = context.variables.get(name)
+                    if variable is not None:
+                        return variable[0]
+                    context = context.parent
+                return name
+            return variable
+        code = self.compile(node)
+        get_variable = self.context_manager.find_variable
+
+        def operand():
+            value = code()
+            if isinstance(value, str):
+                variable = get_variable(value)
+                if variable is not None:
+                    return variable[0]
+            return value
+        return operand
+
+    def compile_binary(self, operation, left: nodes.Node, right: nodes.Node):
+        if isinstance(right, self.LITERAL_NODES):
+            left_operand = self.compile_operand(left)
+            right_value = right.value
+            return lambda: operation(left_operand(), right_value)
+        if isinstance(left, self.LITERAL_NODES):
+            left_value = left.value
+            right_operand = self.compile_operand(right)
+            return lambda: operation(left_value, right_operand())
+        left_operand = self.compile_operand(left)
+        right_operand = self.compile_operand(right)
+        return lambda: operation(left_operand(), right_operand())
+
+    def compile_value(self, value):
+        return lambda: value
+
+    def compile_identifier(self, identifier: nodes.Identifier):
+        return self.compile_value(identifier.name)
+
+    def compile_literal(self, literal):
+        return self.compile_value(literal.value)
+
+    def compile_negation_expression(self, negation_expression: nodes.NegationExpression):
+        operand = self.compile_operand(negation_expression.expression)
+        if negation_expression.operator == '-':
+            return lambda: -operand()
+        if negation_expression.operator == '!':
+            return lambda: not operand()
+        return lambda: negation_expression.accept(self)
+
+    def compile_operator_expression(self, expression):
+        operation = self.OPERATIONS.get(expression.operator)
+        if operation is None:
+            return lambda: expression.accept(self)
+        return self.compile_binary(operation, expression.left, expression.right)
+
+    def compile_and_expression(self, and_expression: nodes.AndExpression):
+        return self.compile_binary(lambda left, right: left and right, and_expression.left, and_expression.right)
+
+    def compile_or_expression(self, or_expression: nodes.OrExpression):
+        return self.compile_binary(lambda left, right: left or right, or_expression.left, or_expression.right)
+
+    def compile_arguments(self, arguments: list) -> list:
+        return [self.compile(argument) for argument in arguments]
+
+    def compile_method_call_expression(self, method_call_expression: nodes.MethodCallExpression):
+        if not all(isinstance(method.name, nodes.Identifier) for method in method_call_expression.methods):
+            return lambda: method_call_expression.accept(self)
+        caller_code = self.compile(method_call_expression.caller)
+        methods = [(method.name.name, self.compile_arguments(method.arguments))
+                   for method in method_call_expression.methods]
+        get_variable = self.context_manager.find_variable
+        execute_method = self.execute_method
+
+        def method_call():
+            caller = caller_code()
+            if not isinstance(caller, str) or get_variable(caller) is None:
+                raise e.UndeclaredVariableError(caller)
+            for name, arguments in methods:
+                caller = execute_method(caller, name, [argument() for argument in arguments])
+            return caller
+        return method_call
+
+    def compile_function_call(self, function_call_statement: nodes.FunctionCallStatement):
+        identifier = function_call_statement.identifier
+        arguments = self.compile_arguments(function_call_statement.arguments)
+        execute_function = self.execute_function
+        if identifier in self.context_manager.BUILT_IN or identifier == 'print':
+            return lambda: execute_function(identifier, [argument() for argument in arguments])
+        if not isinstance(identifier, nodes.Identifier):
+            return lambda: function_call_statement.accept(self)
+        name = identifier.name
+        is_function_exists = self.context_manager.is_function_exists
+
+        def function_call():
+            if not is_function_exists(name):
+                raise e.UndeclaredFunctionError(identifier)
+            return execute_function(name, [argument() for argument in arguments])
+        return function_call
+
+    def compile_assignment_expression(self, assignment_expression: nodes.AssignmentExpression):
+        if not isinstance(assignment_expression.identifier, nodes.Identifier):
+            return lambda: assignment_expression.accept(self)
+        name = assignment_expression.identifier.name
+        code = self.compile(assignment_expression.expression)
+        context_manager = self.context_manager
+        get_variable = self.context_manager.find_variable
+
+        def assignment():
+            variable = get_variable(name)
+            if variable is None:
+                raise e.UndeclaredVariableError(name)
+            value = code()
+            variable_type = variable[1]
+            if get_type_descriptor(variable_type).check(value):
+                context_manager.current_context.variables[name] = (value, variable_type)
+            else:
+                raise e.TypeMismatchError(name)
+        return assignment
+
+    def compile_declaration_statement(self, declaration: nodes.DeclarationStatement):
+        variable_type = declaration.variable_type.type
+        if not declaration.expression and variable_type not in self.DEFAULT_VALUES:
+            return lambda: declaration.accept(self)
+        name = declaration.identifier.name
+        if declaration.expression:
+            code = self.compile(declaration.expression)
+        else:
+            code = self.compile_value(self.DEFAULT_VALUES[variable_type])
+        context_manager = self.context_manager
+
+        def declaration_statement():
+            value = code()
+            variables = context_manager.current_context.variables
+            if name in variables:
+                raise e.RedefinitionError(name)
+            variables[name] = (value, variable_type)
+        return declaration_statement
+
+    def compile_return_statement(self, return_statement: nodes.ReturnStatement):
+        if return_statement.expression is None:
+            return lambda: return_statement.accept(self)
+        return self.compile(return_statement.expression)
+
+    def compile_condition(self, condition):
+        code = self.compile(condition)
+
+        def condition_value():
+            value = code()
+            if not isinstance(value, bool):
+                raise e.InvalidConditionError(value)
+            return value
+        return condition_value
+
+    def compile_if_statement(self, if_statement: nodes.IfStatement):
+        condition = self.compile_condition(if_statement.condition)
+        block = self.compile(if_statement.block)
+        if not if_statement.else_block:
+            def if_without_else():
+                if condition():
+                    block()
+            return if_without_else
+        else_block = self.compile(if_statement.else_block)
+
+        def if_with_else():
+            if condition():
+                block()
+            else:
+                else_block()
+        return if_with_else
+
+    def compile_while_statement(self, while_statement: nodes.WhileStatement):
+        first_condition = self.compile_condition(while_statement.condition)
+        condition = self.compile(while_statement.condition)
+        block = self.compile(while_statement.block)
+
+        def while_loop():
+            if first_condition():
+                block()
+                while condition():
+                    block()
+        return while_loop
+
+    def compile_block(self, block: nodes.Block):
+        statements = [(isinstance(statement, nodes.ReturnStatement), self.compile(statement))
+                      for statement in block.statements]
+        context_manager = self.context_manager
+
+        def block_statements():
+            for is_return, statement in statements:
+                return_value = context_manager.current_context.return_value
+                if return_value is not None:
+                    return return_value
+                if is_return:
+                    context_manager.current_context.return_value = statement()
+                return_value = context_manager.current_context.return_value
+                if return_value is not None:
+                    return return_value
+                statement()
+            return context_manager.current_context.return_value
+        return block_statements
+
+    def compile_function(self, function: nodes.Function):
+        function_name = function.identifier.name
+        function_type = function.function_type.type
+        parameters = [(parameter.identifier.name, parameter.type.type, get_type_descriptor(parameter.type.type),
+                       parameter.identifier) for parameter in function.parameters]
+        return_type = get_type_descriptor(function_type)
+        context_manager = self.context_manager
+        execute_body = self.execute_body
+        get_variable = self.context_manager.find_variable
+
+        def function_call(arguments: list):
+            context_manager.enter_context(function_name)
+            if len(parameters) != len(arguments):
+                raise e.InvalidNumberOfArgumentsError(function_name)
+            variables = context_manager.current_context.variables
+            for (name, parameter_type, descriptor, identifier), value in zip(parameters, arguments):
+                if isinstance(value, str):
+                    variable = get_variable(value)
+                    if variable is not None:
+                        value = variable[0]
+                if not descriptor.check(value):
+                    raise e.TypeMismatchError(identifier)
+                variables[name] = (value, parameter_type)
+            return_value = execute_body(function)
+            if not return_type.check(return_value):
+                raise e.InvalidReturnTypeError(function_type, return_value)
+            context_manager.exit_context()
+            return return_value
+        return function_call
@@ -56,6 +56,15 @@ class ContextManager:
     def add_variable(self, name: str, value, type):
         self.current_context.add_variable(name, value, type)
 
+    def find_variable(self, name: str):
+        context = self.current_context
+        while context:
+            variable = context.variables.get(name)
+            if variable is not None:
+                return variable
+            context = context.parent
+        return None
+
     def get_variable_value(self, name: str):
         return self.current_context.get_variable(name)[0]
 
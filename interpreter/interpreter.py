@@ -1,18 +1,56 @@
 from lexer.lexer import Lexer
-from lexer.source import FileSource, StringSource
+from lexer.source import create_file_source, StringSource
 from parser.parser import Parser
+from parser.nodes import Program
 from interpreter.visitor import Visitor
+from interpreter.closure import ClosureEngine
+from interpreter.vm import VirtualMachine
+from interpreter.cache import ProgramCache
+from interpreter.optimizer import Optimizer
 
 
 class Interpreter:
-    def __init__(self, file: bool, source: str):
+    ENGINES = {'visitor': Visitor, 'closure': ClosureEngine, 'bytecode': VirtualMachine}
+    ENGINE = 'visitor'
+
+    def __init__(self, file: bool, source: str, cache: ProgramCache | None = None, optimize: bool = True,
+                 engine: str | None = None, resolve: bool = False):
+        self.visitor = self.create_engine(engine, resolve)
+        self.cache = cache
+        self.optimize = optimize
+        self.cache_key = None
         if file:
-            self.lexer = Lexer(FileSource(source))
+            if cache is not None and source != '-':
+                with open(source, 'rb') as stream:
+                    self.cache_key = cache.get_key(stream)
+            self.lexer = Lexer(create_file_source(source))
         else:
             self.lexer = Lexer(StringSource(source))
-        self.parser = Parser(self.lexer)
-        self.visitor = Visitor()
+        self.parser = Parser(self.lexer, hash_cons=self.cache_key is not None)
 
-    def run(self):
+    @classmethod
+    def create_engine(cls, engine: str | None = None, resolve: bool = False) -> Visitor:
+        engine = engine or ('bytecode' if resolve else cls.ENGINE)
+        if engine not in cls.ENGINES:
+            raise ValueError(f'Unknown interpreter engine \'{engine}\'')
+        if resolve:
+            if engine != 'bytecode':
+                raise ValueError(f'Variable resolution is not supported by \'{engine}\' engine')
+            return VirtualMachine(resolve_variables=True)
+        return cls.ENGINES[engine]()
+
+    def parse(self) -> Program:
+        if self.cache_key is not None:
+            program = self.cache.load(self.cache_key)
+            if program is not None:
+                return program
         program = self.parser.parse_program()
+        if self.cache_key is not None:
+            self.cache.store(self.cache_key, program)
+        return program
+
+    def run(self):
+        program = self.parse()
+        if self.optimize:
+            program = Optimizer().optimize(program)
         return program.accept(self.visitor)
@@ -0,0 +1,159 @@
+import parser.nodes as nodes
+import operator
+
+
+class Optimizer:
+    LITERAL_NODES = {int: nodes.IntValue, float: nodes.FloatValue, bool: nodes.BoolValue}
+    FOLDABLE_NODES = (nodes.IntValue, nodes.FloatValue, nodes.BoolValue)
+    NOT_NONE_NODES = (nodes.IntValue, nodes.FloatValue, nodes.BoolValue, nodes.StringValue, nodes.Identifier,
+                      nodes.AdditiveExpression, nodes.MultiplicativeExpression, nodes.ComparisonExpression,
+                      nodes.NegationExpression)
+    OPERATIONS = {
+        '+': operator.add,
+        '-': operator.sub,
+        '*': operator.mul,
+        '/': operator.truediv,
+        '<': operator.lt,
+        '>': operator.gt,
+        '<=': operator.le,
+        '>=': operator.ge,
+        '==': operator.eq,
+        '!=': operator.ne,
+        'and': lambda left, right: left and right,
+        'or': lambda left, right: left or right,
+    }
+    UNARY_OPERATIONS = {
+        '-': operator.neg,
+        '!': operator.not_,
+    }
+
+    def optimize(self, program: nodes.Program) -> nodes.Program:
+        return program.accept(self)
+
+    def fold(self, function, *operands) -> nodes.Node | None:
+        if not all(isinstance(operand, self.FOLDABLE_NODES) for operand in operands):
+            return None
+        try:
+            value = function(*(operand.value for operand in operands))
+        except ArithmeticError:
+            return None
+        return self.LITERAL_NODES[type(value)](value)
+
+    def visit_expression(self, expression):
+        if expression is None:
+            return None
+        return expression.accept(self)
+
+    def visit_identifier(self, identifier: nodes.Identifier):
+        return identifier
+
+    def visit_bool_value(self, bool_value: nodes.BoolValue):
+        return bool_value
+
+    def visit_int_value(self, int_value: nodes.IntValue):
+        return int_value
+
+    def visit_float_value(self, float_value: nodes.FloatValue):
+        return float_value
+
+    def visit_string_value(self, string_value: nodes.StringValue):
+        return string_value
+
+    def visit_negation_expression(self, negation_expression: nodes.NegationExpression):
+        expression = self.visit_expression(negation_expression.expression)
+        folded = self.fold(self.UNARY_OPERATIONS[negation_expression.operator], expression)
+        if folded is not None:
+            return folded
+        if expression is negation_expression.expression:
+            return negation_expression
+        return nodes.NegationExpression(negation_expression.operator, expression)
+
+    def visit_binary_expression(self, expression, operator: str, build):
+        left = self.visit_expression(expression.left)
+        right = self.visit_expression(expression.right)
+        folded = self.fold(self.OPERATIONS[operator], left, right)
+        if folded is not None:
+            return folded
+        if left is expression.left and right is expression.right:
+            return expression
+        return build(left, right)
+
+    def visit_additive_expression(self, additive_expression: nodes.AdditiveExpression):
+        operator = additive_expression.operator
+        return self.visit_binary_expression(additive_expression, operator,
+                                            lambda left, right: nodes.AdditiveExpression(left, operator, right))
+
+    def visit_multiplicative_expression(self, multiplicative_expression: nodes.MultiplicativeExpression):
+        operator = multiplicative_expression.operator
+        return self.visit_binary_expression(multiplicative_expression, operator,
+                                            lambda left, right: nodes.MultiplicativeExpression(left, operator, right))
+
+    def visit_comparison_expression(self, comparison_expression: nodes.ComparisonExpression):
+        operator = comparison_expression.operator
+        return self.visit_binary_expression(comparison_expression, operator,
+                                            lambda left, right: nodes.ComparisonExpression(left, operator, right))
+
+    def visit_and_expression(self, and_expression: nodes.AndExpression):
+        return self.visit_binary_expression(and_expression, 'and', nodes.AndExpression)
+
+    def visit_or_expression(self, or_expression: nodes.OrExpression):
+        return self.visit_binary_expression(or_expression, 'or', nodes.OrExpression)
+
+    def visit_method_call_expression(self, method_call_expression: nodes.MethodCallExpression):
+        caller = self.visit_expression(method_call_expression.caller)
+        methods = [nodes.MethodCall(method.name, [self.visit_expression(argument) for argument in method.arguments])
+                   for method in method_call_expression.methods]
+        return nodes.MethodCallExpression(caller, methods)
+
+    def visit_function_call(self, function_call_statement: nodes.FunctionCallStatement):
+        arguments = [self.visit_expression(argument) for argument in function_call_statement.arguments]
+        return nodes.FunctionCallStatement(function_call_statement.identifier, arguments)
+
+    def visit_assignment_expression(self, assignment_expression: nodes.AssignmentExpression):
+        expression = self.visit_expression(assignment_expression.expression)
+        return nodes.AssignmentExpression(assignment_expression.identifier, expression)
+
+    def visit_declaration_statement(self, declaration: nodes.DeclarationStatement):
+        expression = self.visit_expression(declaration.expression)
+        return nodes.DeclarationStatement(declaration.variable_type, declaration.identifier, expression)
+
+    def visit_return_statement(self, return_statement: nodes.ReturnStatement):
+        return nodes.ReturnStatement(self.visit_expression(return_statement.expression))
+
+    def visit_if_statement(self, if_statement: nodes.IfStatement):
+        condition = self.visit_expression(if_statement.condition)
+        if isinstance(condition, nodes.BoolValue):
+            if condition.value:
+                return if_statement.block.accept(self)
+            if if_statement.else_block:
+                return if_statement.else_block.accept(self)
+            return None
+        else_block = if_statement.else_block.accept(self) if if_statement.else_block else if_statement.else_block
+        return nodes.IfStatement(condition, if_statement.block.accept(self), else_block)
+
+    def visit_while_statement(self, while_statement: nodes.WhileStatement):
+        condition = self.visit_expression(while_statement.condition)
+        if isinstance(condition, nodes.BoolValue) and not condition.value:
+            return None
+        return nodes.WhileStatement(condition, while_statement.block.accept(self))
+
+    def visit_block(self, block: nodes.Block):
+        statements = []
+        for statement in block.statements:
+            if statement is None:
+                statements.append(statement)
+                continue
+            statement = statement.accept(self)
+            if statement is not None:
+                statements.append(statement)
+            if (isinstance(statement, nodes.ReturnStatement) and
+                    isinstance(statement.expression, self.NOT_NONE_NODES)):
+                break
+        return nodes.Block(statements)
+
+    def visit_function(self, function: nodes.Function):
+        return nodes.Function(function.function_type, function.identifier, function.parameters,
+                              function.block.accept(self))
+
+    def visit_program(self, program: nodes.Program):
+        return nodes.Program([function.accept(self) for function in program.functions], program.symbols)
@@ -0,0 +1,115 @@
+import parser.nodes as nodes
+import errors.errors as e
+
+
+class Scope:
+    def __init__(self) -> None:
+        self.slots = {}
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def declare(self, name: str) -> int:
+        slot = self.slots.get(name)
+        if slot is None:
+            slot = len(self.slots)
+            self.slots[name] = slot
+        return slot
+
+
+class Resolver:
+    UNRESOLVED_CALLS = frozenset(['List'])
+
+    def __init__(self) -> None:
+        self.scope = None
+        self.statement_resolvers = {
+            nodes.DeclarationStatement: self.resolve_declaration_statement,
+            nodes.AssignmentExpression: self.resolve_assignment_expression,
+            nodes.IfStatement: self.resolve_if_statement,
+            nodes.WhileStatement: self.resolve_while_statement,
+            nodes.ReturnStatement: self.resolve_return_statement,
+            nodes.Block: self.resolve_block,
+        }
+        self.expression_resolvers = {
+            nodes.Identifier: self.resolve_identifier,
+            nodes.NegationExpression: self.resolve_negation_expression,
+            nodes.AdditiveExpression: self.resolve_binary_expression,
+            nodes.MultiplicativeExpression: self.resolve_binary_expression,
+            nodes.ComparisonExpression: self.resolve_binary_expression,
+            nodes.AndExpression: self.resolve_binary_expression,
+            nodes.OrExpression: self.resolve_binary_expression,
+            nodes.MethodCallExpression: self.resolve_method_call_expression,
+            nodes.FunctionCallStatement: self.resolve_function_call,
+        }
+
+    def resolve(self, program: nodes.Program) -> dict[nodes.Function, Scope]:
+        return {function: self.resolve_function(function) for function in program.functions}
+
+    def resolve_function(self, function: nodes.Function) -> Scope:
+        self.scope = Scope()
+        for parameter in function.parameters:
+            self.scope.declare(parameter.identifier.name)
+        self.resolve_block(function.block)
+        scope, self.scope = self.scope, None
+        return scope
+
+    def resolve_statement(self, statement) -> None:
+        resolver = self.statement_resolvers.get(type(statement))
+        if resolver is not None:
+            resolver(statement)
+        else:
+            self.resolve_expression(statement, False)
+
+    def resolve_expression(self, expression, used: bool = True) -> None:
+        resolver = self.expression_resolvers.get(type(expression))
+        if resolver is not None:
+            resolver(expression, used)
+
+    def resolve_identifier(self, identifier: nodes.Identifier, used: bool) -> None:
+        if used and identifier.name not in self.scope.slots:
+            raise e.UndeclaredVariableError(identifier.name)
+
+    def resolve_negation_expression(self, negation_expression: nodes.NegationExpression, used: bool) -> None:
+        self.resolve_expression(negation_expression.expression)
+
+    def resolve_binary_expression(self, expression, used: bool) -> None:
+        self.resolve_expression(expression.left)
+        self.resolve_expression(expression.right)
+
+    def resolve_method_call_expression(self, method_call_expression: nodes.MethodCallExpression, used: bool) -> None:
+        self.resolve_expression(method_call_expression.caller)
+        for method in method_call_expression.methods:
+            for argument in method.arguments:
+                self.resolve_expression(argument)
+
+    def resolve_function_call(self, function_call_statement: nodes.FunctionCallStatement, used: bool) -> None:
+        identifier = function_call_statement.identifier
+        name = identifier.name if isinstance(identifier, nodes.Identifier) else identifier
+        for argument in function_call_statement.arguments:
+            self.resolve_expression(argument, name not in self.UNRESOLVED_CALLS)
+
+    def resolve_declaration_statement(self, declaration: nodes.DeclarationStatement) -> None:
+        if declaration.expression:
+            self.resolve_expression(declaration.expression, False)
+        self.scope.declare(declaration.identifier.name)
+
+    def resolve_assignment_expression(self, assignment_expression: nodes.AssignmentExpression) -> None:
+        self.resolve_identifier(assignment_expression.identifier, True)
+        self.resolve_expression(assignment_expression.expression, False)
+
+    def resolve_if_statement(self, if_statement: nodes.IfStatement) -> None:
+        self.resolve_expression(if_statement.condition, False)
+        self.resolve_statement(if_statement.block)
+        if if_statement.else_block:
+            self.resolve_statement(if_statement.else_block)
+
+    def resolve_while_statement(self, while_statement: nodes.WhileStatement) -> None:
+        self.resolve_expression(while_statement.condition, False)
+        self.resolve_statement(while_statement.block)
+
+    def resolve_return_statement(self, return_statement: nodes.ReturnStatement) -> None:
+        self.resolve_expression(return_statement.expression, False)
+
+    def resolve_block(self, block: nodes.Block) -> None:
+        for statement in block.statements:
+            self.resolve_statement(statement)
@@ -0,0 +1,39 @@
+import errors.errors as e
+
+
+class TypeDescriptor:
+    def __init__(self, name: str, check) -> None:
+        self.name = name
+        self.check = check
+
+    def __repr__(self) -> str:
+        return f'TypeDescriptor({self.name!r})'
+
+
+def exact_type(python_type: type):
+    return lambda value: type(value) is python_type
+
+
+def class_name(name: str):
+    return lambda value: type(value).__name__ == name
+
+
+TYPES = {descriptor.name: descriptor for descriptor in [
+    TypeDescriptor('int', exact_type(int)),
+    TypeDescriptor('float', exact_type(float)),
+    TypeDescriptor('bool', exact_type(bool)),
+    TypeDescriptor('string', exact_type(str)),
+    TypeDescriptor('List', class_name('List')),
+    TypeDescriptor('Point', class_name('Point')),
+    TypeDescriptor('Line', class_name('Line')),
+    TypeDescriptor('Polyhedron', class_name('Polyhedron')),
+    TypeDescriptor('Collection', class_name('Collection')),
+    TypeDescriptor('void', lambda value: value is None),
+]}
+
+
+def get_type_descriptor(type_name: str) -> TypeDescriptor:
+    descriptor = TYPES.get(type_name)
+    if descriptor is None:
+        raise e.InvalidTypeError(f'Unknown type \'{type_name}\'')
+    return descriptor
@@ -1,4 +1,5 @@
 from interpreter.context import ContextManager
+from interpreter.type_registry import get_type_descriptor
 import interpreter.classes as c
 import parser.nodes as nodes
 import errors.errors as e
@@ -127,7 +128,7 @@ class Visitor:
         if not self.is_variable(identifier):
             raise e.UndeclaredVariableError(identifier)
         new_value = assignment_expression.expression.accept(self)
-        if eval(self.context_manager.get_variable_type(identifier)) == type(new_value):
+        if get_type_descriptor(self.context_manager.get_variable_type(identifier)).check(new_value):
             self.context_manager.set_variable_value(identifier, new_value)
         else:
             raise e.TypeMismatchError(identifier)
@@ -198,7 +199,7 @@ class Visitor:
 
     def visit_function(self, function: nodes.Function):
         if function.block.statements:
-            function.block.accept(self)
+            self.execute_body(function)
 
     def visit_program(self, program: nodes.Program):
         main_function = None
@@ -223,6 +224,9 @@ class Visitor:
             return_value = self.execute_function(main_function.identifier.name, [])
         return return_value
 
+    def execute_body(self, function: nodes.Function):
+        return function.block.accept(self)
+
     def execute_print(self, arguments):
         if len(arguments) != 1:
             raise e.InvalidNumberOfArgumentsError('print')
@@ -330,12 +334,10 @@ class Visitor:
             return self.create_point(arguments)
         elif function_name == 'main':
             function = self.context_manager.get_function(function_name)
-            return_value = function.block.accept(self)
+            return_value = self.execute_body(function)
             if self.context_manager.is_variable_exists(return_value):
                 return_value = self.context_manager.get_variable_value(return_value)
-            if function.function_type.type == 'void' and return_value is not None:
-                raise e.InvalidReturnTypeError(function.function_type.type, return_value)
-            elif eval(function.function_type.type) != type(return_value):
+            if not get_type_descriptor(function.function_type.type).check(return_value):
                 raise e.InvalidReturnTypeError(function.function_type.type, return_value)
             self.context_manager.exit_context()
             return return_value
@@ -352,17 +354,11 @@ class Visitor:
                     value = self.context_manager.get_variable_value(argument)
                 else:
                     value = argument
-                if eval(parameter_type) != type(value):
+                if not get_type_descriptor(parameter_type).check(value):
                     raise e.TypeMismatchError(parameter.identifier)
                 self.context_manager.add_variable(name, value, parameter_type)
-            return_value = function.block.accept(self)
-            if function_type == 'void':
-                if return_value is not None:
-                    raise e.InvalidReturnTypeError(function_type, return_value)
-            elif function_type in self.context_manager.BUILT_IN.keys():
-                if not return_value.__class__.__name__ == function_type:
-                    raise e.InvalidReturnTypeError(function_type, return_value)
-            elif eval(function_type) != type(return_value):
+            return_value = self.execute_body(function)
+            if not get_type_descriptor(function_type).check(return_value):
                 raise e.InvalidReturnTypeError(function_type, return_value)
             self.context_manager.exit_context()
             return return_value
@@ -0,0 +1,243 @@
+from interpreter.visitor import Visitor
+from interpreter.bytecode import Opcode, Code, Compiler
+from interpreter.resolver import Resolver
+from interpreter.checker import TypeChecker
+from interpreter.type_registry import get_type_descriptor
+import parser.nodes as nodes
+import errors.errors as e
+import operator
+
+
+(POP, LOAD_CONST, UNARY_OP, BINARY_OP, CHECK_CONDITION, JUMP, POP_JUMP_IF_FALSE, POP_JUMP_IF_TRUE, JUMP_IF_RETURNED,
+ SET_RETURN, CHECK_VARIABLE, STORE_VARIABLE, DECLARE_VARIABLE, CHECK_CALLER, CALL_METHOD, CHECK_FUNCTION, CALL_FUNCTION,
+ EVALUATE, RETURN, LOAD_LOCAL, STORE_LOCAL, DECLARE_LOCAL) = (opcode.value for opcode in Opcode)
+
+
+class VirtualMachine(Visitor):
+    MAX_DEPTH = 1000
+    UNARY_OPERATIONS = (operator.neg, operator.not_)
+    BINARY_OPERATIONS = (
+        operator.add,
+        operator.sub,
+        operator.mul,
+        operator.truediv,
+        operator.lt,
+        operator.gt,
+        operator.le,
+        operator.ge,
+        operator.eq,
+        operator.ne,
+        lambda left, right: left and right,
+        lambda left, right: left or right,
+    )
+    SPECIAL_FUNCTIONS = frozenset(['print', 'List', 'Collection', 'Polyhedron', 'Line', 'Point', 'main'])
+
+    def __init__(self, resolve_variables: bool = False):
+        super().__init__()
+        self.resolve_variables = resolve_variables
+        self.compiler = Compiler()
+        self.functions = {}
+
+    def visit_program(self, program: nodes.Program):
+        if self.resolve_variables:
+            scopes = Resolver().resolve(program)
+            checker = TypeChecker()
+            self.compiler = Compiler(scopes, checker.proven if not checker.check(program) else None)
+        return super().visit_program(program)
+
+    def execute_body(self, function: nodes.Function):
+        code = self.get_function_code(function.identifier.name)
+        local_variables = [None] * len(code.local_names)
+        return_value = self.run(code, local_variables)
+        if isinstance(return_value, str) and return_value in code.slots:
+            variable = local_variables[code.slots[return_value]]
+            if variable is not None:
+                return variable[0]
+        return return_value
+
+    def execute_function(self, function_name: str, arguments: list):
+        code = None if function_name in self.SPECIAL_FUNCTIONS else self.get_function_code(function_name)
+        if code is None:
+            return super().execute_function(function_name, arguments)
+        local_variables = self.enter_function(code, arguments)
+        return_value = self.run(code, local_variables)
+        self.exit_function(code, return_value)
+        return return_value
+
+    def get_function_code(self, function_name: str) -> Code | None:
+        code = self.functions.get(function_name)
+        if code is None:
+            try:
+                function = self.context_manager.get_function(function_name)
+            except e.UndeclaredVariableError:
+                return None
+            code = self.compiler.compile_function(function)
+            self.functions[function_name] = code
+        return code
+
+    def resolve(self, value):
+        if isinstance(value, str):
+            variable = self.context_manager.find_variable(value)
+            if variable is not None:
+                return variable[0]
+        return value
+
+    def enter_function(self, code: Code, arguments: list, check: bool = True) -> list:
+        context_manager = self.context_manager
+        context_manager.enter_context(code.name)
+        if len(code.parameters) != len(arguments):
+            raise e.InvalidNumberOfArgumentsError(code.name)
+        local_variables = [None] * len(code.local_names)
+        variables = context_manager.current_context.variables
+        for (name, parameter_type, identifier), descriptor, value in zip(code.parameters, code.parameter_types,
+                                                                          arguments):
+            if not self.resolve_variables:
+                value = self.resolve(value)
+            if check and not descriptor.check(value):
+                raise e.TypeMismatchError(identifier)
+            if self.resolve_variables:
+                local_variables[code.slots[name]] = (value, descriptor)
+            else:
+                variables[name] = (value, parameter_type)
+        return local_variables
+
+    def exit_function(self, code: Code, return_value) -> None:
+        if code.check_return and not code.return_type.check(return_value):
+            raise e.InvalidReturnTypeError(code.function_type, return_value)
+        self.context_manager.exit_context()
+
+    def pop_arguments(self, stack: list, count: int) -> list:
+        if not count:
+            return []
+        arguments = stack[-count:]
+        del stack[-count:]
+        return arguments
+
+    def run(self, code: Code, local_variables: list):
+        context_manager = self.context_manager
+        find_variable = context_manager.find_variable
+        unary_operations = self.UNARY_OPERATIONS
+        binary_operations = self.BINARY_OPERATIONS
+        instructions = code.instructions
+        constants = code.constants
+        stack = []
+        frames = []
+        position = 0
+        while True:
+            opcode = instructions[position]
+            argument = instructions[position + 1]
+            position += 2
+
+            if opcode == LOAD_CONST:
+                stack.append(constants[argument])
+            elif opcode == BINARY_OP:
+                right = stack.pop()
+                left = stack[-1]
+                if argument & 1 and isinstance(left, str):
+                    variable = find_variable(left)
+                    if variable is not None:
+                        left = variable[0]
+                if argument & 2 and isinstance(right, str):
+                    variable = find_variable(right)
+                    if variable is not None:
+                        right = variable[0]
+                stack[-1] = binary_operations[argument >> 2](left, right)
+            elif opcode == LOAD_LOCAL:
+                variable = local_variables[argument]
+                if variable is None:
+                    raise e.UndeclaredVariableError(code.local_names[argument])
+                stack.append(variable[0])
+            elif opcode == STORE_LOCAL:
+                value = stack.pop()
+                slot = argument >> 1
+                variable = local_variables[slot]
+                if variable is None:
+                    raise e.UndeclaredVariableError(code.local_names[slot])
+                if argument & 1 and not variable[1].check(value):
+                    raise e.TypeMismatchError(code.local_names[slot])
+                local_variables[slot] = (value, variable[1])
+            elif opcode == DECLARE_LOCAL:
+                slot, variable_type = constants[argument]
+                if local_variables[slot] is not None:
+                    raise e.RedefinitionError(code.local_names[slot])
+                local_variables[slot] = (stack.pop(), variable_type)
+            elif opcode == JUMP_IF_RETURNED:
+                if context_manager.current_context.return_value is not None:
+                    position = argument
+            elif opcode == POP_JUMP_IF_FALSE:
+                if not stack.pop():
+                    position = argument
+            elif opcode == POP_JUMP_IF_TRUE:
+                if stack.pop():
+                    position = argument
+            elif opcode == CHECK_CONDITION:
+                if not isinstance(stack[-1], bool):
+                    raise e.InvalidConditionError(stack[-1])
+            elif opcode == CHECK_VARIABLE:
+                if find_variable(constants[argument]) is None:
+                    raise e.UndeclaredVariableError(constants[argument])
+            elif opcode == STORE_VARIABLE:
+                name = constants[argument]
+                value = stack.pop()
+                variable_type = context_manager.get_variable_type(name)
+                if get_type_descriptor(variable_type).check(value):
+                    context_manager.current_context.variables[name] = (value, variable_type)
+                else:
+                    raise e.TypeMismatchError(name)
+            elif opcode == DECLARE_VARIABLE:
+                name, variable_type = constants[argument]
+                variables = context_manager.current_context.variables
+                if name in variables:
+                    raise e.RedefinitionError(name)
+                variables[name] = (stack.pop(), variable_type)
+            elif opcode == POP:
+                stack.pop()
+            elif opcode == UNARY_OP:
+                value = stack[-1]
+                if argument & 1:
+                    value = self.resolve(value)
+                stack[-1] = unary_operations[argument >> 1](value)
+            elif opcode == SET_RETURN:
+                context_manager.current_context.return_value = stack.pop()
+            elif opcode == JUMP:
+                position = argument
+            elif opcode == CHECK_FUNCTION:
+                identifier = constants[argument]
+                if not context_manager.is_function_exists(identifier.name):
+                    raise e.UndeclaredFunctionError(identifier)
+            elif opcode == CALL_FUNCTION:
+                name, count = constants[argument >> 1]
+                arguments = self.pop_arguments(stack, count)
+                function_code = None if name in self.SPECIAL_FUNCTIONS else self.get_function_code(name)
+                if function_code is None:
+                    stack.append(self.execute_function(name, arguments))
+                    continue
+                if len(frames) >= self.MAX_DEPTH:
+                    raise RecursionError('maximum recursion depth exceeded')
+                frames.append((code, position, local_variables))
+                local_variables = self.enter_function(function_code, arguments, argument & 1)
+                code = function_code
+                instructions = code.instructions
+                constants = code.constants
+                position = 0
+            elif opcode == RETURN:
+                return_value = context_manager.current_context.return_value
+                if not frames:
+                    return return_value
+                self.exit_function(code, return_value)
+                code, position, local_variables = frames.pop()
+                instructions = code.instructions
+                constants = code.constants
+                stack.append(return_value)
+            elif opcode == CHECK_CALLER:
+                caller = stack[-1]
+                if not isinstance(caller, str) or find_variable(caller) is None:
+                    raise e.UndeclaredVariableError(caller)
+            elif opcode == CALL_METHOD:
+                name, count = constants[argument]
+                arguments = self.pop_arguments(stack, count)
+                stack[-1] = self.execute_method(stack[-1], name, arguments)
+            elif opcode == EVALUATE:
+                stack.append(constants[argument].accept(self))
+            else:
+                raise ValueError(f'Unknown opcode {opcode}')
@@ -0,0 +1,135 @@
+from lexer.tokens import Token, TokenType, SymbolTable
+from lexer.source import StringSource
+from lexer.lexer import Lexer
+from parser.parser import Parser
+from parser.nodes import Program
+from interpreter.interpreter import Interpreter
+from interpreter.optimizer import Optimizer
+from errors.errors import InvalidTokenError, ExceedsMaxLengthError, InvalidSyntaxError
+import time
+import sys
+import os
+
+
+class RegionLexer:
+    def __init__(self, text: str, start: int, end: int, symbols: SymbolTable) -> None:
+        self.lexer = Lexer(StringSource(text[start:]), symbols=symbols)
+        self.symbols = symbols
+        self.end = end - start
+        self.aligned = False
+
+    def tokens(self):
+        token = self.lexer.get_next_token()
+        while token.start < self.end and token.type != TokenType.EOF:
+            if token.type != TokenType.COMMENT:
+                yield token
+            token = self.lexer.get_next_token()
+        self.aligned = token.start == self.end
+        end_token = Token(TokenType.EOF, None, token.pos, token.start, token.start)
+        while True:
+            yield end_token
+
+
+class ProgramWatcher:
+    PARSE_ERRORS = (InvalidTokenError, ExceedsMaxLengthError, InvalidSyntaxError, ValueError)
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.symbols = SymbolTable()
+        self.text = ''
+        self.functions = []
+        self.spans = []
+        self.reparsed = 0
+
+    def read(self) -> str:
+        with open(self.path, 'r') as file:
+            return file.read()
+
+    def load(self) -> Program:
+        return self.update(self.read())
+
+    def parse_all(self, text: str) -> Program:
+        parser = Parser(Lexer(StringSource(text), symbols=self.symbols))
+        program = parser.parse_program()
+        self.text = text
+        self.functions = program.functions
+        self.spans = parser.function_spans
+        self.reparsed = len(self.functions)
+        return program
+
+    def get_common_prefix(self, text: str) -> int:
+        low, high = 0, min(len(text), len(self.text))
+        while low < high:
+            middle = (low + high + 1) // 2
+            if text[:middle] == self.text[:middle]:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def get_common_suffix(self, text: str, limit: int) -> int:
+        low, high = 0, limit
+        while low < high:
+            middle = (low + high + 1) // 2
+            if text[len(text) - middle:] == self.text[len(self.text) - middle:]:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def update(self, text: str) -> Program:
+        if not self.spans:
+            return self.parse_all(text)
+        prefix = self.get_common_prefix(text)
+        suffix = self.get_common_suffix(text, min(len(text), len(self.text)) - prefix)
+        delta = len(text) - len(self.text)
+        first = 0
+        while first < len(self.spans) and self.spans[first][1] <= prefix:
+            first += 1
+        last = first
+        while last < len(self.spans) and self.spans[last][0] < len(self.text) - suffix:
+            last += 1
+        start = self.spans[first - 1][1] if first else 0
+        end = self.spans[last][0] + delta if last < len(self.spans) else len(text)
+
+        lexer = RegionLexer(text, start, end, self.symbols)
+        parser = Parser(lexer)
+        try:
+            region = parser.parse_program()
+        except self.PARSE_ERRORS:
+            return self.parse_all(text)
+        if not lexer.aligned:
+            return self.parse_all(text)
+
+        self.functions = self.functions[:first] + region.functions + self.functions[last:]
+        self.spans = (self.spans[:first] +
+                      [(span_start + start, span_end + start) for span_start, span_end in parser.function_spans] +
+                      [(span_start + delta, span_end + delta) for span_start, span_end in self.spans[last:]])
+        self.text = text
+        self.reparsed = len(region.functions)
+        return Program(self.functions, self.symbols.names)
+
+
+def watch(path: str, interval: float = 0.5, optimize: bool = True, engine: str | None = None,
+          resolve: bool = False) -> None:
+    watcher = ProgramWatcher(path)
+    modified = None
+    while True:
+        try:
+            current = os.stat(path).st_mtime_ns
+        except OSError:
+            current = None
+        if current is not None and current != modified:
+            modified = current
+            try:
+                start = time.perf_counter()
+                program = watcher.load()
+                elapsed = time.perf_counter() - start
+                print(f'Reloaded {path}: {watcher.reparsed} of {len(program.functions)} functions reparsed '
+                      f'in {elapsed * 1000:.1f} ms', file=sys.stderr)
+                if optimize:
+                    program = Optimizer().optimize(program)
+                program.accept(Interpreter.create_engine(engine, resolve))
+            except Exception as error:
+                print(f'{type(error).__name__}: {error}', file=sys.stderr)
+        time.sleep(interval)
@@ -0,0 +1,89 @@
+from lexer.tokens import Token, SymbolTable
+from lexer.source import StringSource
+from lexer.lexer import Lexer
+from errors.errors import InvalidTokenError, ExceedsMaxLengthError
+
+
+class IncrementalLexer:
+    LEXER_ERRORS = (InvalidTokenError, ExceedsMaxLengthError, ValueError)
+
+    def __init__(self, text: str, engine: str = 'table', symbols: SymbolTable | None = None) -> None:
+        self.text = text
+        self.engine = engine
+        self.symbols = symbols if symbols is not None else SymbolTable()
+        self.tokens = self.lex_all(text)
+
+    def lex_all(self, text: str) -> list[Token]:
+        return Lexer(StringSource(text), self.engine, self.symbols).get_all_tokens()
+
+    def get_line_start(self, text: str, offset: int) -> int:
+        return max(text.rfind('\n', 0, offset), text.rfind('\r', 0, offset)) + 1
+
+    def get_restart_index(self, offset: int) -> int:
+        low, high = 0, len(self.tokens) - 1
+        while low < high:
+            middle = (low + high) // 2
+            if self.tokens[middle].end < offset:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def apply_edit(self, offset: int, deleted: int, inserted: str) -> list[Token]:
+        old_tokens = self.tokens
+        text = self.text[:offset] + inserted + self.text[offset + deleted:]
+        delta = len(inserted) - deleted
+        edit_end = offset + deleted
+
+        restart = self.get_restart_index(offset)
+        if restart == 0:
+            start, line = 0, 1
+        else:
+            previous = old_tokens[restart - 1]
+            start = previous.end
+            line = previous.pos[1]
+            line += sum(text.count(eol, previous.start, start) for eol in StringSource.EOL)
+        column_shift = start - self.get_line_start(text, start)
+
+        tokens = old_tokens[:restart]
+        lexer = Lexer(StringSource(text[start:]), self.engine, self.symbols)
+        index = restart
+        try:
+            while True:
+                token = lexer.get_next_token()
+                column, token_line = token.pos
+                if token_line == 1:
+                    column += column_shift
+                token.packed_pos = (token_line + line - 1) << 32 | column
+                token.start += start
+                token.end += start
+                while index < len(old_tokens) and (old_tokens[index].start < edit_end or
+                                                   old_tokens[index].start + delta < token.start):
+                    index += 1
+                if index < len(old_tokens) and old_tokens[index].start + delta == token.start:
+                    break
+                tokens.append(token)
+        except self.LEXER_ERRORS:
+            self.tokens = self.lex_all(text)
+            self.text = text
+            return self.tokens
+
+        tokens.extend(self.shift_tokens(old_tokens[index:], text, delta, token))
+        self.text = text
+        self.tokens = tokens
+        return tokens
+
+    def shift_tokens(self, old_tokens: list[Token], text: str, delta: int, first: Token) -> list[Token]:
+        if not old_tokens:
+            return old_tokens
+        first_line = old_tokens[0].pos[1]
+        line_shift = (first.pos[1] - first_line) << 32
+        line_start = self.get_line_start(text, first.start)
+        for token in old_tokens:
+            token.start += delta
+            token.end += delta
+            if token.packed_pos >> 32 == first_line:
+                token.packed_pos = (first_line << 32 | token.start - line_start + 1) + line_shift
+            else:
+                token.packed_pos += line_shift
+        return old_tokens
@@ -1,15 +1,28 @@
-from lexer.tokens import Token, TokenType, Symbol
+from lexer.tokens import Token, TokenBuffer, TokenType, Symbol, SymbolTable
 from lexer.source import FileSource, StringSource
 from errors.errors import InvalidTokenError, ExceedsMaxLengthError
+import string
+import re
 
 
 class Lexer:
     MAX_INT_LENGTH = 15
     MAX_FLOAT_LENGTH = 15
     MAX_STRING_LENGTH = 10 ** 5
+    ENGINES = ['chain', 'table']
+    IDENTIFIER_PATTERN = re.compile(rf'\w{{1,{MAX_STRING_LENGTH + 1}}}')
+    NUMBER_PATTERN = re.compile(rf'([0-9]{{1,{MAX_INT_LENGTH + 1}}})(\.[0-9]{{0,{MAX_FLOAT_LENGTH + 1}}})?')
+    STRING_PATTERN = re.compile(rf'"((?:[^"\\]|\\[nt\\"\']){{0,{MAX_STRING_LENGTH}}})(")?')
+    COMMENT_PATTERN = re.compile(rf'#[^\n\r]{{0,{MAX_STRING_LENGTH}}}')
 
-    def __init__(self, source: FileSource | StringSource) -> None:
+    def __init__(self, source: FileSource | StringSource, engine: str = 'table',
+                 symbols: SymbolTable | None = None) -> None:
+        if engine not in self.ENGINES:
+            raise ValueError(f'Unknown lexer engine \'{engine}\'')
         self.source = source
+        self.engine = engine
+        self.symbols = symbols if symbols is not None else SymbolTable()
+        self.dispatch_table = self.build_dispatch_table()
 
     def get_current_char(self) -> str:
         return self.source.get_current_char()
@@ -37,9 +50,8 @@ class Lexer:
                 self.get_next_char()
                 if len(value) > self.MAX_STRING_LENGTH:
                     raise ExceedsMaxLengthError(self.get_position()[0], self.get_position()[1], 'Identifier')
-            if value in Symbol.keywords:
-                return Token(type=Symbol.keywords[value], value=value, pos=position)
-            return Token(type=TokenType.IDENTIFIER, value=value, pos=position)
+            name, symbol, token_type = self.symbols.lookup(value)
+            return Token(type=token_type, value=name, pos=position, symbol=symbol)
 
     def try_build_string(self) -> Token:
         if self.get_current_char() == '"':
@@ -121,7 +133,125 @@ class Lexer:
             position = (self.get_position()[0] + 1, self.get_position()[1])
             return Token(type=TokenType.EOF, value=None, pos=position)
 
+    def build_dispatch_table(self) -> dict:
+        table = {'': self.scan_eof, '"': self.scan_string, '#': self.scan_comment}
+        for char in string.ascii_letters:
+            table[char] = self.scan_identifier
+        for char in string.digits:
+            table[char] = self.scan_number
+        for char in Symbol.chars:
+            if char != '#':
+                table[char] = self.scan_chars
+        return table
+
+    def get_start_offset(self) -> int:
+        return self.source.buffer_offset + self.source.buffer_index - 1
+
+    def set_span(self, token: Token, start: int) -> Token:
+        token.start = start
+        token.end = self.source.get_offset()
+        return token
+
+    def get_error_position(self, position: tuple, index: int) -> tuple:
+        char = self.source.buffer[index] if index < self.source.buffer_length else ''
+        if char == '\n' or char == '\r':
+            return (0, position[1] + 1)
+        length = index - (self.source.buffer_index - 1)
+        return (position[0] + length - (char == ''), position[1])
+
+    def get_lexeme(self, token: Token) -> str:
+        return self.source.get_text(token.start, token.end)
+
+    def scan_identifier(self) -> Token:
+        source = self.source
+        position = (source.column, source.line)
+        start = self.get_start_offset()
+        match = source.match(self.IDENTIFIER_PATTERN)
+        value = match.group()
+        if len(value) > self.MAX_STRING_LENGTH:
+            raise ExceedsMaxLengthError(*self.get_error_position(position, match.end()), 'Identifier')
+        source.skip(len(value))
+        entry = self.symbols.entries.get(value) or self.symbols.add(value)
+        return Token(entry[2], entry[0], position, start, start + len(value), entry[1])
+
+    def scan_string(self) -> Token:
+        source = self.source
+        position = (source.column, source.line)
+        start = self.get_start_offset()
+        match = source.match(self.STRING_PATTERN)
+        if match.group(2) is None:
+            return self.set_span(self.try_build_string(), start)
+        value = match.group(1)
+        if '\\' in value:
+            value = value.encode('latin-1', 'backslashreplace').decode('unicode-escape')
+        length = match.end() - match.start()
+        source.skip(length)
+        return Token(TokenType.STRING_VALUE, value, position, start, start + length)
+
+    def scan_comment(self) -> Token:
+        source = self.source
+        position = (source.column, source.line)
+        start = self.get_start_offset()
+        match = source.match(self.COMMENT_PATTERN)
+        value = match.group()
+        if len(value) > self.MAX_STRING_LENGTH:
+            raise ExceedsMaxLengthError(*self.get_error_position(position, match.end()), 'Comment')
+        source.skip(len(value))
+        return Token(TokenType.COMMENT, value, position, start, start + len(value))
+
+    def scan_number(self) -> Token:
+        source = self.source
+        position = (source.column, source.line)
+        start = self.get_start_offset()
+        match = source.match(self.NUMBER_PATTERN)
+        following = source.buffer[match.end()] if match.end() < source.buffer_length else ''
+        if following > '\x7f' and following.isdigit():
+            return self.set_span(self.try_build_number(), start)
+        integer, fraction = match.groups()
+        if len(integer) > self.MAX_INT_LENGTH:
+            raise ExceedsMaxLengthError(*self.get_error_position(position, match.end(1)), 'Integer')
+        if fraction is None:
+            source.skip(len(integer))
+            return Token(TokenType.INT_VALUE, int(integer), position, start, start + len(integer))
+        first_too_long = max(1, self.MAX_FLOAT_LENGTH - len(integer))
+        if len(fraction) - 1 >= first_too_long:
+            index = match.start() + len(integer) + 1 + first_too_long
+            raise ExceedsMaxLengthError(*self.get_error_position(position, index), 'Float')
+        length = len(integer) + len(fraction)
+        source.skip(length)
+        return Token(TokenType.FLOAT_VALUE, float(integer + fraction), position, start, start + length)
+
+    def scan_chars(self) -> Token:
+        source = self.source
+        position = (source.column, source.line)
+        start = self.get_start_offset()
+        value = source.current_char
+        char = source.get_next_char()
+        if char == '=' and value in '=!<>':
+            source.get_next_char()
+            return Token(Symbol.double_chars[value + char], value + char, position, start, start + 2)
+        return Token(Symbol.chars[value], value, position, start, start + 1)
+
+    def scan_eof(self) -> Token:
+        offset = self.source.get_offset()
+        return Token(TokenType.EOF, None, (self.source.column + 1, self.source.line), offset, offset)
+
     def get_next_token(self) -> Token:
+        if self.engine == 'table':
+            return self.get_next_table_token()
+        return self.get_next_chain_token()
+
+    def get_next_table_token(self) -> Token:
+        source = self.source
+        char = source.current_char
+        while char == ' ' or char == '\n' or char == '\r':
+            char = source.get_next_char()
+        builder = self.dispatch_table.get(char)
+        if builder is None:
+            return self.get_next_chain_token()
+        return builder()
+
+    def get_next_chain_token(self) -> Token:
         while (self.get_current_char() in self.source.EOL or self.get_current_char() == ' '):
             self.skip_new_line()
             self.skip_whitespaces()
@@ -133,9 +263,18 @@ class Lexer:
                     self.try_build_eof]:
             token = fun()
             if token:
-                return token
+                return self.set_span(token, self.source.get_offset(token.pos))
         raise InvalidTokenError(self.get_position()[0], self.get_position()[1], self.get_current_char())
 
+    def tokens(self):
+        token = self.get_next_token()
+        while token.type != TokenType.EOF:
+            if token.type != TokenType.COMMENT:
+                yield token
+            token = self.get_next_token()
+        while True:
+            yield token
+
     def get_all_tokens(self) -> list[Token]:
         self.source.set_start_position()
         tokens = []
@@ -145,3 +284,13 @@ class Lexer:
             token = self.get_next_token()
         tokens.append(token)
         return tokens
+
+    def get_token_buffer(self) -> TokenBuffer:
+        self.source.set_start_position()
+        buffer = TokenBuffer()
+        token = self.get_next_token()
+        while token.type != TokenType.EOF:
+            buffer.append(token)
+            token = self.get_next_token()
+        buffer.append(token)
+        return buffer
@@ -0,0 +1,104 @@
+from lexer.tokens import Token, TokenBuffer, TokenType, Symbol, SymbolTable
+from lexer.source import StringSource
+from lexer.lexer import Lexer
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from array import array
+import re
+
+
+def lex_chunk(text: str, engine: str) -> tuple | None:
+    try:
+        tokens = Lexer(StringSource(text), engine).get_all_tokens()
+    except Exception:
+        return None
+    tokens.pop()
+    return (array('B', [token.type.value for token in tokens]),
+            [token.value for token in tokens],
+            array('I', [token.packed_pos & 0xFFFFFFFF for token in tokens]),
+            array('I', [token.packed_pos >> 32 for token in tokens]),
+            array('Q', [token.start for token in tokens]),
+            array('Q', [token.end for token in tokens]))
+
+
+class ParallelLexer:
+    CHUNK_SIZE = 2 ** 20
+    SPAN_PATTERN = re.compile(r'"(?:[^"\\]|\\[\s\S])*"?|#[^\n\r]*')
+    SYMBOL_TYPES = frozenset([TokenType.IDENTIFIER, *Symbol.keywords.values()])
+
+    def __init__(self, text: str, workers: int | None = None, chunk_size: int = CHUNK_SIZE,
+                 engine: str = 'table', symbols: SymbolTable | None = None) -> None:
+        if engine not in Lexer.ENGINES:
+            raise ValueError(f'Unknown lexer engine \'{engine}\'')
+        self.text = text
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.engine = engine
+        self.symbols = symbols if symbols is not None else SymbolTable()
+
+    @classmethod
+    def from_file(cls, path: str, **options) -> 'ParallelLexer':
+        with open(path, 'r') as file:
+            return cls(file.read(), **options)
+
+    def find_boundaries(self) -> list[int]:
+        text = self.text
+        boundaries = [0]
+        spans = self.SPAN_PATTERN.finditer(text)
+        span = next(spans, None)
+        position = self.chunk_size
+        while position < len(text):
+            newline = text.find('\n', position, len(text) - 1)
+            if newline == -1:
+                break
+            while span is not None and span.end() <= newline:
+                span = next(spans, None)
+            if span is not None and span.start() <= newline:
+                position = span.end()
+                continue
+            boundaries.append(newline + 1)
+            position = newline + 1 + self.chunk_size
+        return boundaries
+
+    def lex_serial(self) -> list[Token]:
+        return Lexer(StringSource(self.text), self.engine, self.symbols).get_all_tokens()
+
+    def get_all_tokens(self) -> list[Token]:
+        boundaries = self.find_boundaries()
+        if len(boundaries) == 1 or self.workers == 1:
+            return self.lex_serial()
+        chunks = [self.text[start:end] for start, end in zip(boundaries, boundaries[1:] + [len(self.text)])]
+        with ProcessPoolExecutor(self.workers) as executor:
+            results = list(executor.map(lex_chunk, chunks, repeat(self.engine)))
+        if None in results:
+            return self.lex_serial()
+        return self.stitch(results, boundaries, chunks)
+
+    def stitch(self, results: list[tuple], boundaries: list[int], chunks: list[str]) -> list[Token]:
+        symbol_types = self.SYMBOL_TYPES
+        entries = self.symbols.entries
+        types = TokenBuffer.TYPES
+        tokens = []
+        append = tokens.append
+        line_shift = 0
+        for (codes, values, columns, lines, starts, ends), offset, chunk in zip(results, boundaries, chunks):
+            for code, value, column, line, start, end in zip(codes, values, columns, lines, starts, ends):
+                token_type = types[code]
+                if token_type in symbol_types:
+                    entry = entries.get(value) or self.symbols.add(value)
+                    append(Token(token_type, entry[0], (column, line + line_shift),
+                                 start + offset, end + offset, entry[1]))
+                else:
+                    append(Token(token_type, value, (column, line + line_shift), start + offset, end + offset))
+            line_shift += chunk.count('\n') + chunk.count('\r')
+        column = len(self.text) - max(self.text.rfind('\n'), self.text.rfind('\r'))
+        tokens.append(Token(TokenType.EOF, None, (column, line_shift + 1), len(self.text), len(self.text)))
+        return tokens
+
+    def tokens(self):
+        tokens = self.get_all_tokens()
+        for token in tokens:
+            if token.type != TokenType.COMMENT:
+                yield token
+        while True:
+            yield tokens[-1]
@@ -1,63 +1,269 @@
+from bisect import bisect_right
+from array import array
+import mmap
 import io
+import os
+import sys
+import re
 
 
 class Source:
     EOL = ['\n', '\r']
+    EOL_PATTERN = re.compile('[\n\r]')
+    BLOCK_SIZE = 2 ** 16
 
-    def __init__(self, stream) -> None:
+    def __init__(self, stream, block_size: int = BLOCK_SIZE, close: bool = True) -> None:
         self.stream = stream
+        self.close_stream = close
+        self.block_size = block_size
+        self.seekable = stream.seekable()
+        self.buffer = ''
+        self.buffer_index = 0
+        self.buffer_length = 0
+        self.buffer_offset = 0
+        self.block_number = -1
+        self.block_offsets = array('Q', [0])
+        self.block_cookies = [self.tell()]
+        self.line_starts = array('Q', [0])
+        self.end_offset = None
         self.column = 0
         self.line = 1
         self.current_char = self.get_next_char()
 
     def __del__(self) -> None:
-        if hasattr(self, 'stream') and self.stream:
+        if hasattr(self, 'stream') and self.stream and self.close_stream:
             self.stream.close()
 
+    def tell(self):
+        return self.stream.tell() if self.seekable else None
+
+    def seek(self, cookie) -> None:
+        self.stream.seek(cookie)
+
+    def read_text(self) -> str:
+        return self.stream.read(self.block_size)
+
+    def index_block(self, text: str) -> None:
+        offset = self.block_offsets[-1]
+        if not text:
+            self.end_offset = offset
+            return
+        self.line_starts.extend(offset + match.end() for match in self.EOL_PATTERN.finditer(text))
+        self.block_offsets.append(offset + len(text))
+        self.block_cookies.append(self.tell())
+
+    def index_until(self, line: int) -> None:
+        if len(self.line_starts) > line or self.end_offset is not None or not self.seekable:
+            return
+        current_position = self.tell()
+        self.seek(self.block_cookies[-1])
+        while len(self.line_starts) <= line and self.end_offset is None:
+            self.index_block(self.read_text())
+        self.seek(current_position)
+
+    def load_text(self) -> str:
+        text = self.read_text()
+        if not text:
+            if self.end_offset is None:
+                self.index_block(text)
+            return text
+        self.block_number += 1
+        if self.block_number == len(self.block_offsets) - 1:
+            self.index_block(text)
+        return text
+
+    def read_block(self) -> bool:
+        text = self.load_text()
+        if not text:
+            return False
+        self.buffer_offset = self.block_offsets[self.block_number]
+        self.buffer = text
+        self.buffer_index = 0
+        self.buffer_length = len(text)
+        return True
+
+    def extend_buffer(self) -> bool:
+        text = self.load_text()
+        if not text:
+            return False
+        kept = max(self.buffer_index - 1, 0)
+        self.buffer = self.buffer[kept:] + text
+        self.buffer_offset += kept
+        self.buffer_index -= kept
+        self.buffer_length = len(self.buffer)
+        return True
+
     def get_current_char(self) -> str:
         return self.current_char
 
     def get_next_char(self) -> str:
-        self.current_char = self.stream.read(1)
-        if self.current_char != '':
-            self.column += 1
-        if self.current_char in self.EOL:
+        if self.buffer_index >= self.buffer_length and not self.read_block():
+            self.current_char = ''
+            return ''
+        char = self.buffer[self.buffer_index]
+        self.buffer_index += 1
+        self.current_char = char
+        if char == '\n' or char == '\r':
             self.line += 1
             self.column = 0
-        return self.current_char
+        else:
+            self.column += 1
+        return char
 
     def get_position(self) -> tuple:
         return (self.column, self.line)
 
+    def get_offset(self, position: tuple = None) -> int:
+        if position is None:
+            offset = self.buffer_offset + self.buffer_index
+            return offset - 1 if self.current_char else offset
+        column, line = position
+        self.index_until(line - 1)
+        return self.line_starts[line - 1] + column - 1
+
     def set_start_position(self) -> None:
         self.column = 0
         self.line = 1
-        self.stream.seek(0)
+        if not self.seekable:
+            if self.buffer_offset != 0:
+                raise io.UnsupportedOperation('Cannot rewind a source that is not seekable')
+            self.buffer_index = 0
+            self.current_char = self.get_next_char()
+            return
+        self.seek(self.block_cookies[0])
+        self.buffer = ''
+        self.buffer_index = 0
+        self.buffer_length = 0
+        self.buffer_offset = 0
+        self.block_number = -1
         self.current_char = self.get_next_char()
 
+    def get_text(self, start: int, end: int) -> str:
+        if self.buffer_offset <= start and end <= self.buffer_offset + self.buffer_length:
+            return self.buffer[start - self.buffer_offset:end - self.buffer_offset]
+        if not self.seekable:
+            raise io.UnsupportedOperation('Text outside of the current block is not available')
+        block = bisect_right(self.block_offsets, start) - 1
+        current_position = self.tell()
+        self.seek(self.block_cookies[block])
+        text = ''
+        text_end = self.block_offsets[block]
+        while text_end < end:
+            block_text = self.read_text()
+            if not block_text:
+                break
+            text += block_text
+            text_end += len(block_text)
+        self.seek(current_position)
+        first = start - self.block_offsets[block]
+        return text[first:first + end - start]
+
     def get_line(self, line) -> str:
-        current_position = self.stream.tell()
-        self.stream.seek(0)
-        for _ in range(line - 1):
-            self.stream.readline()
-        readed_line = self.stream.readline()
-        self.stream.seek(current_position)
-        return readed_line
+        self.index_until(line)
+        if line < 1 or line > len(self.line_starts):
+            return ''
+        start = self.line_starts[line - 1]
+        end = self.line_starts[line] if line < len(self.line_starts) else self.end_offset
+        return self.get_text(start, end)
 
     def seek_next(self) -> str:
-        current_position = self.stream.tell()
-        self.get_next_char()
-        next_char = self.get_current_char()
-        self.stream.seek(current_position)
-        return next_char
+        if self.buffer_index >= self.buffer_length and not self.extend_buffer():
+            return ''
+        return self.buffer[self.buffer_index]
+
+    def match(self, pattern: re.Pattern) -> re.Match:
+        match = pattern.match(self.buffer, self.buffer_index - 1)
+        while match.end() + 1 >= self.buffer_length and self.extend_buffer():
+            match = pattern.match(self.buffer, self.buffer_index - 1)
+        return match
+
+    def skip(self, length: int) -> str:
+        stepped = self.buffer[self.buffer_index:self.buffer_index + length]
+        last_eol = max(stepped.rfind('\n'), stepped.rfind('\r'))
+        if last_eol == -1:
+            self.column += len(stepped)
+        else:
+            self.line += stepped.count('\n') + stepped.count('\r')
+            self.column = len(stepped) - last_eol - 1
+        self.buffer_index += len(stepped)
+        if stepped:
+            self.current_char = stepped[-1]
+        for _ in range(length - len(stepped)):
+            self.get_next_char()
+        return self.current_char
 
 
 class FileSource(Source):
-    def __init__(self, path: str) -> None:
-        super().__init__(open(path, 'r'))
+    def __init__(self, path: str, block_size: int = Source.BLOCK_SIZE) -> None:
+        super().__init__(open(path, 'r'), block_size)
         self.path = path
 
 
 class StringSource(Source):
-    def __init__(self, string: str) -> None:
-        super().__init__(io.StringIO(string))
+    def __init__(self, string: str, block_size: int = Source.BLOCK_SIZE) -> None:
+        super().__init__(io.StringIO(string), block_size)
+
+
+class MappedFileSource(Source):
+    THRESHOLD = 2 ** 24
+
+    def __init__(self, path: str, block_size: int = Source.BLOCK_SIZE) -> None:
+        self.path = path
+        self.file = open(path, 'rb')
+        self.map_size = os.fstat(self.file.fileno()).st_size
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if self.map_size else None
+        self.map_offset = 0
+        self.released_offset = 0
+        super().__init__(self.file, block_size)
+
+    def __del__(self) -> None:
+        if getattr(self, 'map', None):
+            self.map.close()
+        super().__del__()
+
+    def tell(self) -> int:
+        return self.map_offset
+
+    def seek(self, cookie: int) -> None:
+        self.map_offset = cookie
+
+    def read_text(self) -> str:
+        start = self.map_offset
+        end = min(start + self.block_size, self.map_size)
+        if end < self.map_size:
+            while end > start + 1 and self.map[end] & 0xC0 == 0x80:
+                end -= 1
+            if self.map[end - 1] == ord('\r') and self.map[end] == ord('\n'):
+                end += 1
+        self.map_offset = end
+        return self.decode(self.map[start:end]) if end > start else ''
+
+    def read_block(self) -> bool:
+        self.release_pages(self.map_offset)
+        return super().read_block()
+
+    def decode(self, data: bytes) -> str:
+        text = data.decode('utf-8')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+
+    def release_pages(self, offset: int) -> None:
+        if not hasattr(mmap, 'MADV_DONTNEED'):
+            return
+        end = offset - offset % mmap.PAGESIZE
+        if end > self.released_offset:
+            self.map.madvise(mmap.MADV_DONTNEED, self.released_offset, end - self.released_offset)
+            self.released_offset = end
+
+    def set_start_position(self) -> None:
+        self.released_offset = 0
+        super().set_start_position()
+
+
+def create_file_source(path: str) -> Source:
+    if path == '-':
+        return Source(sys.stdin, close=False)
+    if os.path.getsize(path) >= MappedFileSource.THRESHOLD:
+        return MappedFileSource(path)
+    return FileSource(path)
@@ -1,4 +1,6 @@
 from enum import auto, Enum
+from array import array
+import sys
 
 
 class TokenType(Enum):
@@ -51,15 +53,87 @@ class TokenType(Enum):
 
 
 class Token:
-    def __init__(self, type: TokenType, value: str | int | float | None, pos: tuple) -> None:
+    __slots__ = ('type', 'value', 'packed_pos', 'start', 'end', 'symbol')
+
+    def __init__(self, type: TokenType, value: str | int | float | None, pos: tuple,
+                 start: int = 0, end: int = 0, symbol: int | None = None) -> None:
         self.type = type
         self.value = value
-        self.pos = pos
+        self.packed_pos = pos[1] << 32 | pos[0]
+        self.start = start
+        self.end = end
+        self.symbol = symbol
+
+    @property
+    def pos(self) -> tuple:
+        return (self.packed_pos & 0xFFFFFFFF, self.packed_pos >> 32)
 
     def __str__(self) -> str:
         return f'Token({self.type}, {self.value}, {self.pos[0]}, {self.pos[1]})'
 
 
+class TokenBuffer:
+    TYPES = {token_type.value: token_type for token_type in TokenType}
+
+    def __init__(self) -> None:
+        self.types = array('B')
+        self.offsets = array('I')
+        self.ends = array('I')
+        self.columns = array('I')
+        self.lines = array('I')
+        self.symbols = array('i')
+        self.values = []
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __getitem__(self, index: int) -> Token:
+        symbol = self.symbols[index]
+        return Token(type=self.TYPES[self.types[index]], value=self.values[index],
+                     pos=(self.columns[index], self.lines[index]), start=self.offsets[index], end=self.ends[index],
+                     symbol=None if symbol < 0 else symbol)
+
+    def __iter__(self):
+        for index in range(len(self.types)):
+            yield self[index]
+
+    def append(self, token: Token) -> None:
+        self.types.append(token.type.value)
+        self.offsets.append(token.start)
+        self.ends.append(token.end)
+        self.columns.append(token.packed_pos & 0xFFFFFFFF)
+        self.lines.append(token.packed_pos >> 32)
+        self.symbols.append(-1 if token.symbol is None else token.symbol)
+        self.values.append(token.value)
+
+
+class TokenStream:
+    def __init__(self, tokens, lookahead: int = 4) -> None:
+        self.tokens = iter(tokens)
+        self.capacity = lookahead + 1
+        self.ring = [None] * self.capacity
+        self.head = 0
+        self.count = 0
+
+    def fill(self, count: int) -> None:
+        while self.count < count:
+            self.ring[(self.head + self.count) % self.capacity] = next(self.tokens)
+            self.count += 1
+
+    def peek(self, k: int = 0) -> Token:
+        if k >= self.capacity:
+            raise IndexError(f'Cannot look {k} tokens ahead, lookahead is {self.capacity - 1}')
+        if k >= self.count:
+            self.fill(k + 1)
+        return self.ring[(self.head + k) % self.capacity]
+
+    def next(self) -> Token:
+        token = self.peek()
+        self.head = (self.head + 1) % self.capacity
+        self.count -= 1
+        return token
+
+
 class Symbol:
     keywords = {
         'int': TokenType.INT,
@@ -107,3 +181,27 @@ class Symbol:
         '<=': TokenType.LE,
         '>=': TokenType.GE,
     }
+
+
+class SymbolTable:
+    def __init__(self) -> None:
+        self.names = []
+        self.entries = {}
+        for keyword, token_type in Symbol.keywords.items():
+            self.add(keyword, token_type)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(self, name: str, token_type: TokenType = TokenType.IDENTIFIER) -> tuple:
+        name = sys.intern(name)
+        entry = (name, len(self.names), token_type)
+        self.names.append(name)
+        self.entries[name] = entry
+        return entry
+
+    def lookup(self, name: str) -> tuple:
+        entry = self.entries.get(name)
+        if entry is None:
+            entry = self.add(name)
+        return entry
@@ -1,19 +1,122 @@
 from interpreter.interpreter import Interpreter
-from argparse import ArgumentParser
+from interpreter.cache import ProgramCache
+from interpreter.watch import watch
+from interpreter.batch import collect_scripts, run_batch
+from parser.dump import TreeDumper
+from interpreter.bytecode import Compiler, disassemble
+from interpreter.resolver import Resolver
+from interpreter.checker import TypeChecker
+from argparse import ArgumentParser, BooleanOptionalAction
+import json
 import sys
+import os
 
 
 def main(args):
     parser = ArgumentParser(prog='Interpreter', description='Interpreter for my fantastic language')
-    group = parser.add_mutually_exclusive_group(required=True)
-    group.add_argument('-f', '--file', type=str, help='Run interpreter using file')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('-f', '--file', type=str, nargs='+',
+                       help='Run interpreter using file (\'-\' reads standard input); several files, '
+                            'directories or glob patterns run in batch mode')
     group.add_argument('-s', '--string', type=str, help='Run interpreter using string')
+    parser.add_argument('--cache', action=BooleanOptionalAction, default=True,
+                        help=f'Store parsed programs in {ProgramCache.DIRECTORY} next to the file')
+    parser.add_argument('--optimize', action=BooleanOptionalAction, default=True,
+                        help='Fold constant expressions and remove dead branches before running')
+    parser.add_argument('--engine', choices=list(Interpreter.ENGINES),
+                        help=f'Execution engine: tree-walking visitor, closures compiled from the tree or bytecode '
+                             f'(default: {Interpreter.ENGINE})')
+    parser.add_argument('--resolve', action='store_true',
+                        help='Resolve variables to slots before running (bytecode engine only, no dynamic scoping)')
+    parser.add_argument('--clear-cache', action='store_true',
+                        help='Remove cached programs next to the file or in the current directory')
+    parser.add_argument('--watch', action='store_true',
+                        help='Run the file again after every change, reparsing only changed functions')
+    parser.add_argument('--watch-interval', type=float, default=0.5, help='Seconds between file checks in watch mode')
+    parser.add_argument('--workers', type=int, help='Number of worker processes in batch mode')
+    parser.add_argument('--report', type=str, help='Path of JSON report in batch mode (default: standard output)')
+    parser.add_argument('--dump-ast', nargs='?', const='text', choices=TreeDumper.FORMATS,
+                        help='Print the syntax tree (as indented text or JSON) instead of running the program')
+    parser.add_argument('--check', action='store_true',
+                        help='Check types of the program and report all errors instead of running it')
+    parser.add_argument('--disassemble', action='store_true',
+                        help='Print bytecode of every function instead of running the program')
+    parser.add_argument('--dump-output', type=str,
+                        help='Path of syntax tree or bytecode dump (default: standard output)')
     arguments = parser.parse_args(args)
 
-    if arguments.file:
-        interpreter = Interpreter(True, arguments.file)
-    else:
-        interpreter = Interpreter(False, arguments.string)
+    files = arguments.file or []
+    batch = len(files) > 1 or any(os.path.isdir(path) or any(char in path for char in '*?[') for path in files)
+    file = files[0] if files and not batch else None
+
+    if arguments.clear_cache:
+        if batch:
+            for script in collect_scripts(files):
+                ProgramCache.for_file(script).clear()
+        elif file and file != '-':
+            ProgramCache.for_file(file).clear()
+        else:
+            ProgramCache(os.path.join(os.getcwd(), ProgramCache.DIRECTORY)).clear()
+        if not arguments.file and not arguments.string:
+            return
+    elif not arguments.file and not arguments.string:
+        parser.error('one of the arguments -f/--file -s/--string is required')
+
+    if batch:
+        if arguments.dump_ast or arguments.disassemble or arguments.check:
+            parser.error('--dump-ast, --disassemble and --check cannot be used with several files')
+        if arguments.watch:
+            parser.error('--watch cannot be used with several files')
+        report = run_batch(collect_scripts(files), arguments.workers, arguments.cache, arguments.optimize,
+                            arguments.engine, arguments.resolve)
+        if arguments.report:
+            with open(arguments.report, 'w') as report_file:
+                json.dump(report, report_file, indent=4)
+        else:
+            print(json.dumps(report, indent=4))
+        return
+
+    if arguments.watch:
+        if not file or file == '-':
+            parser.error('--watch requires -f/--file with a path')
+        try:
+            watch(file, arguments.watch_interval, arguments.optimize, arguments.engine, arguments.resolve)
+        except KeyboardInterrupt:
+            pass
+        return
+
+    try:
+        if file:
+            cache = ProgramCache.for_file(file) if arguments.cache and file != '-' and not arguments.check else None
+            interpreter = Interpreter(True, file, cache, arguments.optimize, arguments.engine, arguments.resolve)
+        else:
+            interpreter = Interpreter(False, arguments.string, optimize=arguments.optimize, engine=arguments.engine,
+                                      resolve=arguments.resolve)
+    except ValueError as error:
+        parser.error(str(error))
+
+    if arguments.check:
+        errors = TypeChecker(interpreter.parser.positions).check(interpreter.parse())
+        for error in errors:
+            print(error)
+        if errors:
+            sys.exit(1)
+        return
+
+    if arguments.dump_ast or arguments.disassemble:
+        program = interpreter.parse()
+        dump_file = open(arguments.dump_output, 'w') if arguments.dump_output else sys.stdout
+        try:
+            if arguments.dump_ast:
+                TreeDumper(dump_file).dump(program, arguments.dump_ast)
+            else:
+                compiler = Compiler(Resolver().resolve(program)) if arguments.resolve else Compiler()
+                for code in compiler.compile_program(program):
+                    disassemble(code, dump_file)
+        finally:
+            if dump_file is not sys.stdout:
+                dump_file.close()
+        return
 
     interpreter.run()
 
@@ -0,0 +1,80 @@
+from parser.nodes import Node
+import json
+
+
+class TreeDumper:
+    FORMATS = ('text', 'json')
+    SKIPPED_FIELDS = frozenset(['symbol', 'symbols'])
+    INDENT = '  '
+
+    def __init__(self, file) -> None:
+        self.file = file
+        self.fields = {}
+
+    def get_fields(self, node_class: type) -> tuple:
+        fields = self.fields.get(node_class)
+        if fields is None:
+            fields = tuple(field for field in node_class.__slots__ if field not in self.SKIPPED_FIELDS)
+            self.fields[node_class] = fields
+        return fields
+
+    def get_children(self, value: Node | list):
+        if isinstance(value, list):
+            return enumerate(value)
+        return ((field, getattr(value, field)) for field in self.get_fields(type(value)))
+
+    def dump(self, node: Node, format: str = 'text') -> None:
+        if format not in self.FORMATS:
+            raise ValueError(f'Unknown dump format \'{format}\'')
+        if format == 'json':
+            self.dump_json(node)
+        else:
+            self.dump_text(node)
+
+    def dump_text(self, node: Node) -> None:
+        write = self.file.write
+        write(f'{type(node).__name__}\n')
+        stack = [self.get_children(node)]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                continue
+            label, value = child
+            if not isinstance(label, str):
+                label = f'[{label}]'
+            indent = self.INDENT * len(stack)
+            if isinstance(value, Node):
+                write(f'{indent}{label}: {type(value).__name__}\n')
+                stack.append(self.get_children(value))
+            elif isinstance(value, list) and value:
+                write(f'{indent}{label}:\n')
+                stack.append(self.get_children(value))
+            else:
+                write(f'{indent}{label}: {value!r}\n')
+
+    def dump_json(self, node: Node) -> None:
+        write = self.file.write
+        write(f'{{"node": "{type(node).__name__}"')
+        stack = [(self.get_children(node), '}')]
+        while stack:
+            children, closing = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                write(closing)
+                continue
+            label, value = child
+            if isinstance(label, str):
+                write(f', {json.dumps(label)}: ')
+            elif label:
+                write(', ')
+            if isinstance(value, Node):
+                write(f'{{"node": "{type(value).__name__}"')
+                stack.append((self.get_children(value), '}'))
+            elif isinstance(value, list):
+                write('[')
+                stack.append((self.get_children(value), ']'))
+            else:
+                write(json.dumps(value))
+        write('\n')
@@ -5,6 +5,11 @@ tree_depth = 0
 
 
 class Node(ABC):
+    __slots__ = ()
+
+    def __reduce__(self):
+        return (type(self), tuple(getattr(self, slot) for slot in self.__slots__))
+
     @abstractmethod
     def accept(self, visitor):
         pass
@@ -15,8 +20,11 @@ class Node(ABC):
 
 
 class Identifier(Node):
-    def __init__(self, name: str) -> None:
+    __slots__ = ('name', 'symbol')
+
+    def __init__(self, name: str, symbol: int | None = None) -> None:
         self.name = name
+        self.symbol = symbol
 
     def accept(self, visitor) -> None:
         return visitor.visit_identifier(self)
@@ -26,6 +34,8 @@ class Identifier(Node):
 
 
 class BoolValue(Node):
+    __slots__ = ('value',)
+
     def __init__(self, value: bool) -> None:
         self.value = value
 
@@ -37,6 +47,8 @@ class BoolValue(Node):
 
 
 class IntValue(Node):
+    __slots__ = ('value',)
+
     def __init__(self, value: int) -> None:
         self.value = value
 
@@ -48,6 +60,8 @@ class IntValue(Node):
 
 
 class FloatValue(Node):
+    __slots__ = ('value',)
+
     def __init__(self, value: float) -> None:
         self.value = value
 
@@ -59,6 +73,8 @@ class FloatValue(Node):
 
 
 class StringValue(Node):
+    __slots__ = ('value',)
+
     def __init__(self, value: str) -> None:
         self.value = value
 
@@ -70,6 +86,8 @@ class StringValue(Node):
 
 
 class FunctionType(Node):
+    __slots__ = ('type',)
+
     def __init__(self, type: str) -> None:
         self.type = type
 
@@ -81,6 +99,8 @@ class FunctionType(Node):
 
 
 class VariableType(Node):
+    __slots__ = ('type',)
+
     def __init__(self, type: str) -> None:
         self.type = type
 
@@ -92,6 +112,8 @@ class VariableType(Node):
 
 
 class Parameter(Node):
+    __slots__ = ('type', 'identifier')
+
     def __init__(self, type: VariableType, identifier: Identifier) -> None:
         self.identifier = identifier
         self.type = type
@@ -108,6 +130,8 @@ class Parameter(Node):
 
 
 class AssignmentExpression(Node):
+    __slots__ = ('identifier', 'expression')
+
     def __init__(self, identifier: Identifier, expression) -> None:
         self.identifier = identifier
         self.expression = expression
@@ -127,6 +151,8 @@ class AssignmentExpression(Node):
 
 
 class OrExpression(Node):
+    __slots__ = ('left', 'right')
+
     def __init__(self, left, right) -> None:
         self.left = left
         self.right = right
@@ -146,6 +172,8 @@ class OrExpression(Node):
 
 
 class AndExpression(Node):
+    __slots__ = ('left', 'right')
+
     def __init__(self, left, right) -> None:
         self.left = left
         self.right = right
@@ -165,6 +193,8 @@ class AndExpression(Node):
 
 
 class ComparisonExpression(Node):
+    __slots__ = ('left', 'operator', 'right')
+
     def __init__(self, left, operator: str, right) -> None:
         self.left = left
         self.operator = operator
@@ -186,6 +216,8 @@ class ComparisonExpression(Node):
 
 
 class AdditiveExpression(Node):
+    __slots__ = ('left', 'operator', 'right')
+
     def __init__(self, left, operator: str, right) -> None:
         self.left = left
         self.operator = operator
@@ -207,6 +239,8 @@ class AdditiveExpression(Node):
 
 
 class MultiplicativeExpression(Node):
+    __slots__ = ('left', 'operator', 'right')
+
     def __init__(self, left, operator: str, right) -> None:
         self.left = left
         self.operator = operator
@@ -228,6 +262,8 @@ class MultiplicativeExpression(Node):
 
 
 class NegationExpression(Node):
+    __slots__ = ('operator', 'expression')
+
     def __init__(self, operator, expression) -> None:
         self.operator = operator
         self.expression = expression
@@ -246,6 +282,8 @@ class NegationExpression(Node):
 
 
 class MethodCall(Node):
+    __slots__ = ('name', 'arguments')
+
     def __init__(self, name: Identifier, arguments: list) -> None:
         self.name = name
         self.arguments = arguments
@@ -268,6 +306,8 @@ class MethodCall(Node):
 
 
 class MethodCallExpression(Node):
+    __slots__ = ('caller', 'methods')
+
     def __init__(self, caller: Identifier, methods: list[MethodCall]) -> None:
         self.caller = caller
         self.methods = methods
@@ -287,6 +327,8 @@ class MethodCallExpression(Node):
 
 
 class FunctionCallStatement(Node):
+    __slots__ = ('identifier', 'arguments')
+
     def __init__(self, identifier: Identifier, arguments: list) -> None:
         self.identifier = identifier
         self.arguments = arguments
@@ -309,6 +351,8 @@ class FunctionCallStatement(Node):
 
 
 class Block(Node):
+    __slots__ = ('statements',)
+
     def __init__(self, statements: list) -> None:
         self.statements = statements
 
@@ -329,6 +373,8 @@ class Block(Node):
 
 
 class IfStatement(Node):
+    __slots__ = ('condition', 'block', 'else_block')
+
     def __init__(self, condition, block: Block, else_block=None) -> None:
         self.condition = condition
         self.block = block
@@ -355,6 +401,8 @@ class IfStatement(Node):
 
 
 class WhileStatement(Node):
+    __slots__ = ('condition', 'block')
+
     def __init__(self, condition, block: Block) -> None:
         self.condition = condition
         self.block = block
@@ -375,6 +423,8 @@ class WhileStatement(Node):
 
 
 class DeclarationStatement(Node):
+    __slots__ = ('variable_type', 'identifier', 'expression')
+
     def __init__(self, variable_type: VariableType, identifier: Identifier, expression=None) -> None:
         self.variable_type = variable_type
         self.identifier = identifier
@@ -396,6 +446,8 @@ class DeclarationStatement(Node):
 
 
 class ReturnStatement(Node):
+    __slots__ = ('expression',)
+
     def __init__(self, expression) -> None:
         self.expression = expression
 
@@ -413,6 +465,8 @@ class ReturnStatement(Node):
 
 
 class Function(Node):
+    __slots__ = ('function_type', 'identifier', 'parameters', 'block')
+
     def __init__(self, function_type: FunctionType, identifier: Identifier,
                  parameters: list, block: Block) -> None:
         self.function_type = function_type
@@ -441,8 +495,11 @@ class Function(Node):
 
 
 class Program(Node):
-    def __init__(self, functions: list) -> None:
+    __slots__ = ('functions', 'symbols')
+
+    def __init__(self, functions: list, symbols: list[str] | None = None) -> None:
         self.functions = functions
+        self.symbols = symbols
 
     def accept(self, visitor) -> None:
         return visitor.visit_program(self)
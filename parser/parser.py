@@ -1,21 +1,80 @@
 from lexer.lexer import Lexer
-from lexer.tokens import TokenType, Token
+from lexer.tokens import TokenType, Token, TokenStream
 from errors.errors import InvalidSyntaxError
 import parser.nodes as nodes
 
 
 class Parser:
-    VARIABLE_TOKENS = [TokenType.INT, TokenType.FLOAT, TokenType.BOOL, TokenType.STRING,
-                       TokenType.LIST, TokenType.POINT, TokenType.LINE, TokenType.POLYHEDRON,
-                       TokenType.COLLECTION]
-    COMPLEX_VARIABLE_TOKENS = [TokenType.LIST, TokenType.POINT, TokenType.LINE,
-                               TokenType.POLYHEDRON, TokenType.COLLECTION]
-    COMPARISON_TOKENS = [TokenType.EQ, TokenType.NEQ, TokenType.LE, TokenType.GE,
-                         TokenType.GREATER, TokenType.LESS]
-
-    def __init__(self, lexer: Lexer) -> None:
+    VARIABLE_TOKENS = frozenset([TokenType.INT, TokenType.FLOAT, TokenType.BOOL, TokenType.STRING,
+                                 TokenType.LIST, TokenType.POINT, TokenType.LINE, TokenType.POLYHEDRON,
+                                 TokenType.COLLECTION])
+    COMPLEX_VARIABLE_TOKENS = frozenset([TokenType.LIST, TokenType.POINT, TokenType.LINE,
+                                         TokenType.POLYHEDRON, TokenType.COLLECTION])
+    FUNCTION_TYPE_TOKENS = VARIABLE_TOKENS | {TokenType.VOID}
+    COMPARISON_TOKENS = frozenset([TokenType.EQ, TokenType.NEQ, TokenType.LE, TokenType.GE,
+                                   TokenType.GREATER, TokenType.LESS])
+    ADDITIVE_TOKENS = frozenset([TokenType.PLUS, TokenType.MINUS])
+    MULTIPLICATIVE_TOKENS = frozenset([TokenType.MUL, TokenType.DIV])
+    NEGATION_TOKENS = frozenset([TokenType.NOT, TokenType.MINUS])
+    BINDING_POWERS = {
+        TokenType.OR: 1,
+        TokenType.AND: 2,
+        **{token_type: 3 for token_type in COMPARISON_TOKENS},
+        **{token_type: 4 for token_type in ADDITIVE_TOKENS},
+        **{token_type: 5 for token_type in MULTIPLICATIVE_TOKENS},
+    }
+    BINARY_NODES = {
+        1: nodes.OrExpression,
+        2: nodes.AndExpression,
+        3: nodes.ComparisonExpression,
+        4: nodes.AdditiveExpression,
+        5: nodes.MultiplicativeExpression,
+    }
+    LOGICAL_POWERS = frozenset([1, 2])
+    LITERAL_NODES = {
+        TokenType.INT_VALUE: nodes.IntValue,
+        TokenType.FLOAT_VALUE: nodes.FloatValue,
+        TokenType.STRING_VALUE: nodes.StringValue,
+        TokenType.TRUE: nodes.BoolValue,
+        TokenType.FALSE: nodes.BoolValue,
+    }
+
+    def __init__(self, lexer: Lexer, hash_cons: bool = False) -> None:
         self.lexer = lexer
-        self.current_token = self.lexer.get_next_token()
+        self.shared_nodes = {} if hash_cons else None
+        self.shared_ids = set()
+        self.tokens = TokenStream(lexer.tokens())
+        self.current_token = self.tokens.next()
+        self.statement_parsers = self.build_statement_parsers()
+        self.identifier_statement_parsers = {
+            TokenType.DOT: self.parse_method_call_statement_with_semicolon,
+            TokenType.ASSIGN: self.parse_assignment_statement,
+            TokenType.LPAREN: self.parse_function_call_statement,
+        }
+        self.factor_parsers = self.build_factor_parsers()
+        self.function_spans = []
+        self.positions = {}
+
+    def build_statement_parsers(self) -> dict:
+        parsers = {
+            TokenType.RETURN: self.parse_return_statement,
+            TokenType.IF: self.parse_if_statement,
+            TokenType.WHILE: self.parse_while_statement,
+            TokenType.IDENTIFIER: self.parse_identifier_statement,
+        }
+        for token_type in self.VARIABLE_TOKENS:
+            parsers[token_type] = self.parse_declaration_statement
+        return parsers
+
+    def build_factor_parsers(self) -> dict:
+        parsers = {
+            TokenType.IDENTIFIER: self.parse_identifier_factor,
+        }
+        for token_type in self.LITERAL_NODES:
+            parsers[token_type] = self.parse_literal
+        for token_type in self.COMPLEX_VARIABLE_TOKENS:
+            parsers[token_type] = self.parse_constructor_call
+        return parsers
 
     def get_current_token_type(self) -> TokenType:
         return self.current_token.type
@@ -24,9 +83,7 @@ class Parser:
         return self.current_token.value
 
     def consume(self) -> Token:
-        self.current_token = self.lexer.get_next_token()
-        while self.get_current_token_type() == TokenType.COMMENT:
-            self.current_token = self.lexer.get_next_token()
+        self.current_token = self.tokens.next()
         return self.current_token
 
     def require_token(self, token_type: TokenType) -> bool:
@@ -35,23 +92,47 @@ class Parser:
                                      f"Expected {token_type}, got {self.get_current_token_type()}")
         return True
 
-    def require_tokens(self, token_types: list[TokenType]) -> bool:
+    def require_tokens(self, token_types: frozenset[TokenType]) -> bool:
         if self.get_current_token_type() not in token_types:
+            expected = sorted(token_types, key=lambda token_type: token_type.value)
             raise InvalidSyntaxError(self.current_token.pos[0], self.current_token.pos[1],
-                                     f"Expected one of {token_types}, got {self.get_current_token_type()}")
+                                     f"Expected one of {expected}, got {self.get_current_token_type()}")
         return True
 
     def require_token_and_consume(self, token_type: TokenType) -> None:
         self.require_token(token_type)
         self.consume()
 
+    def build_node(self, node_class: type, *fields) -> nodes.Node:
+        if self.shared_nodes is None:
+            return node_class(*fields)
+        key = [node_class]
+        for field in fields:
+            if isinstance(field, nodes.Node):
+                if id(field) not in self.shared_ids:
+                    return node_class(*fields)
+                key.append(field)
+            else:
+                key.append((type(field), field))
+        key = tuple(key)
+        node = self.shared_nodes.get(key)
+        if node is None:
+            node = self.shared_nodes[key] = node_class(*fields)
+            self.shared_ids.add(id(node))
+        return node
+
     def parse_program(self) -> nodes.Program:
         functions = []
         while self.get_current_token_type() != TokenType.EOF:
             functions.append(self.parse_function())
-        return nodes.Program(functions)
+        if self.shared_nodes is not None:
+            self.shared_nodes.clear()
+            self.shared_ids.clear()
+        return nodes.Program(functions, self.lexer.symbols.names)
 
     def parse_function(self) -> nodes.Function:
+        start = self.current_token.start
+        position = self.current_token.pos
         function_type = self.parse_function_type()
         name = self.parse_identifier()
         self.require_token_and_consume(TokenType.LPAREN)
@@ -61,26 +142,30 @@ class Parser:
         self.require_token_and_consume(TokenType.RPAREN)
         self.require_token_and_consume(TokenType.LBRACE)
         block = self.parse_block()
-        self.require_token_and_consume(TokenType.RBRACE)
-        return nodes.Function(function_type, name, parameters, block)
+        self.require_token(TokenType.RBRACE)
+        self.function_spans.append((start, self.current_token.end))
+        self.consume()
+        function = nodes.Function(function_type, name, parameters, block)
+        self.positions[id(function)] = position
+        return function
 
     def parse_function_type(self) -> nodes.FunctionType:
-        self.require_tokens(self.VARIABLE_TOKENS + [TokenType.VOID])
+        self.require_tokens(self.FUNCTION_TYPE_TOKENS)
         type = self.get_current_token_value()
         self.consume()
-        return nodes.FunctionType(type)
+        return self.build_node(nodes.FunctionType, type)
 
     def parse_variable_type(self) -> nodes.VariableType:
         self.require_tokens(self.VARIABLE_TOKENS)
         type = self.get_current_token_value()
         self.consume()
-        return nodes.VariableType(type)
+        return self.build_node(nodes.VariableType, type)
 
     def parse_identifier(self) -> nodes.Identifier:
         self.require_token(TokenType.IDENTIFIER)
-        identifier = self.get_current_token_value()
+        token = self.current_token
         self.consume()
-        return nodes.Identifier(identifier)
+        return self.build_node(nodes.Identifier, token.value, token.symbol)
 
     def parse_function_parameters(self) -> list[nodes.Parameter]:
         parameters = []
@@ -107,29 +192,28 @@ class Parser:
         return block
 
     def parse_statement(self):
-        if self.get_current_token_type() == TokenType.RETURN:
-            return self.parse_return_statement()
-        elif self.get_current_token_type() == TokenType.IF:
-            return self.parse_if_statement()
-        elif self.get_current_token_type() == TokenType.WHILE:
-            return self.parse_while_statement()
-        elif self.get_current_token_type() in self.VARIABLE_TOKENS:
-            return self.parse_declaration_statement()
-        elif self.get_current_token_type() == TokenType.IDENTIFIER:
-            identifier = self.parse_identifier()
-            if self.get_current_token_type() == TokenType.DOT:
-                method_call = self.parse_method_call_statement(identifier)
-                self.require_token_and_consume(TokenType.SEMI)
-                return method_call
-            elif self.get_current_token_type() == TokenType.ASSIGN:
-                self.require_token_and_consume(TokenType.ASSIGN)
-                expression = self.parse_expression()
-                self.require_token_and_consume(TokenType.SEMI)
-                return nodes.AssignmentExpression(identifier, expression)
-            elif self.get_current_token_type() == TokenType.LPAREN:
-                return self.parse_function_call_statement(identifier)
-        else:
-            return self.parse_expression()
+        position = self.current_token.pos
+        statement = self.statement_parsers.get(self.current_token.type, self.parse_expression)()
+        if statement is not None:
+            self.positions.setdefault(id(statement), position)
+        return statement
+
+    def parse_identifier_statement(self):
+        identifier = self.parse_identifier()
+        parse = self.identifier_statement_parsers.get(self.current_token.type)
+        if parse is not None:
+            return parse(identifier)
+
+    def parse_method_call_statement_with_semicolon(self, identifier: nodes.Identifier):
+        method_call = self.parse_method_call_statement(identifier)
+        self.require_token_and_consume(TokenType.SEMI)
+        return method_call
+
+    def parse_assignment_statement(self, identifier: nodes.Identifier) -> nodes.AssignmentExpression:
+        self.require_token_and_consume(TokenType.ASSIGN)
+        expression = self.parse_expression()
+        self.require_token_and_consume(TokenType.SEMI)
+        return nodes.AssignmentExpression(identifier, expression)
 
     def parse_return_statement(self) -> nodes.ReturnStatement:
         self.require_token_and_consume(TokenType.RETURN)
@@ -202,68 +286,52 @@ class Parser:
         return arguments
 
     def parse_expression(self):
-        return self.parse_or_expression()
-
-    def parse_or_expression(self):
-        left = self.parse_and_expression()
-        while self.get_current_token_type() == TokenType.OR:
+        groups = [([], [], None)]
+        while True:
+            operands, operators, _ = groups[-1]
+            prefix = None
+            if self.current_token.type in self.NEGATION_TOKENS:
+                prefix = self.current_token.value
+                self.consume()
+            if self.current_token.type == TokenType.LPAREN:
+                self.consume()
+                groups.append(([], [], prefix))
+                continue
+            operand = self.parse_method_calls(self.parse_factor())
+            operands.append(self.apply_prefix(prefix, operand))
+            binding_power = self.BINDING_POWERS.get(self.current_token.type)
+            while binding_power is None:
+                self.reduce(operands, operators, 0)
+                if len(groups) == 1:
+                    return operands[0]
+                self.require_token_and_consume(TokenType.RPAREN)
+                _, _, prefix = groups.pop()
+                operand = self.parse_method_calls(operands[0])
+                operands, operators, _ = groups[-1]
+                operands.append(self.apply_prefix(prefix, operand))
+                binding_power = self.BINDING_POWERS.get(self.current_token.type)
+            self.reduce(operands, operators, binding_power)
+            operators.append((binding_power, self.current_token.value))
             self.consume()
-            right = self.parse_and_expression()
-            left = nodes.OrExpression(left, right)
-        return left
 
-    def parse_and_expression(self):
-        left = self.parse_comparison_expression()
-        while self.get_current_token_type() == TokenType.AND:
-            self.consume()
-            right = self.parse_comparison_expression()
-            left = nodes.AndExpression(left, right)
-        return left
-
-    def parse_comparison_expression(self):
-        left = self.parse_additive_expression()
-        while self.get_current_token_type() in self.COMPARISON_TOKENS:
-            operator = self.get_current_token_value()
-            self.consume()
-            right = self.parse_additive_expression()
-            left = nodes.ComparisonExpression(left, operator, right)
-        return left
-
-    def parse_additive_expression(self):
-        left = self.parse_multiplicative_expression()
-        while self.get_current_token_type() in [TokenType.PLUS, TokenType.MINUS]:
-            operator = self.get_current_token_value()
-            self.consume()
-            right = self.parse_multiplicative_expression()
-            left = nodes.AdditiveExpression(left, operator, right)
-        return left
-
-    def parse_multiplicative_expression(self):
-        left = self.parse_negation_expression()
-        while self.get_current_token_type() in [TokenType.MUL, TokenType.DIV]:
-            operator = self.get_current_token_value()
-            self.consume()
-            right = self.parse_negation_expression()
-            left = nodes.MultiplicativeExpression(left, operator, right)
-        return left
-
-    def parse_negation_expression(self):
-        negated = False
-        if (self.get_current_token_type() == TokenType.NOT or
-                self.get_current_token_type() == TokenType.MINUS):
-            operator = self.get_current_token_value()
-            self.consume()
-            negated = True
-        expression = self.parse_method_call_expression()
-        if negated:
-            return nodes.NegationExpression(operator, expression)
-        else:
+    def reduce(self, operands: list, operators: list, binding_power: int) -> None:
+        while operators and operators[-1][0] >= binding_power:
+            operator_power, operator = operators.pop()
+            right = operands.pop()
+            left = operands.pop()
+            if operator_power in self.LOGICAL_POWERS:
+                operands.append(self.build_node(self.BINARY_NODES[operator_power], left, right))
+            else:
+                operands.append(self.build_node(self.BINARY_NODES[operator_power], left, operator, right))
+
+    def apply_prefix(self, prefix: str | None, expression):
+        if prefix is None:
             return expression
+        return self.build_node(nodes.NegationExpression, prefix, expression)
 
-    def parse_method_call_expression(self):
-        expression = self.parse_factor()
+    def parse_method_calls(self, expression):
         method_calls = []
-        while self.get_current_token_type() == TokenType.DOT:
+        while self.current_token.type == TokenType.DOT:
             self.consume()
             identifier = self.parse_identifier()
             self.require_token_and_consume(TokenType.LPAREN)
@@ -278,30 +346,25 @@ class Parser:
             return expression
 
     def parse_factor(self):
-        expression = self.parse_literal()
-        if expression is not None:
-            return expression
-        elif self.get_current_token_type() == TokenType.LPAREN:
-            self.consume()
-            expression = self.parse_expression()
-            self.require_token_and_consume(TokenType.RPAREN)
-            return expression
-        elif self.get_current_token_type() == TokenType.IDENTIFIER:
-            identifier = self.parse_identifier()
-            if self.get_current_token_type() == TokenType.LPAREN:
-                self.consume()
-                return self.parse_function_call_in_expression(identifier)
-            return identifier
-        elif self.get_current_token_type() in self.COMPLEX_VARIABLE_TOKENS:
-            self.require_tokens(self.COMPLEX_VARIABLE_TOKENS)
-            identifier = self.get_current_token_value()
-            self.consume()
-            if self.get_current_token_type() == TokenType.LPAREN:
-                self.consume()
-                return self.parse_function_call_in_expression(identifier)
-        else:
+        parse = self.factor_parsers.get(self.current_token.type)
+        if parse is None:
             raise InvalidSyntaxError(self.current_token.pos[0], self.current_token.pos[1],
                                      "Unrecognized expression")
+        return parse()
+
+    def parse_identifier_factor(self):
+        identifier = self.parse_identifier()
+        if self.current_token.type == TokenType.LPAREN:
+            self.consume()
+            return self.parse_function_call_in_expression(identifier)
+        return identifier
+
+    def parse_constructor_call(self):
+        identifier = self.get_current_token_value()
+        self.consume()
+        if self.current_token.type == TokenType.LPAREN:
+            self.consume()
+            return self.parse_function_call_in_expression(identifier)
 
     def parse_function_call_in_expression(self, identifier: nodes.Identifier):
         arguments = []
@@ -311,25 +374,11 @@ class Parser:
         return nodes.FunctionCallStatement(identifier, arguments)
 
     def parse_literal(self):
-        if self.get_current_token_type() == TokenType.INT_VALUE:
-            value = self.get_current_token_value()
-            self.consume()
-            return nodes.IntValue(value)
-        elif self.get_current_token_type() == TokenType.FLOAT_VALUE:
-            value = self.get_current_token_value()
-            self.consume()
-            return nodes.FloatValue(value)
-        elif self.get_current_token_type() == TokenType.STRING_VALUE:
-            value = self.get_current_token_value()
-            self.consume()
-            return nodes.StringValue(value)
-        elif self.get_current_token_type() in [TokenType.TRUE, TokenType.FALSE]:
-            value = self.get_current_token_value()
-            if value == "True":
-                value = True
-            else:
-                value = False
-            self.consume()
-            return nodes.BoolValue(value)
-        else:
+        node_class = self.LITERAL_NODES.get(self.current_token.type)
+        if node_class is None:
             return None
+        value = self.current_token.value
+        if node_class is nodes.BoolValue:
+            value = self.current_token.type == TokenType.TRUE
+        self.consume()
+        return self.build_node(node_class, value)
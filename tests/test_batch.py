@@ -0,0 +1,23 @@
+from interpreter.cache import ProgramCache
+from interpreter.batch import collect_scripts, run_batch
+
+
+def test_batch_collect_scripts(tmp_path):
+    for name in ['b.txt', 'a.txt', 'c.scene']:
+        (tmp_path / name).write_text('int main() { return 0; }')
+    assert collect_scripts([str(tmp_path)]) == [str(tmp_path / name) for name in ['a.txt', 'b.txt', 'c.scene']]
+    assert collect_scripts([str(tmp_path / '*.txt'), 'x.txt']) == [str(tmp_path / 'a.txt'),
+                                                                    str(tmp_path / 'b.txt'), 'x.txt']
+
+
+def test_batch_report(tmp_path):
+    (tmp_path / 'a.txt').write_text('int main() { print("a"); return 0; }')
+    (tmp_path / 'b.txt').write_text('int main() { print(1); return 7; }')
+    (tmp_path / 'c.txt').write_text('int main() { return x; }')
+    report = run_batch(collect_scripts([str(tmp_path)]), workers=2, cache=False)
+    scripts = report['scripts']
+    assert [script['return_code'] for script in scripts] == [0, 7, 1]
+    assert [script['stdout'] for script in scripts] == ['a\n', '1\n', '']
+    assert scripts[2]['error'].startswith('InvalidReturnTypeError')
+    assert all(script['seconds'] >= 0 for script in scripts)
+    assert not (tmp_path / ProgramCache.DIRECTORY).exists()
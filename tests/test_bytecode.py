@@ -0,0 +1,112 @@
+from interpreter.interpreter import Interpreter
+from interpreter.bytecode import Compiler, Opcode, disassemble
+from interpreter.resolver import Resolver
+from lexer.source import StringSource
+from lexer.lexer import Lexer
+from parser.parser import Parser
+import errors.errors as e
+import pytest
+import io
+
+
+def test_interpreter_unknown_engine():
+    with pytest.raises(ValueError):
+        Interpreter(False, 'int main() { return 0; }', engine='jit')
+
+
+def test_bytecode_compiler_code_objects():
+    code = 'int f(int a) { return a * 2; } int main() { int b = f(3); return b; }'
+    functions = Compiler().compile_program(Parser(Lexer(StringSource(code))).parse_program())
+    assert [function.name for function in functions] == ['f', 'main']
+    assert functions[0].function_type == 'int'
+    assert [parameter[:2] for parameter in functions[0].parameters] == [('a', 'int')]
+    assert functions[0].instructions[-2] == Opcode.RETURN
+    assert ('f', 1) in functions[1].constants and 3 in functions[1].constants
+
+
+def test_bytecode_disassemble():
+    code = 'int main() { int a = 1; while (a < 3) { a = a + 1; } return a; }'
+    output = io.StringIO()
+    disassemble(Compiler().compile_program(Parser(Lexer(StringSource(code))).parse_program())[0], output)
+    lines = output.getvalue().splitlines()
+    assert lines[0] == 'Code int main():'
+    assert lines[-1].split() == [str(2 * (len(lines) - 2)), 'RETURN']
+    assert any(line.split()[1:] == ['BINARY_OP', '17', '(<', 'left)'] for line in lines)
+    assert any(line.split()[1:] == ['STORE_VARIABLE', '2', "('a')"] for line in lines)
+
+
+def test_bytecode_recursion_limit():
+    code = 'int f(int a) { return f(a); } int main() { return f(1); }'
+    with pytest.raises(RecursionError):
+        Interpreter(False, code, engine='bytecode').run()
+
+
+def test_resolver_slots():
+    code = 'int f(int a, int b) { int c = a; if (c > b) { float d; } return c; } int main() { return f(1, 2); }'
+    scopes = Resolver().resolve(Parser(Lexer(StringSource(code))).parse_program())
+    assert [scope.slots for scope in scopes.values()] == [{'a': 0, 'b': 1, 'c': 2, 'd': 3}, {}]
+
+
+def test_resolver_undeclared_variable(capfd):
+    code = 'int main() { print("start"); int a = 1; print(a + b); return 0; }'
+    with pytest.raises(e.UndeclaredVariableError):
+        Interpreter(False, code, resolve=True).run()
+    out, err = capfd.readouterr()
+    assert out == ''
+
+
+def test_resolver_rejects_caller_variables():
+    code = 'int f() { return a + 1; } int main() { int a = 1; return f(); }'
+    assert Interpreter(False, code, engine='visitor').run() == 2
+    with pytest.raises(e.UndeclaredVariableError):
+        Interpreter(False, code, resolve=True).run()
+
+
+def test_resolver_variable_declared_in_skipped_branch():
+    code = 'int main() { if (False) { int a = 1; } int b = a + 1; return b; }'
+    with pytest.raises(e.UndeclaredVariableError):
+        Interpreter(False, code, resolve=True).run()
+
+
+def test_resolver_redefinition():
+    code = 'int main() { int a = 1; while (a < 3) { int b = a; a = a + 1; } return a; }'
+    with pytest.raises(e.RedefinitionError):
+        Interpreter(False, code, resolve=True).run()
+
+
+def test_resolver_recursion(capfd):
+    code = ('int factorial(int n) { if (n < 2) { return 1; } return n * factorial(n - 1); } '
+            'int main() { int a = factorial(6); print(a); return a; }')
+    assert Interpreter(False, code, resolve=True).run() == 720
+    out, err = capfd.readouterr()
+    assert out == '720\n'
+
+
+def test_resolver_type_mismatch():
+    code = 'int main() { int a = 1; a = 2.5; return a; }'
+    with pytest.raises(e.TypeMismatchError):
+        Interpreter(False, code, resolve=True).run()
+
+
+def test_resolver_matches_visitor(capfd):
+    assert Interpreter(True, 'tests/test_cases/fizzbuzz.txt', engine='visitor').run() == 0
+    expected, err = capfd.readouterr()
+    assert Interpreter(True, 'tests/test_cases/fizzbuzz.txt', resolve=True).run() == 0
+    out, err = capfd.readouterr()
+    assert out == expected
+
+
+def test_resolver_disassemble():
+    code = 'int main() { int a = 1; a = a + 1; return a; }'
+    program = Parser(Lexer(StringSource(code))).parse_program()
+    output = io.StringIO()
+    disassemble(Compiler(Resolver().resolve(program)).compile_program(program)[0], output)
+    lines = [line.split()[1:] for line in output.getvalue().splitlines()]
+    assert ['DECLARE_LOCAL', '1', '(int', 'a)'] in lines
+    assert ['LOAD_LOCAL', '0', '(a)'] in lines
+    assert ['STORE_LOCAL', '1', '(a', 'checked)'] in lines
+
+
+def test_resolver_requires_bytecode_engine():
+    with pytest.raises(ValueError):
+        Interpreter(False, 'int main() { return 0; }', engine='closure', resolve=True)
@@ -0,0 +1,66 @@
+from interpreter.interpreter import Interpreter
+from interpreter.cache import ProgramCache
+import parser.nodes as nodes
+import main
+import hashlib
+import io
+import os
+
+
+def test_interpreter_program_cache(tmp_path, capfd):
+    path = tmp_path / 'program.txt'
+    path.write_text('int main() { int a = 2; print(a * 21); return 0; }')
+    cache = ProgramCache.for_file(str(path))
+    assert Interpreter(True, str(path), cache).run() == 0
+    assert capfd.readouterr().out == '42\n'
+    assert len(list((tmp_path / ProgramCache.DIRECTORY).iterdir())) == 1
+    interpreter = Interpreter(True, str(path), cache)
+    interpreter.parser = None
+    assert interpreter.run() == 0
+    assert capfd.readouterr().out == '42\n'
+    path.write_text('int main() { print(1); return 0; }')
+    assert Interpreter(True, str(path), cache).run() == 0
+    assert capfd.readouterr().out == '1\n'
+    assert len(list((tmp_path / ProgramCache.DIRECTORY).iterdir())) == 2
+    cache.clear()
+    assert not (tmp_path / ProgramCache.DIRECTORY).exists()
+
+
+def test_interpreter_program_cache_corrupted_entry(tmp_path):
+    path = tmp_path / 'program.txt'
+    path.write_text('int main() { return 3; }')
+    cache = ProgramCache.for_file(str(path))
+    with open(path, 'rb') as file:
+        key = cache.get_key(file)
+    (tmp_path / ProgramCache.DIRECTORY).mkdir()
+    with open(cache.get_path(key), 'wb') as file:
+        file.write(b'not a pickle')
+    assert Interpreter(True, str(path), cache).run() == 3
+    assert cache.load(key) is not None
+
+
+def test_program_cache_key_read_in_chunks(tmp_path, monkeypatch):
+    data = b'int main() { return 0; }\n' * 10
+    cache = ProgramCache(str(tmp_path))
+    monkeypatch.setattr(ProgramCache, 'CHUNK_SIZE', 7)
+    assert cache.get_key(io.BytesIO(data)) == hashlib.sha256(ProgramCache.get_version() + data).hexdigest()
+    assert cache.get_key(io.BytesIO(data)) != cache.get_key(io.BytesIO(data[:-1]))
+
+
+def test_interpreter_program_cache_too_deep_to_store(tmp_path):
+    path = tmp_path / 'program.txt'
+    path.write_text('int main() { return ' + '1 + (' * 3000 + '1' + ')' * 3000 + '; }')
+    cache = ProgramCache.for_file(str(path))
+    program = Interpreter(True, str(path), cache).parse()
+    assert isinstance(program, nodes.Program)
+    assert os.listdir(tmp_path / ProgramCache.DIRECTORY) == []
+
+
+def test_main_clear_cache_in_current_directory(tmp_path, monkeypatch):
+    current = tmp_path / 'current'
+    (current / ProgramCache.DIRECTORY).mkdir(parents=True)
+    (tmp_path / ProgramCache.DIRECTORY).mkdir()
+    monkeypatch.chdir(current)
+    main.main(['--clear-cache'])
+    assert not (current / ProgramCache.DIRECTORY).exists()
+    assert (tmp_path / ProgramCache.DIRECTORY).exists()
@@ -0,0 +1,109 @@
+from interpreter.interpreter import Interpreter
+from interpreter.bytecode import Compiler, disassemble
+from interpreter.resolver import Resolver
+from interpreter.type_registry import get_type_descriptor
+from interpreter.checker import TypeChecker
+from lexer.source import StringSource
+from lexer.lexer import Lexer
+from parser.parser import Parser
+import errors.errors as e
+import subprocess
+import pytest
+import sys
+import io
+import os
+
+
+def test_type_registry_descriptors():
+    assert get_type_descriptor('int').check(1)
+    assert not get_type_descriptor('int').check(True)
+    assert not get_type_descriptor('float').check(1)
+    assert get_type_descriptor('string').check('text')
+    assert get_type_descriptor('void').check(None)
+    with pytest.raises(e.InvalidTypeError):
+        get_type_descriptor('__import__("os")')
+
+
+def check(code):
+    parser = Parser(Lexer(StringSource(code)))
+    checker = TypeChecker(parser.positions)
+    return checker, checker.check(parser.parse_program())
+
+
+def test_checker_accepts_valid_program():
+    code = ('float half(int a) { return a / 2; } '
+            'int main() { int a = 3; float b = half(a); Point p = Point(1, 2, 3); List l = List(1, 2); '
+            'while (a > 0) { a = a - 1; b = b + half(a); } if (l.length() > 1) { print(p.get_x()); } return a; }')
+    checker, errors = check(code)
+    assert errors == []
+
+
+def test_checker_reports_all_errors_with_positions():
+    code = ('int main() {\n'
+            '    int a = 1;\n'
+            '    a = 2.5;\n'
+            '    if (a) { print(b); }\n'
+            '    Point p = Point(1, 2, "x");\n'
+            '    p.rotate();\n'
+            '    return a;\n'
+            '}\n')
+    checker, errors = check(code)
+    assert [(error.line, error.column) for error in errors] == [(3, 5), (4, 5), (4, 14), (5, 5), (6, 5)]
+    assert 'Variable \'a\' of type \'int\' cannot be assigned \'float\'' in str(errors[0])
+    assert 'Condition must be \'bool\', got \'string\'' in str(errors[1])
+    assert 'Variable \'b\' is not declared' in str(errors[2])
+    assert 'Argument 3 of \'Point\' must be \'number\', got \'string\'' in str(errors[3])
+    assert 'Type \'Point\' has no method \'rotate\'' in str(errors[4])
+
+
+def test_checker_function_calls_and_returns():
+    code = ('int f(int a) { if (a > 0) { return 1; } } int g(float a) { return a; } '
+            'int main() { int a = f(1.5); int b = f(1, 2); return h(a); }')
+    checker, errors = check(code)
+    messages = [str(error) for error in errors]
+    assert any('Function \'f\' does not return \'int\' on every path' in message for message in messages)
+    assert any('Function \'g\' must return \'int\', got \'string\'' in message for message in messages)
+    assert any('Argument 1 of \'f\' must be \'int\', got \'float\'' in message for message in messages)
+    assert any('\'f\' expects 1 arguments, got 2' in message for message in messages)
+    assert any('Function \'h\' is not defined' in message for message in messages)
+
+
+def test_checker_elides_proven_checks():
+    code = ('int f(int a) { return a * 2; } '
+            'int main() { int a = 1; float b = 1.5; while (a < 10) { a = f(a); b = b * 2.0; } return a; }')
+    program = Parser(Lexer(StringSource(code))).parse_program()
+    checker = TypeChecker()
+    assert checker.check(program) == []
+    output = io.StringIO()
+    for code_object in Compiler(Resolver().resolve(program), checker.proven).compile_program(program):
+        assert not code_object.check_return
+        disassemble(code_object, output)
+    assert 'CHECK_CONDITION' not in output.getvalue()
+    assert 'checked' not in output.getvalue()
+    assert Interpreter(False, code, resolve=True).run() == 16
+
+
+def test_checker_keeps_unproven_checks():
+    code = 'int main() { int a = 1; List l = List(1, 2); a = l.get(0); if (l.get(1) == 2) { a = 3; } return a; }'
+    program = Parser(Lexer(StringSource(code))).parse_program()
+    checker = TypeChecker()
+    assert checker.check(program) == []
+    output = io.StringIO()
+    disassemble(Compiler(Resolver().resolve(program), checker.proven).compile_program(program)[0], output)
+    lines = [line.split()[1:] for line in output.getvalue().splitlines()]
+    assert ['STORE_LOCAL', '1', '(a', 'checked)'] in lines
+    assert ['STORE_LOCAL', '0', '(a)'] in lines
+
+
+def test_main_check_does_not_import_geometry(tmp_path):
+    script = ('import sys, main\n'
+              'try:\n'
+              '    main.main(["--check", "-s", "int main() { int a = 1; a = True; return a; }"])\n'
+              'except SystemExit as exit:\n'
+              '    print("exit", exit.code)\n'
+              'print(any(module in sys.modules for module in ("numpy", "scipy", "matplotlib")))\n')
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    lines = result.stdout.splitlines()
+    assert 'Variable \'a\' of type \'int\' cannot be assigned \'bool\'' in lines[1]
+    assert lines[-2:] == ['exit 1', 'False']
@@ -3,6 +3,12 @@ import errors.errors as e
 import pytest
 
 
+@pytest.fixture(autouse=True, params=list(Interpreter.ENGINES))
+def engine(request, monkeypatch):
+    monkeypatch.setattr(Interpreter, 'ENGINE', request.param)
+    return request.param
+
+
 def test_interpreter_no_main():
     code = 'int not_a_main() { return 0; }'
     interpreter = Interpreter(False, code)
@@ -750,3 +756,31 @@ def test_interpreter_multiple_method_call(capfd):
     interpreter.run()
     captured = capfd.readouterr()
     assert captured.out == '0\n'
+
+
+@pytest.mark.parametrize("optimize", [True, False])
+def test_interpreter_optimize(capfd, optimize):
+    code = ('void v() { print("v"); } int main() { int a = 2 * 3; if (a > 5 and True) { print(a); } '
+            'if (False) { print("dead"); } else { v(); } while (False) { print("loop"); } return a - 6; print(1); }')
+    assert Interpreter(False, code, optimize=optimize).run() == 0
+    assert capfd.readouterr().out == '6\nv\n'
+
+
+def test_interpreter_string_assignment(capfd):
+    code = 'int main() { string a = "Hello"; a = "world"; print(a); return 0; }'
+    Interpreter(False, code).run()
+    captured = capfd.readouterr()
+    assert captured.out == "world\n"
+
+
+def test_interpreter_string_assignment_with_wrong_type():
+    code = 'int main() { string a = "Hello"; a = 1; return 0; }'
+    with pytest.raises(e.TypeMismatchError):
+        Interpreter(False, code).run()
+
+
+def test_interpreter_complex_type_parameter(capfd):
+    code = 'void show(Point p) { print(p); } int main() { Point q = Point(1, 2, 3); show(q); return 0; }'
+    Interpreter(False, code).run()
+    captured = capfd.readouterr()
+    assert captured.out == "Point(1, 2, 3)\n"
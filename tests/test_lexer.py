@@ -1,8 +1,14 @@
 from lexer.lexer import Lexer, TokenType
-from lexer.source import StringSource, FileSource
+from lexer.tokens import TokenStream, SymbolTable
+from lexer.incremental import IncrementalLexer
+from lexer.parallel import ParallelLexer
+from lexer.source import StringSource, FileSource, MappedFileSource, create_file_source
 from errors.errors import InvalidTokenError, ExceedsMaxLengthError
 import pytest
 import re
+import sys
+import io
+import gc
 
 
 def test_source_create():
@@ -45,6 +51,61 @@ def test_source_get_line():
     assert source.get_line(3) == ""
 
 
+def test_source_small_blocks():
+    source = StringSource("ab\ncd", block_size=2)
+    chars = [source.get_current_char()]
+    while source.get_next_char() != '':
+        chars.append(source.get_current_char())
+    assert ''.join(chars) == "ab\ncd"
+    assert source.get_position() == (2, 2)
+
+
+def test_source_seek_next_across_blocks():
+    source = StringSource("abc", block_size=1)
+    assert source.seek_next() == 'b'
+    assert source.get_current_char() == 'a'
+    source.get_next_char()
+    assert source.get_current_char() == 'b'
+    assert source.seek_next() == 'c'
+
+
+def test_lexer_small_blocks_same_tokens():
+    code = 'int main() { string a = "some text"; # comment\n return 12.5 >= 3; }'
+    tokens = Lexer(StringSource(code)).get_all_tokens()
+    block_tokens = Lexer(StringSource(code, block_size=3)).get_all_tokens()
+    assert [(t.type, t.value, t.pos) for t in tokens] == [(t.type, t.value, t.pos) for t in block_tokens]
+
+
+def test_source_get_line_small_blocks():
+    lines = [f"int a{i} = {i};\n" for i in range(100)]
+    source = StringSource(''.join(lines), block_size=8)
+    assert source.get_line(100) == lines[99]
+    assert source.get_line(1) == lines[0]
+    for _ in range(500):
+        source.get_next_char()
+    assert source.get_line(50) == lines[49]
+    assert source.get_line(101) == ""
+    assert source.get_current_char() == ''.join(lines)[500]
+
+
+def test_source_get_offset():
+    code = "int a;\n  float b;\n"
+    source = StringSource(code, block_size=4)
+    while source.get_current_char() != 'f':
+        source.get_next_char()
+    assert source.get_offset() == code.index('f')
+    assert source.get_offset(source.get_position()) == code.index('f')
+    assert source.get_offset((0, 2)) == code.index('\n')
+
+
+def test_file_source_get_line():
+    source = FileSource("tests/test_cases/fizzbuzz.txt", block_size=16)
+    with open("tests/test_cases/fizzbuzz.txt") as file:
+        lines = file.readlines()
+    for number in [len(lines), 1, 20, 3]:
+        assert source.get_line(number) == lines[number - 1]
+
+
 def test_lexer_skip_spaces():
     lexer = Lexer(StringSource("              a"))
     token = lexer.get_next_token()
@@ -427,3 +488,212 @@ def test_lexer_file_source_simple_code():
         TokenType.RBRACE,
         TokenType.EOF
     ]
+
+
+def test_mapped_file_source_same_tokens():
+    for name in ['all_tokens', 'simple_code', 'complex_code', 'fizzbuzz', 'empty_file']:
+        path = f'tests/test_cases/{name}.txt'
+        tokens = Lexer(FileSource(path)).get_all_tokens()
+        mapped_tokens = Lexer(MappedFileSource(path, block_size=7)).get_all_tokens()
+        assert [(t.type, t.value, t.pos) for t in tokens] == [(t.type, t.value, t.pos) for t in mapped_tokens]
+
+
+def test_mapped_file_source_multibyte_chars(tmp_path):
+    path = tmp_path / 'code.txt'
+    path.write_bytes('string a = "zażółć gęślą jaźń";\r\nint b = 1;'.encode('utf-8'))
+    source = MappedFileSource(str(path), block_size=2)
+    chars = [source.get_current_char()]
+    while source.get_next_char() != '':
+        chars.append(source.get_current_char())
+    assert ''.join(chars) == 'string a = "zażółć gęślą jaźń";\nint b = 1;'
+    assert source.get_line(2) == 'int b = 1;'
+
+
+def test_create_file_source_threshold(tmp_path, monkeypatch):
+    path = tmp_path / 'code.txt'
+    path.write_text('int main() { return 0; }')
+    assert type(create_file_source(str(path))) is FileSource
+    monkeypatch.setattr(MappedFileSource, 'THRESHOLD', 10)
+    assert type(create_file_source(str(path))) is MappedFileSource
+
+
+def test_create_file_source_keeps_stdin_open(monkeypatch):
+    stdin = io.StringIO('int main() { return 0; }')
+    monkeypatch.setattr(sys, 'stdin', stdin)
+    source = create_file_source('-')
+    assert len(Lexer(source).get_all_tokens()) == 10
+    del source
+    gc.collect()
+    assert not stdin.closed
+
+
+def lex_with_engine(source, engine):
+    try:
+        return [(t.type, t.value, t.pos) for t in Lexer(source, engine=engine).get_all_tokens()]
+    except Exception as error:
+        return (type(error), str(error))
+
+
+def test_lexer_engines_same_tokens_on_test_cases():
+    for name in ['all_tokens', 'simple_code', 'simple_code_2', 'complex_code', 'fizzbuzz', 'figures', 'empty_file']:
+        path = f'tests/test_cases/{name}.txt'
+        assert lex_with_engine(FileSource(path), 'table') == lex_with_engine(FileSource(path), 'chain')
+
+
+def test_lexer_engines_same_errors():
+    for code in ['a = $;', '"not closed', '"a\\qb"', '12345678901234567', '1.23456789012345678',
+                 'zażółć = 1²;', '!= ! <= < >= > == =', '"\\n\\t\\\\"', 'x' * 100002]:
+        assert lex_with_engine(StringSource(code), 'table') == lex_with_engine(StringSource(code), 'chain')
+
+
+def test_lexer_unknown_engine():
+    with pytest.raises(ValueError):
+        Lexer(StringSource(''), engine='regex')
+
+
+def test_token_packed_position():
+    token = Lexer(StringSource("\n\n   abc")).get_next_token()
+    assert token.pos == (4, 3)
+    assert not hasattr(token, '__dict__')
+
+
+def test_lexer_token_buffer():
+    code = 'int a = 1;\nstring b = "c";'
+    tokens = Lexer(StringSource(code)).get_all_tokens()
+    buffer = Lexer(StringSource(code)).get_token_buffer()
+    assert len(buffer) == len(tokens)
+    assert [(t.type, t.value, t.pos, t.start, t.end, t.symbol) for t in buffer] == \
+        [(t.type, t.value, t.pos, t.start, t.end, t.symbol) for t in tokens]
+    assert buffer[1].symbol is not None and buffer[3].symbol is None
+    assert Lexer(StringSource(code)).get_lexeme(buffer[5]) == 'string'
+    assert buffer.offsets[1] == code.index('a')
+    assert buffer.offsets[5] == code.index('string')
+    assert buffer.offsets[-1] == len(code)
+
+
+def test_lexer_token_spans():
+    code = 'string s = "a\\tb";  # note\nfloat f = 12.5;'
+    lexer = Lexer(StringSource(code, block_size=4))
+    tokens = lexer.get_all_tokens()
+    assert [code[t.start:t.end] for t in tokens] == [
+        'string', 's', '=', '"a\\tb"', ';', '# note', 'float', 'f', '=', '12.5', ';', '']
+    assert [lexer.get_lexeme(t) for t in tokens] == [code[t.start:t.end] for t in tokens]
+    assert tokens[3].value == 'a\tb'
+
+
+def test_lexer_long_string_across_blocks():
+    value = 'x\\n' * 40000
+    tokens = Lexer(StringSource(f'"{value}" a', block_size=1000)).get_all_tokens()
+    assert tokens[0].value == 'x\n' * 40000
+    assert tokens[1].pos == (len(value) + 4, 1)
+
+
+def test_lexer_tokens_skip_comments():
+    lexer = Lexer(StringSource("# first\na # second\nb"))
+    tokens = lexer.tokens()
+    assert next(tokens).value == "a"
+    assert next(tokens).value == "b"
+    assert next(tokens).type == TokenType.EOF
+    assert next(tokens).type == TokenType.EOF
+
+
+def test_token_stream_peek():
+    stream = TokenStream(Lexer(StringSource("a b c d")).tokens(), lookahead=2)
+    assert stream.peek().value == "a"
+    assert stream.peek(2).value == "c"
+    assert stream.next().value == "a"
+    assert stream.peek(2).value == "d"
+    assert [stream.next().value for _ in range(4)] == ["b", "c", "d", None]
+    with pytest.raises(IndexError):
+        stream.peek(3)
+
+
+@pytest.mark.parametrize("engine", Lexer.ENGINES)
+def test_lexer_interns_identifiers(engine):
+    symbols = SymbolTable()
+    tokens = Lexer(StringSource("int abc = abc + while_x; while"), engine, symbols).get_all_tokens()
+    assert tokens[1].value is tokens[3].value
+    assert tokens[1].symbol == tokens[3].symbol
+    assert tokens[5].symbol != tokens[1].symbol
+    assert tokens[0].type == TokenType.INT
+    assert tokens[7].type == TokenType.WHILE
+    assert tokens[0].symbol == symbols.entries["int"][1]
+    assert symbols.names[tokens[5].symbol] == "while_x"
+
+
+def test_symbol_table_shared_between_lexers():
+    symbols = SymbolTable()
+    first = Lexer(StringSource("alpha"), symbols=symbols).get_all_tokens()[0]
+    second = Lexer(StringSource("beta alpha"), symbols=symbols).get_all_tokens()[1]
+    assert first.symbol == second.symbol
+    assert len(symbols) == len(SymbolTable()) + 2
+
+
+def token_fields(tokens):
+    return [(t.type, t.value, t.pos, t.start, t.end) for t in tokens]
+
+
+@pytest.mark.parametrize("offset, deleted, inserted", [
+    (0, 0, "int x = 1;\n"),
+    (12, 0, "bc"),
+    (8, 3, ""),
+    (18, 1, "\n\n"),
+    (22, 0, "\"q\" "),
+    (4, 0, "# comment "),
+    (35, 0, " 2.5"),
+])
+def test_incremental_lexer_matches_full_lex(offset, deleted, inserted):
+    code = 'int main() { int a = 10;\n  string s = "x y";\n  return a; }\n'
+    lexer = IncrementalLexer(code)
+    tokens = lexer.apply_edit(offset, deleted, inserted)
+    edited = code[:offset] + inserted + code[offset + deleted:]
+    assert lexer.text == edited
+    assert token_fields(tokens) == token_fields(Lexer(StringSource(edited)).get_all_tokens())
+
+
+def test_incremental_lexer_sequence_of_edits():
+    with open("tests/test_cases/complex_code.txt") as file:
+        code = file.read()
+    lexer = IncrementalLexer(code, engine='chain')
+    for offset in range(0, len(code), len(code) // 7):
+        code = code[:offset] + "q" + code[offset + 1:]
+        tokens = lexer.apply_edit(offset, 1, "q")
+        assert token_fields(tokens) == token_fields(Lexer(StringSource(code)).get_all_tokens())
+
+
+def test_incremental_lexer_error():
+    lexer = IncrementalLexer("int a = 1;\nint b = 2;")
+    with pytest.raises(InvalidTokenError) as error:
+        lexer.apply_edit(15, 0, "$")
+    assert "line 2, column 5" in str(error.value)
+    assert lexer.text == "int a = 1;\nint b = 2;"
+
+
+def test_parallel_lexer_boundaries_skip_strings_and_comments():
+    code = 'int a = 1;\nstring s = "x\ny\nz";\n# c "\nint b = 2;\n'
+    boundaries = ParallelLexer(code, chunk_size=1).find_boundaries()
+    assert boundaries == [0, 11, 31, 37]
+
+
+@pytest.mark.parametrize("engine", Lexer.ENGINES)
+def test_parallel_lexer_matches_serial(engine):
+    with open("tests/test_cases/complex_code.txt") as file:
+        code = file.read() * 5
+    tokens = ParallelLexer(code, workers=2, chunk_size=200, engine=engine).get_all_tokens()
+    expected = Lexer(StringSource(code), engine).get_all_tokens()
+    assert [(t.type, t.value, t.pos, t.start, t.end, t.symbol) for t in tokens] == \
+        [(t.type, t.value, t.pos, t.start, t.end, t.symbol) for t in expected]
+
+
+def test_parallel_lexer_error():
+    code = 'int a = 1;\n' * 50 + 'int $b = 2;\n' + 'int c = 3;\n' * 50
+    with pytest.raises(InvalidTokenError, match='line 51, column 5'):
+        ParallelLexer(code, workers=2, chunk_size=100).get_all_tokens()
+
+
+def test_parallel_lexer_reports_first_error():
+    code = 'int main() { $ }\n' + 'x;\n' * 50 + 'string s = "\\{";\n'
+    with pytest.raises(InvalidTokenError, match='line 1, column 14'):
+        Lexer(StringSource(code)).get_all_tokens()
+    with pytest.raises(InvalidTokenError, match='line 1, column 14'):
+        ParallelLexer(code, workers=2, chunk_size=64).get_all_tokens()
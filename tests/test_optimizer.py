@@ -0,0 +1,45 @@
+from interpreter.optimizer import Optimizer
+from lexer.source import StringSource
+from lexer.lexer import Lexer
+from parser.parser import Parser
+import parser.nodes as nodes
+
+
+def optimize_main(code):
+    program = Parser(Lexer(StringSource(f'int main() {{ {code} }}'))).parse_program()
+    return Optimizer().optimize(program).functions[0].block.statements
+
+
+def test_optimizer_folds_constants():
+    statements = optimize_main('int a = 2 * 3 + 1; bool b = !(1 < 2) or True; float c = -(1.5); return a;')
+    assert repr(statements[0].expression) == repr(nodes.IntValue(7))
+    assert repr(statements[1].expression) == repr(nodes.BoolValue(True))
+    assert repr(statements[2].expression) == repr(nodes.FloatValue(-1.5))
+
+
+def test_optimizer_keeps_non_constant_expressions():
+    statements = optimize_main('int a = 1; int b = a + 2 * 3; int c = 1 / 0; string d = "x" + "y"; return b;')
+    assert isinstance(statements[1].expression, nodes.AdditiveExpression)
+    assert repr(statements[1].expression.right) == repr(nodes.IntValue(6))
+    assert isinstance(statements[2].expression, nodes.MultiplicativeExpression)
+    assert isinstance(statements[3].expression, nodes.AdditiveExpression)
+
+
+def test_optimizer_removes_dead_branches():
+    statements = optimize_main('if (1 > 2) { print(1); } if (True) { print(2); } else { print(3); } '
+                               'while (False) { print(4); } return 0;')
+    assert len(statements) == 2
+    assert isinstance(statements[0], nodes.Block)
+    assert isinstance(statements[1], nodes.ReturnStatement)
+
+
+def test_optimizer_removes_code_after_return():
+    assert len(optimize_main('return 0; print(1);')) == 1
+    assert len(optimize_main('return v(); print(1);')) == 2
+
+
+def test_optimizer_does_not_modify_program():
+    program = Parser(Lexer(StringSource('int main() { if (False) { print(1); } return 1 + 2; }'))).parse_program()
+    expected = repr(program)
+    Optimizer().optimize(program)
+    assert repr(program) == expected
@@ -1,9 +1,14 @@
 from lexer.lexer import Lexer
 from errors.errors import InvalidSyntaxError
-from lexer.source import StringSource, FileSource
+from lexer.source import Source, StringSource, FileSource
+from interpreter.visitor import Visitor
 from parser.parser import Parser
+from parser.dump import TreeDumper
 import parser.nodes as nodes
 import pytest
+import json
+import io
+import os
 
 
 def test_parser_file_source_empty_file():
@@ -360,3 +365,161 @@ def test_parser_complex_code():
     parser = Parser(lexer)
     program = parser.parse_program()
     assert len(program.functions) == 2
+
+
+def test_parser_leading_comment():
+    source = StringSource('# comment\nint main() { return 7; }')
+    lexer = Lexer(source)
+    parser = Parser(lexer)
+    program = parser.parse_program()
+    assert len(program.functions) == 1
+
+
+def test_parser_not_seekable_source():
+    read_end, write_end = os.pipe()
+    with os.fdopen(write_end, 'w') as stream:
+        stream.write('int main() { # comment\n return 7; }')
+    source = Source(os.fdopen(read_end, 'r'), block_size=4)
+    assert not source.seekable
+    parser = Parser(Lexer(source))
+    program = parser.parse_program()
+    assert program.functions[0].block.statements[0].expression.value == 7
+
+
+def test_parser_identifier_symbols():
+    lexer = Lexer(StringSource('int main() { int a = 1; a = a + 1; return a; }'))
+    program = Parser(lexer).parse_program()
+    statements = program.functions[0].block.statements
+    symbol = statements[0].identifier.symbol
+    assert symbol is not None
+    assert statements[1].identifier.symbol == symbol
+    assert program.symbols[symbol] == 'a'
+
+
+def test_parser_expected_tokens_message():
+    parser = Parser(Lexer(StringSource('main() { return 0; }')))
+    with pytest.raises(InvalidSyntaxError) as error:
+        parser.parse_program()
+    assert "Expected one of [<TokenType.INT: 1>, <TokenType.FLOAT: 2>" in str(error.value)
+    assert "<TokenType.VOID: 17>], got TokenType.IDENTIFIER" in str(error.value)
+
+
+def test_parser_operator_precedence():
+    code = 'int main() { return a or b and c < d + e * -f.g(); }'
+    expression = Parser(Lexer(StringSource(code))).parse_program().functions[0].block.statements[0].expression
+    assert isinstance(expression, nodes.OrExpression)
+    assert isinstance(expression.right, nodes.AndExpression)
+    comparison = expression.right.right
+    assert isinstance(comparison, nodes.ComparisonExpression) and comparison.operator == '<'
+    assert isinstance(comparison.right, nodes.AdditiveExpression)
+    multiplication = comparison.right.right
+    assert isinstance(multiplication, nodes.MultiplicativeExpression)
+    assert isinstance(multiplication.right, nodes.NegationExpression)
+    assert isinstance(multiplication.right.expression, nodes.MethodCallExpression)
+
+
+def test_parser_left_associative_operators():
+    code = 'int main() { return 8 - 4 - (2 - 1); }'
+    expression = Parser(Lexer(StringSource(code))).parse_program().functions[0].block.statements[0].expression
+    assert expression.right.left.value == 2
+    assert expression.left.left.value == 8
+    assert expression.left.right.value == 4
+
+
+def test_parser_deeply_nested_parentheses():
+    depth = 5000
+    code = 'int main() { return ' + '-(' * depth + '1' + ')' * depth + '; }'
+    expression = Parser(Lexer(StringSource(code))).parse_program().functions[0].block.statements[0].expression
+    for _ in range(depth):
+        assert isinstance(expression, nodes.NegationExpression)
+        expression = expression.expression
+    assert expression.value == 1
+
+
+def test_parser_unclosed_parenthesis():
+    with pytest.raises(InvalidSyntaxError):
+        Parser(Lexer(StringSource('int main() { return ((1 + 2); }'))).parse_program()
+
+
+def test_nodes_have_no_instance_dict():
+    with open("tests/test_cases/complex_code.txt") as file:
+        program = Parser(Lexer(StringSource(file.read()))).parse_program()
+    node = program.functions[1].block.statements[3]
+    assert not hasattr(node, '__dict__')
+    assert not hasattr(node.condition, '__dict__')
+    with pytest.raises(AttributeError):
+        node.extra = 1
+
+
+def test_parser_hash_cons_shares_identical_subtrees():
+    code = 'int main() { int a = 1; float x = a * 2 + 1.0; float y = a * 2 + 1.0; return a * 2; }'
+    program = Parser(Lexer(StringSource(code)), hash_cons=True).parse_program()
+    statements = program.functions[0].block.statements
+    assert statements[1].expression is statements[2].expression
+    assert statements[3].expression is statements[1].expression.left
+    assert statements[0].identifier is statements[1].expression.left.left
+    assert statements[1].variable_type is statements[2].variable_type
+
+
+def test_parser_hash_cons_keeps_literal_types_apart():
+    code = 'int main() { print(1); print(1.0); print(True); return 1; }'
+    program = Parser(Lexer(StringSource(code)), hash_cons=True).parse_program()
+    statements = program.functions[0].block.statements
+    values = [statement.arguments[0] for statement in statements[:3]]
+    assert [type(value) for value in values] == [nodes.IntValue, nodes.FloatValue, nodes.BoolValue]
+    assert statements[3].expression is values[0]
+
+
+def test_parser_hash_cons_same_result(capfd):
+    with open("tests/test_cases/fizzbuzz.txt") as file:
+        code = file.read()
+    results = []
+    for hash_cons in [False, True]:
+        program = Parser(Lexer(StringSource(code)), hash_cons=hash_cons).parse_program()
+        results.append((program.accept(Visitor()), capfd.readouterr().out))
+    assert results[0] == results[1]
+
+
+def test_parser_dump_text():
+    program = Parser(Lexer(StringSource('int main() { return -a * 2; }'))).parse_program()
+    output = io.StringIO()
+    TreeDumper(output).dump(program)
+    assert output.getvalue().splitlines()[-9:] == [
+        "          [0]: ReturnStatement",
+        "            expression: MultiplicativeExpression",
+        "              left: NegationExpression",
+        "                operator: '-'",
+        "                expression: Identifier",
+        "                  name: 'a'",
+        "              operator: '*'",
+        "              right: IntValue",
+        "                value: 2",
+    ]
+
+
+def test_parser_dump_json():
+    with open("tests/test_cases/fizzbuzz.txt") as file:
+        program = Parser(Lexer(StringSource(file.read()))).parse_program()
+    output = io.StringIO()
+    TreeDumper(output).dump(program, 'json')
+    tree = json.loads(output.getvalue())
+    assert tree['node'] == 'Program'
+    assert [function['identifier']['name'] for function in tree['functions']] == \
+        [function.identifier.name for function in program.functions]
+
+
+def test_parser_dump_deep_tree():
+    block = nodes.Block([nodes.ReturnStatement(nodes.IntValue(1))])
+    for _ in range(1500):
+        block = nodes.Block([nodes.WhileStatement(nodes.BoolValue(True), block)])
+    with pytest.raises(RecursionError):
+        repr(block)
+    for format in TreeDumper.FORMATS:
+        output = io.StringIO()
+        TreeDumper(output).dump(block, format)
+        assert output.getvalue().count('WhileStatement') == 1500
+
+
+def test_parser_dump_unknown_format():
+    with pytest.raises(ValueError):
+        TreeDumper(io.StringIO()).dump(nodes.IntValue(1), 'xml')
@@ -0,0 +1,45 @@
+from interpreter.watch import ProgramWatcher
+from interpreter.visitor import Visitor
+from lexer.source import StringSource
+from lexer.lexer import Lexer
+from parser.parser import Parser
+import pytest
+
+
+def test_program_watcher_reparses_changed_function(tmp_path, capfd):
+    path = tmp_path / 'program.txt'
+    code = 'int f() { return 1; }\n# helper\nint g() { return 2; }\nint main() { print(f() + g()); return 0; }\n'
+    path.write_text(code)
+    watcher = ProgramWatcher(str(path))
+    first = watcher.load()
+    assert watcher.reparsed == 3
+    path.write_text(code.replace('return 2;', 'return 40;'))
+    second = watcher.load()
+    assert watcher.reparsed == 1
+    assert second.functions[0] is first.functions[0]
+    assert second.functions[2] is first.functions[2]
+    assert second.functions[1] is not first.functions[1]
+    assert second.accept(Visitor()) == 0
+    assert capfd.readouterr().out == '41\n'
+
+
+@pytest.mark.parametrize("old, new", [
+    ('# helper\n', '# helper '),
+    ('}\n# helper', '}\nint h() { return 3; }\n# helper'),
+    ('int g()', 'xint g()'),
+    ('return 2;', 'return "2;'),
+])
+def test_program_watcher_matches_full_parse(tmp_path, old, new):
+    path = tmp_path / 'program.txt'
+    code = 'int f() { return 1; }\n# helper\nint g() { return 2; }\nint main() { return 0; }\n'
+    path.write_text(code)
+    watcher = ProgramWatcher(str(path))
+    watcher.load()
+    path.write_text(code.replace(old, new))
+    try:
+        expected = repr(Parser(Lexer(StringSource(code.replace(old, new)))).parse_program())
+    except Exception as error:
+        with pytest.raises(type(error)):
+            watcher.load()
+    else:
+        assert repr(watcher.load()) == expected